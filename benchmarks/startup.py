@@ -0,0 +1,52 @@
+"""
+Import time and registry build benchmark.
+
+Run with `python benchmarks/startup.py` or `nox -s benchmarks`.
+"""
+
+import subprocess
+import sys
+from dataclasses import make_dataclass
+from timeit import timeit
+
+from panamap import Mapper
+
+PAIRS_COUNT = 500
+FIELDS_COUNT = 10
+REPEAT = 5
+
+
+def measure_import() -> float:
+    script = "import time; s = time.perf_counter(); import panamap; print(time.perf_counter() - s)"
+    runs = [float(subprocess.check_output([sys.executable, "-c", script])) for _ in range(REPEAT)]
+    return min(runs)
+
+
+def make_pairs():
+    fields = [(f"field_{i}", int) for i in range(FIELDS_COUNT)]
+    return [(make_dataclass(f"A{i}", fields), make_dataclass(f"B{i}", fields)) for i in range(PAIRS_COUNT)]
+
+
+def build_registry(pairs, deferred: bool) -> Mapper:
+    mapper = Mapper(deferred=deferred)
+    for a, b in pairs:
+        mapper.mapping(a, b).map_matching().register()
+    return mapper
+
+
+def main():
+    pairs = make_pairs()
+    print(f"import panamap: {measure_import() * 1000:.1f} ms")
+    for deferred in (False, True):
+        seconds = timeit(lambda: build_registry(pairs, deferred), number=REPEAT) / REPEAT
+        print(f"build registry of {PAIRS_COUNT} pairs, deferred={deferred}: {seconds * 1000:.1f} ms")
+
+    mapper = build_registry(pairs, deferred=True)
+    a, b = pairs[0]
+    obj = a(*range(FIELDS_COUNT))
+    seconds = timeit(lambda: mapper.map(obj, b), number=1)
+    print(f"first deferred mapping: {seconds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ LINE_LENGTH = 120
 STYLE_TARGETS = [
     "panamap",
     "tests",
+    "benchmarks",
     "noxfile.py",
     "setup.py",
 ]
@@ -25,6 +26,12 @@ def unit_tests(session):
     session.run("coverage", "run", "--source", "panamap", "-m", "pytest", "tests")
 
 
+@nox.session
+def benchmarks(session):
+    session.install(".")
+    session.run("python", "benchmarks/startup.py")
+
+
 @nox.session
 def style(session):
     session.install("flake8", "black", "isort")
@@ -1,4 +1,3 @@
-import pkg_resources
 from panamap.panamap import (  # noqa: F401
     Mapper,
     MappingException,
@@ -8,7 +7,20 @@ from panamap.panamap import (  # noqa: F401
     UnsupportedFieldException,
     FieldMappingException,
     DuplicateMappingException,
+    MappingValidationException,
+    MappingLimits,
+    MappingLimitExceededException,
 )
 from panamap.tools import values_map  # noqa: F401
 
-__version__ = pkg_resources.resource_string(__name__, "panamap.version").decode("utf-8").strip()
+
+def __getattr__(name):
+    # Version is read on first access to keep import fast
+    if name == "__version__":
+        from os import path
+
+        with open(path.join(path.dirname(__file__), "panamap.version"), encoding="utf-8") as f:
+            version = f.read().strip()
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
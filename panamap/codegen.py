@@ -0,0 +1,386 @@
+"""
+Generation of plain python module from mappings registered in Mapper.
+
+Generated module contains one function per registered pair and `map_object(obj, to_type, context)` entry point.
+It imports mapped classes and converters by their qualified names and doesn't build Mapper at runtime.
+Lambdas and other local converters cannot be imported, converters from enums are stored as lookup tables.
+Like in Mapper, mapping registered for the nearest base class of value is used if its class has no own mapping.
+"""
+
+from enum import Enum
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from typing_inspect import get_args, get_origin, is_union_type
+
+from panamap.panamap import Mapper, MappingException, MappingExceptionInfo, MappingValidationException
+
+LITERAL_TYPES = (bool, int, float, str, bytes, type(None))
+
+RUNTIME_HELPERS = """
+def _find_function(table, cls):
+    for source in cls.__mro__:
+        function = table.get(source)
+        if function is not None:
+            return function
+    return None
+
+
+def _fallback(value, to_types):
+    for to_type in to_types:
+        for source in value.__class__.__mro__:
+            if source is int and isinstance(value, bool):
+                break
+            converter = _PRIMITIVES.get((source, to_type))
+            if converter is not None:
+                return converter(value)
+    if isinstance(value, to_types):
+        return _deepcopy(value)
+    raise TypeError(f"Cannot map value of type '{value.__class__.__name__}' to {to_types}")
+
+
+def _lookup(table, value):
+    try:
+        return table[value]
+    except KeyError:
+        raise ValueError(f"Value {value} is missing in value map.") from None
+
+
+def map_object(obj, to_type, context=None):
+    for source in obj.__class__.__mro__:
+        function = _PAIRS.get((source, to_type))
+        if function is not None:
+            return function(obj, {} if context is None else context)
+    raise KeyError((obj.__class__, to_type))
+"""
+
+
+class SourceGenerator:
+    def __init__(self, mapper: Mapper):
+        self.mapper = mapper
+        self.modules: Dict[str, str] = {}
+        self.constants: List[str] = []
+        self.functions: List[str] = []
+        self.function_names: Dict[Tuple[Type[Any], Type[Any]], str] = {}
+        self.used_names: Dict[str, int] = {}
+        self.dispatchers: Dict[Any, str] = {}
+        self.dispatch_tables: List[str] = []
+        self.errors: List[str] = []
+        self.variables_count = 0
+
+    def generate(self) -> str:
+        self.mapper.warm_up()
+
+        for a, a_type_mappings in self.mapper.map_rules.items():
+            for b in a_type_mappings:
+                self.function_names[(a, b)] = self._unique_name(f"map_{self._name(a)}_to_{self._name(b)}")
+        for a, a_type_converters in self.mapper.converters.items():
+            for b in a_type_converters:
+                self.function_names[(a, b)] = self._unique_name(f"convert_{self._name(a)}_to_{self._name(b)}")
+
+        for a, a_type_mappings in self.mapper.map_rules.items():
+            for b in a_type_mappings:
+                self._generate_map_rules_function(a, b)
+        for a, a_type_converters in self.mapper.converters.items():
+            for b, converter in a_type_converters.items():
+                self._generate_converter_function(a, b, converter)
+
+        pairs = []
+        for (a, b), name in self.function_names.items():
+            pairs.append(f"    ({self._reference(a)}, {self._reference(b)}): {name},")
+        primitives = []
+        for (a, b), converter in self.mapper.primitive_converters.items():
+            converter_reference = self._reference(converter, required=False)
+            if converter_reference is not None:
+                primitives.append(f"    ({self._reference(a)}, {self._reference(b)}): {converter_reference},")
+
+        if self.errors:
+            raise MappingValidationException(list(dict.fromkeys(self.errors)))
+
+        lines = ['"""', "Generated by panamap from registered mappings. Do not edit.", '"""']
+        lines.append("from copy import deepcopy as _deepcopy")
+        lines.extend(f"import {module} as {alias}" for module, alias in self.modules.items())
+        lines.append("")
+        lines.extend(self.constants)
+        lines.append("")
+        lines.append("_PRIMITIVES = {")
+        lines.extend(primitives)
+        lines.append("}")
+        for function in self.functions:
+            lines.extend(["", "", function])
+        if self.dispatch_tables:
+            # Dispatch tables reference generated functions, so they follow them
+            lines.extend(["", "", *self.dispatch_tables])
+        lines.extend(["", "", "_PAIRS = {"])
+        lines.extend(pairs)
+        lines.append("}")
+        lines.extend(["", RUNTIME_HELPERS.rstrip()])
+        return "\n".join(lines) + "\n"
+
+    def _generate_map_rules_function(self, a: Type[Any], b: Type[Any]):
+        descriptors = self.mapper.pair_descriptors.get((a, b))
+        if descriptors is None:
+            self._error(a, b, "map rules are registered without descriptors")
+            return
+        a_descriptor, b_descriptor = descriptors
+
+        body = ["    args = {}"]
+        setters = []
+        for rule in self.mapper.map_rules[a][b]:
+            getter = a_descriptor.get_getter_source(rule.from_field.name, "a_obj")
+            if getter is None:
+                self._error(a, b, f"descriptor doesn't support generation of getter for '{rule.from_field.name}'")
+                continue
+            to_field_type = self.mapper._resolve_forward_ref(rule.to_field.type)
+            if rule.batch_converter is not None:
+                value = f"{self._reference(rule.batch_converter)}([value])[0]"
+            elif rule.converter is not None:
+                value = self._converter_call(rule.converter, "value", rule.from_field.type, a, b)
+            else:
+                value = self._expression("value", rule.from_field.type, to_field_type, a, b)
+
+            if rule.to_field.is_constructor_arg:
+                statement = f"args[{rule.to_field.name!r}] = {value}"
+                target = body
+            else:
+                statement = b_descriptor.get_setter_source(rule.to_field.name, "b_obj", value)
+                if statement is None:
+                    self._error(a, b, f"descriptor doesn't support generation of setter for '{rule.to_field.name}'")
+                    continue
+                target = setters
+
+            target.append(f"    value = {getter}")
+            if rule.to_field.is_required_constructor_arg:
+                target.append(f"    {statement}")
+            else:
+                target.extend(["    if value is not None:", f"        {statement}"])
+
+        body.append(f"    b_obj = {self._reference(b)}(**args)")
+        body.extend(setters)
+        body.append("    return b_obj")
+        self.functions.append(f"def {self.function_names[(a, b)]}(a_obj, context):\n" + "\n".join(body))
+
+    def _generate_converter_function(self, a: Type[Any], b: Type[Any], converter: Callable[[Any, Dict], Any]):
+        name = self.function_names[(a, b)]
+        wrapped = getattr(converter, "__wrapped__", None)
+        reference = self._reference(wrapped if wrapped is not None else converter, required=False)
+        if reference is not None:
+            call = f"{reference}(a_obj)" if wrapped is not None else f"{reference}(a_obj, context)"
+        else:
+            table = self._enum_table(a, lambda member: converter(member, {}))
+            if table is None:
+                self._error(a, b, "converter cannot be imported by qualified name")
+                return
+            call = f"_lookup({table}, a_obj)"
+        self.functions.append(f"def {name}(a_obj, context):\n    return {call}")
+
+    def _converter_call(self, converter: Callable[[Any], Any], var: str, a: Any, pair_a: Any, pair_b: Any) -> str:
+        reference = self._reference(converter, required=False)
+        if reference is not None:
+            return f"{reference}({var})"
+        table = self._enum_table(self.mapper._resolve_forward_ref(a), converter)
+        if table is None:
+            self._error(pair_a, pair_b, "field converter cannot be imported by qualified name")
+            return "None"
+        return f"_lookup({table}, {var})"
+
+    def _expression(self, var: str, a: Any, b: Any, pair_a: Any, pair_b: Any) -> str:
+        """
+        Return expression mapping value of variable var with declared type a to type b
+        """
+        a = self.mapper._resolve_forward_ref(a)
+        b = self.mapper._resolve_forward_ref(b)
+
+        if is_union_type(a):
+            a_members = [t for t in get_args(a) if t is not type(None)]
+            a = self.mapper._resolve_forward_ref(a_members[0]) if len(a_members) == 1 else Any
+
+        if b is Any:
+            return var if self._is_immutable(a) else f"_deepcopy({var})"
+
+        if is_union_type(b):
+            b_members = [self.mapper._resolve_forward_ref(t) for t in get_args(b) if t is not type(None)]
+            if len(b_members) == 1:
+                expression = self._expression(var, a, b_members[0], pair_a, pair_b)
+            else:
+                expression = f"{self._dispatcher(b, b_members)}({var}, context)"
+            if type(None) in get_args(b):
+                return f"(None if {var} is None else {expression})"
+            return expression
+
+        if (a, b) in self.function_names:
+            if self._has_subclass_sources(a, b):
+                # Values of subclasses are mapped with their own mappings
+                return f"{self._dispatcher(b, [b])}({var}, context)"
+            return f"{self.function_names[(a, b)]}({var}, context)"
+
+        if self.mapper._is_iterable(b):
+            return self._iterable_expression(var, a, b, pair_a, pair_b)
+
+        if get_origin(b) in self.mapper.MAPPING_TYPES and len(get_args(b)) == 2:
+            return self._mapping_expression(var, a, b, pair_a, pair_b)
+
+        if isinstance(a, type) and isinstance(b, type):
+            converter = self.mapper._find_primitive_converter(a, b)
+            if converter is not None:
+                return self._converter_call(converter, var, a, pair_a, pair_b)
+            if issubclass(a, b):
+                return var if self._is_immutable(a) else f"_deepcopy({var})"
+
+        if isinstance(b, type):
+            return f"{self._dispatcher(b, [b])}({var}, context)"
+
+        self._error(pair_a, pair_b, f"mapping to type {b} is not supported")
+        return "None"
+
+    def _iterable_expression(self, var: str, a: Any, b: Any, pair_a: Any, pair_b: Any) -> str:
+        origin = get_origin(b) or b
+        constructor = self._reference(self.mapper.ITERABLE_TYPES[origin])
+        a_args = self.mapper._iterable_items_types(a) if a is not Any else ()
+        b_args = self.mapper._iterable_items_types(b)
+
+        if len(b_args) == 0:
+            return f"{constructor}({var})"
+        elif len(b_args) == 1:
+            item = self._variable()
+            a_item = a_args[0] if len(a_args) == 1 else Any
+            item_expression = self._expression(item, a_item, b_args[0], pair_a, pair_b)
+            if item_expression == item:
+                return f"{constructor}({var})"
+            if origin is list:
+                return f"[{item_expression} for {item} in {var}]"
+            return f"{constructor}({item_expression} for {item} in {var})"
+        else:
+            items = []
+            for index, b_arg in enumerate(b_args):
+                a_arg = a_args[index] if len(a_args) == len(b_args) else Any
+                items.append(self._expression(f"{var}[{index}]", a_arg, b_arg, pair_a, pair_b))
+            return f"({', '.join(items)},)"
+
+    def _mapping_expression(self, var: str, a: Any, b: Any, pair_a: Any, pair_b: Any) -> str:
+        constructor = self._reference(self.mapper.MAPPING_TYPES[get_origin(b)])
+        a_args = get_args(a) if a is not Any and len(get_args(a)) == 2 else (Any, Any)
+        key, value = self._variable(), self._variable()
+        key_expression = self._expression(key, a_args[0], get_args(b)[0], pair_a, pair_b)
+        value_expression = self._expression(value, a_args[1], get_args(b)[1], pair_a, pair_b)
+        if key_expression == key and value_expression == value:
+            return f"{constructor}({var})"
+        items = f"{key_expression}: {value_expression} for {key}, {value} in {var}.items()"
+        if constructor == "dict":
+            return f"{{{items}}}"
+        return f"{constructor}({{{items}}})"
+
+    def _dispatcher(self, b: Any, b_members: List[Type[Any]]) -> str:
+        """
+        Return name of function mapping value to b by runtime class of value
+        """
+        if b in self.dispatchers:
+            return self.dispatchers[b]
+
+        name = self._unique_name(f"_to_{self._name(b)}")
+        self.dispatchers[b] = name
+        table = [
+            f"    {self._reference(a)}: {function},"
+            for (a, to_class), function in self.function_names.items()
+            if to_class in b_members
+        ]
+        members = ", ".join(self._reference(t) for t in b_members)
+        self.dispatch_tables.extend([f"{name.upper()} = {{", *table, "}"])
+        self.functions.append(
+            f"def {name}(value, context):\n"
+            f"    function = _find_function({name.upper()}, value.__class__)\n"
+            f"    if function is not None:\n"
+            f"        return function(value, context)\n"
+            f"    return _fallback(value, ({members},))"
+        )
+        return name
+
+    def _has_subclass_sources(self, a: Any, b: Any) -> bool:
+        """
+        Check that mapping to b is registered for some subclass of a
+        """
+        return isinstance(a, type) and any(
+            source is not a and isinstance(source, type) and issubclass(source, a) and target == b
+            for source, target in self.function_names
+        )
+
+    @staticmethod
+    def _is_immutable(t: Any) -> bool:
+        return isinstance(t, type) and issubclass(t, LITERAL_TYPES + (Enum,))
+
+    def _enum_table(self, a: Any, converter: Callable[[Any], Any]) -> Optional[str]:
+        """
+        Tabulate converter from enum for all members. Returns name of table constant or None if not possible.
+        """
+        if not isinstance(a, type) or not issubclass(a, Enum):
+            return None
+        items = []
+        for member in a:
+            try:
+                value = converter(member)
+            except Exception:
+                continue
+            value_literal = self._literal(value)
+            if value_literal is None:
+                return None
+            items.append(f"    {self._literal(member)}: {value_literal},")
+        name = self._unique_name(f"_{self._name(a).upper()}_TABLE")
+        self.constants.extend([f"{name} = {{", *items, "}"])
+        return name
+
+    def _literal(self, value: Any) -> Optional[str]:
+        if value is None or type(value) in LITERAL_TYPES:
+            return repr(value)
+        if isinstance(value, Enum):
+            enum_reference = self._reference(value.__class__, required=False)
+            if enum_reference is not None:
+                return f"{enum_reference}.{value.name}"
+        return None
+
+    def _reference(self, obj: Any, required: bool = True) -> Optional[str]:
+        """
+        Return expression referencing class or function by its qualified name
+        """
+        if obj is type(None):
+            return "type(None)"
+        module_name = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None)
+        if module_name is not None and qualname is not None and "<" not in qualname and module_name != "__main__":
+            try:
+                resolved = import_module(module_name)
+                for part in qualname.split("."):
+                    resolved = getattr(resolved, part)
+            except (ImportError, AttributeError):
+                resolved = None
+            if resolved is obj:
+                if module_name == "builtins":
+                    return qualname
+                alias = self.modules.setdefault(module_name, f"_m{len(self.modules)}")
+                return f"{alias}.{qualname}"
+        # Methods of builtin classes, e.g. datetime.fromisoformat, have no module
+        owner = getattr(obj, "__self__", None) or getattr(obj, "__objclass__", None)
+        name = getattr(obj, "__name__", None)
+        if module_name is None and isinstance(owner, type) and name is not None and getattr(owner, name, None) == obj:
+            owner_reference = self._reference(owner, required=False)
+            if owner_reference is not None:
+                return f"{owner_reference}.{name}"
+        if required:
+            self.errors.append(f"Cannot reference {obj} by qualified name in generated source.")
+        return None
+
+    def _error(self, a: Any, b: Any, error: str):
+        self.errors.append(str(MappingException(f"Cannot generate source: {error}", MappingExceptionInfo(a, b))))
+
+    def _unique_name(self, name: str) -> str:
+        count = self.used_names.get(name, 0)
+        self.used_names[name] = count + 1
+        return name if count == 0 else f"{name}_{count}"
+
+    def _variable(self) -> str:
+        self.variables_count += 1
+        return f"item{self.variables_count}"
+
+    @staticmethod
+    def _name(t: Any) -> str:
+        name = MappingException._get_type_name(t)
+        return "".join(c if c.isalnum() else "_" for c in name)
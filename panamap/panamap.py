@@ -1,11 +1,46 @@
-from typing import Type, Any, TypeVar, Callable, Generic, List, Optional, Dict, Iterable, Set, Union, Tuple
+from typing import (
+    Generator,
+    Type,
+    Any,
+    TypeVar,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Dict,
+    Iterable,
+    Iterator,
+    Set,
+    Union,
+    Tuple,
+    FrozenSet,
+    TYPE_CHECKING,
+    get_type_hints,
+)
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass, replace, MISSING
 from inspect import signature
 from copy import deepcopy
+from array import array
+from collections import OrderedDict, deque
+from collections import abc
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+from itertools import cycle, repeat
+from time import monotonic
+from weakref import WeakKeyDictionary, WeakValueDictionary, ref
+import sys
 
 from typing_inspect import get_origin, get_args, is_union_type, is_forward_ref, get_forward_arg
 
+from panamap.tools import values_map
+
+if TYPE_CHECKING:
+    # concurrent.futures imports threading and logging, it is needed only when executor is passed
+    from concurrent.futures import Executor, Future
+
 
 @dataclass
 class MappingExceptionInfo:
@@ -17,6 +52,55 @@ class MappingExceptionInfo:
     def has_fields_chain(self):
         return 0 < len(self.a_fields_chain) or 0 < len(self.b_fields_chain)
 
+    def nested_field(self, a: Type[Any], b: Type[Any], a_field: str, b_field: str) -> "MappingExceptionInfo":
+        return NestedMappingExceptionInfo(a, b, self, a_field, b_field)
+
+    def nested_item(self, key: Any) -> "MappingExceptionInfo":
+        return NestedMappingExceptionInfo(self.a, self.b, self, None, None, key)
+
+
+class NestedMappingExceptionInfo(MappingExceptionInfo):
+    """
+    Info of nested field or collection item linked to info of its owner. Fields chains are built only when they are
+    read, e.g. when exception is raised, so nesting costs the same on any depth.
+    """
+
+    def __init__(
+        self,
+        a: Type[Any],
+        b: Type[Any],
+        parent: MappingExceptionInfo,
+        a_field: Optional[str],
+        b_field: Optional[str],
+        key: Any = None,
+    ):
+        self.a = a
+        self.b = b
+        self.parent = parent
+        self.a_field = a_field
+        self.b_field = b_field
+        self.key = key
+
+    @property
+    def a_fields_chain(self) -> List[str]:
+        return self._fields_chain(True)
+
+    @property
+    def b_fields_chain(self) -> List[str]:
+        return self._fields_chain(False)
+
+    def has_fields_chain(self):
+        return True
+
+    def _fields_chain(self, left: bool) -> List[str]:
+        names = []
+        info: MappingExceptionInfo = self
+        while isinstance(info, NestedMappingExceptionInfo):
+            name = info.a_field if left else info.b_field
+            names.append(name if name is not None else f"[{info.key!r}]")
+            info = info.parent
+        return (info.a_fields_chain if left else info.b_fields_chain) + names[::-1]
+
 
 class MappingException(Exception):
     def __init__(self, error_description: str, exc_info: Optional[MappingExceptionInfo] = None):
@@ -90,12 +174,27 @@ class FieldMappingException(MappingException):
         super(MappingException, self).__init__(exc_info, error)
 
 
+class MappingLimitExceededException(MappingException):
+    def __init__(self, exc_info: MappingExceptionInfo, error: str):
+        super(MappingLimitExceededException, self).__init__(f"Mapping limit exceeded: {error}", exc_info)
+
+
+class MappingValidationException(MappingException):
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super(MappingValidationException, self).__init__(
+            f"Mapping validation failed with {len(errors)} error(s):\n" + "\n".join(errors)
+        )
+
+
 T = TypeVar("T")
 F = TypeVar("F")
 
 
 @dataclass
 class FieldDescriptor(Generic[T, F]):
+    __slots__ = ("name", "type", "getter", "setter", "is_constructor_arg", "is_required_constructor_arg")
+
     name: str
     type: Type[F]
     getter: Callable[[T], F]
@@ -110,16 +209,47 @@ F1 = TypeVar("F1")
 F2 = TypeVar("F2")
 
 
-@dataclass
+@dataclass(init=False)
 class FieldMapRule(Generic[T1, F1, T2, F2]):
+    # Slots don't allow class level defaults, so defaults are set in __init__
+    __slots__ = ("from_field", "to_field", "converter", "batch_converter", "blocking")
+
     from_field: FieldDescriptor[T1, F1]
     to_field: FieldDescriptor[T2, F2]
     converter: Optional[Callable[[F1], F2]]
+    batch_converter: Optional[Callable[[List[F1]], List[F2]]]
+    blocking: bool
+
+    def __init__(
+        self,
+        from_field: FieldDescriptor[T1, F1],
+        to_field: FieldDescriptor[T2, F2],
+        converter: Optional[Callable[[F1], F2]],
+        batch_converter: Optional[Callable[[List[F1]], List[F2]]] = None,
+        blocking: bool = False,
+    ):
+        self.from_field = from_field
+        self.to_field = to_field
+        self.converter = converter
+        self.batch_converter = batch_converter
+        self.blocking = blocking
+
+    def has_converter(self) -> bool:
+        return self.converter is not None or self.batch_converter is not None
+
+    def convert(self, value: F1) -> F2:
+        """
+        Convert single value with converter or batch converter
+        """
+        if self.batch_converter is not None:
+            return self.batch_converter([value])[0]
+        return self.converter(value)
 
 
 class MappingDescriptor(ABC, Generic[T]):
     def __init__(self, t: Type[T]):
         self.type = t
+        self.field_descriptors: Dict[str, Optional[FieldDescriptor[T, Any]]] = {}
 
     @classmethod
     @abstractmethod
@@ -134,8 +264,15 @@ class MappingDescriptor(ABC, Generic[T]):
         return None  # pragma: no cover
 
     def get_field_descriptor(self, field_name: str) -> Optional[FieldDescriptor[T, F]]:
+        """
+        Return descriptor of field. Descriptors are created once and shared by all rules of the field.
+        """
+        try:
+            return self.field_descriptors[field_name]
+        except KeyError:
+            pass
         if self.is_field_supported(field_name):
-            return FieldDescriptor(
+            descriptor = FieldDescriptor(
                 name=field_name,
                 type=self.get_preferred_field_type(field_name),
                 getter=self.get_getter(field_name),
@@ -144,7 +281,9 @@ class MappingDescriptor(ABC, Generic[T]):
                 is_required_constructor_arg=self.is_required_constructor_arg(field_name),
             )
         else:
-            return None
+            descriptor = None
+        self.field_descriptors[field_name] = descriptor
+        return descriptor
 
     @abstractmethod
     def get_getter(self, field_name: str) -> Callable[[T], Any]:
@@ -215,6 +354,20 @@ class MappingDescriptor(ABC, Generic[T]):
         """
         pass  # pragma: no cover
 
+    def get_getter_source(self, field_name: str, obj: str) -> Optional[str]:
+        """
+        Return python expression reading field from variable obj, used for generated sources.
+        None means that generation is not supported by descriptor.
+        """
+        return None
+
+    def get_setter_source(self, field_name: str, obj: str, value: str) -> Optional[str]:
+        """
+        Return python statement setting expression value to field of variable obj, used for generated sources.
+        None means that generation is not supported by descriptor.
+        """
+        return None
+
     @staticmethod
     def uncase(field_name: str) -> str:
         return field_name.replace("_", "").lower()
@@ -247,6 +400,12 @@ class CommonTypeMappingDescriptor(MappingDescriptor):
 
         return setter
 
+    def get_getter_source(self, field_name: str, obj: str) -> Optional[str]:
+        return f"getattr({obj}, {field_name!r}, None)"
+
+    def get_setter_source(self, field_name: str, obj: str, value: str) -> Optional[str]:
+        return f"setattr({obj}, {field_name!r}, {value})"
+
     def get_preferred_field_type(self, field_name: str) -> Type[Any]:
         param = self.constructor_parameters.get(field_name)
         if param is not None:
@@ -292,6 +451,12 @@ class DictMappingDescriptor(MappingDescriptor):
 
         return setter
 
+    def get_getter_source(self, field_name: str, obj: str) -> Optional[str]:
+        return f"{obj}.get({field_name!r})"
+
+    def get_setter_source(self, field_name: str, obj: str, value: str) -> Optional[str]:
+        return f"{obj}[{field_name!r}] = {value}"
+
     def get_constructor_args(self) -> Set[str]:
         return set()
 
@@ -311,6 +476,306 @@ class DictMappingDescriptor(MappingDescriptor):
         return True
 
 
+class TypedDictMappingDescriptor(MappingDescriptor):
+    """
+    Describes TypedDict classes: declared keys are fields with annotated types, TypedDict is constructed from keys.
+    Instances are plain dicts, so they are mapped with mapping of TypedDict if it is the only TypedDict with
+    mapping to target type.
+    """
+
+    def __init__(self, t: Type[Dict]):
+        super(TypedDictMappingDescriptor, self).__init__(t)
+        try:
+            self.field_types: Dict[str, Any] = get_type_hints(t)
+        except Exception:
+            # Unresolvable forward references are kept as is and resolved by mapper
+            self.field_types = dict(t.__annotations__)
+        required_keys = getattr(t, "__required_keys__", None)
+        if required_keys is None:
+            required_keys = self.field_types.keys() if t.__total__ else ()
+        self.required_keys = set(required_keys)
+
+    @classmethod
+    def supports_type(cls, t: Type[Any]) -> bool:
+        return isinstance(t, type) and issubclass(t, dict) and hasattr(t, "__total__") and hasattr(t, "__annotations__")
+
+    def get_getter(self, field_name: str) -> Callable[[Dict], Any]:
+        def getter(d: Dict):
+            return d.get(field_name)
+
+        return getter
+
+    def get_setter(self, field_name: str) -> Callable[[Dict, Any], None]:
+        def setter(d: Dict, value: Any):
+            d[field_name] = value
+
+        return setter
+
+    def get_getter_source(self, field_name: str, obj: str) -> Optional[str]:
+        return f"{obj}.get({field_name!r})"
+
+    def get_setter_source(self, field_name: str, obj: str, value: str) -> Optional[str]:
+        return f"{obj}[{field_name!r}] = {value}"
+
+    def get_constructor_args(self) -> Set[str]:
+        return set(self.field_types.keys())
+
+    def get_required_constructor_args(self) -> Set[str]:
+        return self.required_keys
+
+    def get_declared_fields(self) -> Set[str]:
+        return set(self.field_types.keys())
+
+    def is_field_supported(self, field_name: str) -> bool:
+        return field_name in self.field_types
+
+    def get_preferred_field_type(self, field_name: str) -> Type[Any]:
+        return self.field_types.get(field_name, Any)
+
+    def is_container_type(self) -> bool:
+        return False
+
+
+@dataclass
+class CacheInfo:
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+@dataclass
+class MemoryReport:
+    types: int
+    pairs: int
+    rules: int
+    field_descriptors: int
+    cached_results: int
+    prepared_plans: int
+    # Approximate size in bytes of registries, rules and field descriptors
+    size: int
+
+
+class WeakPairDictionary(abc.MutableMapping):
+    """
+    Dictionary keyed by tuples starting with pair of types. Types are referenced weakly and entries are removed when
+    one of types is garbage collected.
+    """
+
+    def __init__(self, items: Iterable[Tuple[Tuple[Any, ...], Any]] = ()):
+        self.data: WeakKeyDictionary = WeakKeyDictionary()
+        self.update(items)
+
+    def __getitem__(self, key: Tuple[Any, ...]) -> Any:
+        try:
+            return self.data[key[0]][key[1]][key[2:]]
+        except TypeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key: Tuple[Any, ...], value: Any) -> None:
+        self.data.setdefault(key[0], WeakKeyDictionary()).setdefault(key[1], {})[key[2:]] = value
+
+    def __delitem__(self, key: Tuple[Any, ...]) -> None:
+        try:
+            by_b = self.data[key[0]]
+            values = by_b[key[1]]
+            del values[key[2:]]
+        except TypeError:
+            raise KeyError(key)
+        if not values:
+            del by_b[key[1]]
+            if not by_b:
+                del self.data[key[0]]
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        for a, by_b in list(self.data.items()):
+            for b, values in list(by_b.items()):
+                for rest in list(values):
+                    yield (a, b, *rest)
+
+    def __len__(self) -> int:
+        return sum(len(values) for by_b in list(self.data.values()) for values in list(by_b.values()))
+
+    def __bool__(self) -> bool:
+        return any(by_b for by_b in list(self.data.values()))
+
+
+class LayeredDictionary(abc.MutableMapping):
+    """
+    Dictionary with own entries layered over read-only base mapping, so registries are shared by derived mappers
+    without copying values. Entries of base can be replaced and removed, base itself is never changed. With
+    copy_value values of base are copied on first read and stored as own entries.
+    """
+
+    def __init__(
+        self,
+        base: abc.Mapping,
+        factory: Callable[[], Any],
+        copy_value: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.base = base
+        self.factory = factory
+        self.copy_value = copy_value
+        self.data = factory()
+        # Values of WeakValueDictionary can not be marks of removed keys
+        self.removed = {} if isinstance(self.data, WeakValueDictionary) else factory()
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self.data[key]
+        except KeyError:
+            if key in self.removed:
+                raise
+        value = self.base[key]
+        if self.copy_value is not None:
+            value = self.data[key] = self.copy_value(value)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.data or (key not in self.removed and key in self.base)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.data[key] = value
+        self.removed.pop(key, None)
+
+    def __delitem__(self, key: Any) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.data.pop(key, None)
+        if key in self.base:
+            self.removed[key] = True
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from list(self.data)
+        for key in list(self.base):
+            if key not in self.data and key not in self.removed:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        if self.data:
+            return True
+        if not self.removed:
+            return bool(self.base)
+        return any(True for _ in self)
+
+    @staticmethod
+    def snapshot(registry: abc.Mapping, factory: Callable[[], Any]) -> abc.Mapping:
+        """
+        Return read-only mapping with the same entries as registry to be used as base of new layers. Registry itself
+        is not changed. Layers are merged into one mapping, so repeated deriving does not make lookups slower, and
+        base of empty layer is reused without copying.
+        """
+        if not isinstance(registry, LayeredDictionary):
+            snapshot = factory()
+            snapshot.update(registry)
+            return snapshot
+        if not registry.data and not registry.removed:
+            return registry.base
+        snapshot = factory()
+        snapshot.update((key, value) for key, value in registry.base.items() if key not in registry.removed)
+        snapshot.update(registry.data)
+        return snapshot
+
+
+class MappingCache:
+    """
+    LRU cache of mapping results keyed by hashable source value and selected context values
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, context_keys: Iterable[str] = ()):
+        self.maxsize = maxsize
+        self.context_keys = tuple(context_keys)
+        self.values: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, a_obj: Any, context: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """
+        Return cache key or None if source value or context values are not hashable. Class of source value is a part
+        of key, so equal values of different classes, e.g. 1 and True, are not mixed up.
+        """
+        key = (a_obj.__class__, a_obj, *[context.get(k) for k in self.context_keys])
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Tuple[Any, ...]) -> Tuple[bool, Any]:
+        try:
+            value = self.values[key]
+            self.values.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, value
+
+    def put(self, key: Tuple[Any, ...], value: Any) -> None:
+        self.values[key] = value
+        if self.maxsize is not None and len(self.values) > self.maxsize:
+            self.values.popitem(last=False)
+
+    def clear(self) -> None:
+        self.values.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self.values))
+
+
+class WeakMappingCache(MappingCache):
+    """
+    Result cache of mapper with weakly referenced types. Source values are referenced weakly, so cached results
+    do not keep source values and their classes alive, and results are dropped when source value is garbage
+    collected. Source values which do not support weak references are not cached.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, context_keys: Iterable[str] = ()):
+        super().__init__(maxsize, context_keys)
+        # Cache keys by id of weak reference to source value, for removal when source value is collected
+        self.keys_by_ref: Dict[int, List[Tuple[Any, ...]]] = {}
+
+    def make_key(self, a_obj: Any, context: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """
+        Return cache key or None if source value is not weakly referenceable or values are not hashable. Weak
+        references are equal while their referents are alive and equal.
+        """
+        try:
+            key = (ref(a_obj.__class__), ref(a_obj, self._remove), *[context.get(k) for k in self.context_keys])
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def put(self, key: Tuple[Any, ...], value: Any) -> None:
+        if key not in self.values:
+            self.keys_by_ref.setdefault(id(key[1]), []).append(key)
+        self.values[key] = value
+        if self.maxsize is not None and len(self.values) > self.maxsize:
+            old_key, _ = self.values.popitem(last=False)
+            keys = self.keys_by_ref[id(old_key[1])]
+            keys.remove(old_key)
+            if not keys:
+                del self.keys_by_ref[id(old_key[1])]
+
+    def _remove(self, a_ref: Any) -> None:
+        for key in self.keys_by_ref.pop(id(a_ref), ()):
+            self.values.pop(key, None)
+
+    def clear(self) -> None:
+        super().clear()
+        self.keys_by_ref.clear()
+
+
 L = TypeVar("L")
 R = TypeVar("R")
 
@@ -332,9 +797,23 @@ class MappingConfigFlow(Generic[L, R]):
         self.l_to_r_converter_callable: Optional[Callable[[L, Dict[str, Any]], R]] = None
         self.r_to_l_converter_callable: Optional[Callable[[R, Dict[str, Any]], L]] = None
 
+        self.l_to_r_cache: Optional[MappingCache] = None
+        self.r_to_l_cache: Optional[MappingCache] = None
+
     def l_to_r(
-        self, left_field_name: str, right_field_name: str, converter: Callable[[Any], Any] = None
+        self,
+        left_field_name: str,
+        right_field_name: str,
+        converter: Callable[[Any], Any] = None,
+        batch_converter: Callable[[List[Any]], List[Any]] = None,
+        blocking: bool = False,
     ) -> "MappingConfigFlow":
+        """
+        Map left field to right field. Batch converter receives list of values of the field of all objects mapped
+        together, e.g. items of list or objects passed to `Mapper.map_many`, and returns converted values in order.
+        Converters marked as blocking, e.g. doing I/O, are run concurrently when `executor` is passed to `Mapper.map`.
+        """
+        self._check_converters(converter, batch_converter, blocking)
         left_field = self.left_descriptor.get_field_descriptor(left_field_name)
         if left_field is None:
             raise UnsupportedFieldException(self.left_descriptor.type, left_field_name)
@@ -343,15 +822,32 @@ class MappingConfigFlow(Generic[L, R]):
         if right_field is None:
             raise UnsupportedFieldException(self.right_descriptor.type, right_field_name)
 
-        self.l_to_r_map_list.append(FieldMapRule(from_field=left_field, to_field=right_field, converter=converter))
+        self.l_to_r_map_list.append(
+            FieldMapRule(
+                from_field=left_field,
+                to_field=right_field,
+                converter=converter,
+                batch_converter=batch_converter,
+                blocking=blocking,
+            )
+        )
 
         self.l_to_r_touched = True
         self._l_to_r_check()
         return self
 
     def r_to_l(
-        self, left_field_name: str, right_field_name: str, converter: Callable[[Any], Any] = None
+        self,
+        left_field_name: str,
+        right_field_name: str,
+        converter: Callable[[Any], Any] = None,
+        batch_converter: Callable[[List[Any]], List[Any]] = None,
+        blocking: bool = False,
     ) -> "MappingConfigFlow":
+        """
+        Map right field to left field, see `l_to_r` for converters description.
+        """
+        self._check_converters(converter, batch_converter, blocking)
         left_field = self.left_descriptor.get_field_descriptor(left_field_name)
         if left_field is None:
             raise UnsupportedFieldException(self.left_descriptor.type, left_field_name)
@@ -360,12 +856,30 @@ class MappingConfigFlow(Generic[L, R]):
         if right_field is None:
             raise UnsupportedFieldException(self.right_descriptor.type, right_field_name)
 
-        self.r_to_l_map_list.append(FieldMapRule(from_field=right_field, to_field=left_field, converter=converter))
+        self.r_to_l_map_list.append(
+            FieldMapRule(
+                from_field=right_field,
+                to_field=left_field,
+                converter=converter,
+                batch_converter=batch_converter,
+                blocking=blocking,
+            )
+        )
 
         self.r_to_l_touched = True
         self._r_to_l_check()
         return self
 
+    def _check_converters(self, converter: Optional[Callable], batch_converter: Optional[Callable], blocking: bool):
+        if converter is not None and batch_converter is not None:
+            raise ImproperlyConfiguredException(
+                MappingExceptionInfo(self.left, self.right), "converter and batch_converter cannot be used together"
+            )
+        if blocking and converter is None and batch_converter is None:
+            raise ImproperlyConfiguredException(
+                MappingExceptionInfo(self.left, self.right), "blocking field mapping requires converter"
+            )
+
     def bidirectional(self, l_field_name: str, r_field_name: str) -> "MappingConfigFlow":
         self.l_to_r(l_field_name, r_field_name)
         self.r_to_l(l_field_name, r_field_name)
@@ -428,6 +942,45 @@ class MappingConfigFlow(Generic[L, R]):
             self.bidirectional(lf_name, rf_name)
         return self
 
+    def map_enum(self, by: Optional[str] = "name", values: Optional[Dict[L, R]] = None) -> "MappingConfigFlow":
+        """
+        Set up converters in both directions between two enums. Members are matched by "name" or by "value",
+        explicit values map overrides matched members. Reverse mapping keeps first left member for each right one.
+        """
+        if not self._is_enum(self.left) or not self._is_enum(self.right):
+            raise ImproperlyConfiguredException(
+                MappingExceptionInfo(self.left, self.right), "enum mapping requires both types to be enums"
+            )
+
+        if by == "name":
+            l_to_r_map = {m: self.right[m.name] for m in self.left if m.name in self.right.__members__}
+        elif by == "value":
+            right_by_value = {m.value: m for m in self.right}
+            l_to_r_map = {m: right_by_value[m.value] for m in self.left if m.value in right_by_value}
+        elif by is None:
+            l_to_r_map = {}
+        else:
+            raise ImproperlyConfiguredException(
+                MappingExceptionInfo(self.left, self.right), f"unknown enum matching '{by}'"
+            )
+        if values is not None:
+            l_to_r_map.update(values)
+
+        r_to_l_map = {}
+        for left_member, right_member in l_to_r_map.items():
+            r_to_l_map.setdefault(right_member, left_member)
+
+        self.l_to_r_converter_callable = values_map(l_to_r_map)
+        self.r_to_l_converter_callable = values_map(r_to_l_map)
+
+        self._l_to_r_check()
+        self._r_to_l_check()
+        return self
+
+    @staticmethod
+    def _is_enum(t: Type[Any]) -> bool:
+        return isinstance(t, type) and issubclass(t, Enum)
+
     def l_to_r_converter(
         self, converter: Union[Callable[[L], R], Callable[[L, Dict[str, Any]], R]]
     ) -> "MappingConfigFlow":
@@ -444,15 +997,43 @@ class MappingConfigFlow(Generic[L, R]):
         self._r_to_l_check()
         return self
 
+    def l_to_r_cached(self, maxsize: Optional[int] = 128, context_keys: Iterable[str] = ()) -> "MappingConfigFlow":
+        """
+        Cache results of left to right mapping between calls. Source values must be hashable and results should be
+        immutable as the same result object is returned for equal source values.
+        """
+        self.l_to_r_cache = MappingCache(maxsize, context_keys)
+        return self
+
+    def r_to_l_cached(self, maxsize: Optional[int] = 128, context_keys: Iterable[str] = ()) -> "MappingConfigFlow":
+        """
+        Cache results of right to left mapping between calls. See l_to_r_cached.
+        """
+        self.r_to_l_cache = MappingCache(maxsize, context_keys)
+        return self
+
+    def cached(self, maxsize: Optional[int] = 128, context_keys: Iterable[str] = ()) -> "MappingConfigFlow":
+        self.l_to_r_cached(maxsize, context_keys)
+        self.r_to_l_cached(maxsize, context_keys)
+        return self
+
     def register(self) -> None:
         if self.l_to_r_touched:
-            self.mapper._add_map_rules(self.left, self.right, self.l_to_r_map_list)
+            self.mapper._add_map_rules(
+                self.left, self.right, self.l_to_r_map_list, (self.left_descriptor, self.right_descriptor)
+            )
         if self.r_to_l_touched:
-            self.mapper._add_map_rules(self.right, self.left, self.r_to_l_map_list)
+            self.mapper._add_map_rules(
+                self.right, self.left, self.r_to_l_map_list, (self.right_descriptor, self.left_descriptor)
+            )
         if self.l_to_r_converter_callable is not None:
             self.mapper._add_converter(self.left, self.right, self.l_to_r_converter_callable)
         if self.r_to_l_converter_callable is not None:
             self.mapper._add_converter(self.right, self.left, self.r_to_l_converter_callable)
+        if self.l_to_r_cache is not None and (self.l_to_r_touched or self.l_to_r_converter_callable is not None):
+            self.mapper._add_cache(self.left, self.right, self.l_to_r_cache)
+        if self.r_to_l_cache is not None and (self.r_to_l_touched or self.r_to_l_converter_callable is not None):
+            self.mapper._add_cache(self.right, self.left, self.r_to_l_cache)
 
     def _l_to_r_check(self):
         if self.l_to_r_touched and self.l_to_r_converter_callable is not None:
@@ -473,14 +1054,354 @@ class MappingConfigFlow(Generic[L, R]):
             def wrapped_converter(left: L, ignored_context: Dict[str, Any]):
                 return converter(left)
 
+            wrapped_converter.__wrapped__ = converter
             return wrapped_converter
         else:
             return converter
 
 
+class Projection:
+    """
+    Tree of target field paths to include or exclude. Paths are dotted field names, iterables are transparent,
+    e.g. "items.name" selects field name of each item in list field items.
+    """
+
+    def __init__(self, only: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()):
+        self.only = self._parse(only) if only is not None else None
+        self.exclude = self._parse(exclude)
+        self.children: Dict[str, Optional["Projection"]] = {}
+
+    @staticmethod
+    def _parse(paths: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+        """
+        Split paths by first field name. None value means that whole field is selected.
+        """
+        tree: Dict[str, Optional[List[str]]] = {}
+        for path in paths:
+            head, _, rest = path.partition(".")
+            if rest and tree.get(head, []) is not None:
+                tree.setdefault(head, []).append(rest)
+            else:
+                tree[head] = None
+        return tree
+
+    def includes(self, field_name: str) -> bool:
+        if self.only is not None and field_name not in self.only:
+            return False
+        return field_name not in self.exclude or self.exclude[field_name] is not None
+
+    def child(self, field_name: str) -> Optional["Projection"]:
+        if field_name not in self.children:
+            only = self.only.get(field_name) if self.only is not None else None
+            exclude = self.exclude.get(field_name) or ()
+            self.children[field_name] = Projection(only, exclude) if only is not None or exclude else None
+        return self.children[field_name]
+
+
+@dataclass(frozen=True)
+class MappingLimits:
+    """
+    Limits of a single mapping call, None means no limit. Elements are objects mapped with map rules, items of
+    collections and entries of dicts. Depth is nesting level of fields and collections, size limits length of str and
+    bytes values. Values copied as is, e.g. of fields typed as Any, are counted too. Timeout is in seconds.
+    """
+
+    max_elements: Optional[int] = None
+    max_depth: Optional[int] = None
+    max_size: Optional[int] = None
+    timeout: Optional[float] = None
+
+
+class LimitsTracker:
+    """
+    Consumption of limits shared by all nesting levels of a mapping call
+    """
+
+    def __init__(self, limits: MappingLimits):
+        self.limits = limits
+        self.elements = 0
+        self.deadline = monotonic() + limits.timeout if limits.timeout is not None else None
+        self.lazy_tracker: Optional[LimitsTracker] = None
+
+    def for_lazy_fields(self) -> "LimitsTracker":
+        """
+        Tracker of fields of lazy objects, which are mapped after mapping call returns. Elements consumed so far are
+        counted, but timeout of the call is not applied.
+        """
+        if self.deadline is None:
+            return self
+        if self.lazy_tracker is None:
+            self.lazy_tracker = LimitsTracker(replace(self.limits, timeout=None))
+            self.lazy_tracker.elements = self.elements
+        return self.lazy_tracker
+
+    def check(self, elements: int, depth: int, exc_info: MappingExceptionInfo) -> None:
+        limits = self.limits
+        self.elements += elements
+        if limits.max_elements is not None and self.elements > limits.max_elements:
+            raise MappingLimitExceededException(exc_info, f"more than {limits.max_elements} elements")
+        if limits.max_depth is not None and depth > limits.max_depth:
+            raise MappingLimitExceededException(exc_info, f"nesting deeper than {limits.max_depth}")
+        if self.deadline is not None and monotonic() > self.deadline:
+            raise MappingLimitExceededException(exc_info, f"timeout of {limits.timeout}s")
+
+    def check_size(self, values: Iterable[Any], exc_info: MappingExceptionInfo) -> None:
+        max_size = self.limits.max_size
+        if max_size is None:
+            return
+        for value in values:
+            if isinstance(value, (str, bytes, bytearray, memoryview)) and len(value) > max_size:
+                raise MappingLimitExceededException(exc_info, f"value longer than {max_size}")
+
+
+@dataclass
+class MappingState:
+    """
+    State of mapping operations of a single `Mapper.map` call. Projection and depth are specific for nesting level,
+    other fields are shared between levels.
+    """
+
+    memo: Optional[Dict[Tuple[int, Any], Tuple[Any, Any]]] = None
+    lazy: bool = False
+    projection: Optional[Projection] = None
+    max_depth: Optional[int] = None
+    depth: int = 0
+    # Values converted by batch converters, keyed by ids of rule and source object
+    batch_values: Optional[Dict[Tuple[int, int], Any]] = None
+    executor: Optional["Executor"] = None
+    iterative: bool = False
+    # Submitted conversions of blocking converters, keyed by ids of rule and source object
+    futures: Optional[Dict[Tuple[int, int], "Future"]] = None
+    limits: Optional[LimitsTracker] = None
+    # Nesting level of collections, counted in depth limit only
+    items_depth: int = 0
+
+    def is_partial(self) -> bool:
+        return self.projection is not None or self.max_depth is not None
+
+    def nested(self, field_name: str) -> "MappingState":
+        if self.limits is None and self.projection is None and self.max_depth is None:
+            return self
+        return MappingState(
+            memo=self.memo,
+            lazy=self.lazy,
+            projection=self.projection.child(field_name) if self.projection is not None else None,
+            max_depth=self.max_depth,
+            depth=self.depth + 1,
+            batch_values=self.batch_values,
+            executor=self.executor,
+            iterative=self.iterative,
+            futures=self.futures,
+            limits=self.limits,
+            items_depth=self.items_depth,
+        )
+
+    def nested_items(self) -> "MappingState":
+        if self.limits is None:
+            return self
+        return replace(self, items_depth=self.items_depth + 1)
+
+    def limits_depth(self) -> int:
+        return self.depth + self.items_depth
+
+
+class PendingReference:
+    """
+    Placeholder for an object which mapping is in progress. Used to resolve cyclic references in memoized mappings.
+    """
+
+    def __init__(self):
+        self.waiters: List[Tuple[Any, Callable[[Any, Any], None]]] = []
+
+    def resolve(self, b_obj: Any) -> None:
+        for owner, setter in self.waiters:
+            setter(owner, b_obj)
+
+
+SKIPPED_FIELD = object()
+
+# Kinds of mappings found by Mapper._dispatch
+DISPATCH_MAP_RULES = 0
+DISPATCH_CONVERTER = 1
+DISPATCH_PRIMITIVE = 2
+
+
+class LazyField:
+    """
+    Non-data descriptor which maps field value on first access and stores it in instance dict,
+    so next accesses don't reach descriptor at all.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Optional[Type[Any]] = None) -> Any:
+        if obj is None:
+            return self
+        loader = obj.__dict__.get(LazyFieldsLoader.ATTRIBUTE)
+        if loader is None:
+            raise AttributeError(self.name)
+        value = loader.load(obj, self.name)
+        obj.__dict__[self.name] = value
+        return value
+
+
+class LazyFieldsLoader:
+    """
+    Maps fields of lazy target objects. Keeps source object and context until all fields are loaded.
+    """
+
+    ATTRIBUTE = "_panamap_lazy_loader"
+    FIELDS_ATTRIBUTE = "_panamap_lazy_fields"
+
+    def __init__(
+        self,
+        mapper: "Mapper",
+        a_obj: Any,
+        b: Type[Any],
+        lazy_class: Type[Any],
+        map_rules: List[FieldMapRule],
+        context: Dict[str, Any],
+        exc_info: MappingExceptionInfo,
+        state: MappingState,
+    ):
+        self.mapper = mapper
+        self.a_obj = a_obj
+        self.b = b
+        self.rules = {rule.to_field.name: rule for rule in map_rules}
+        self.context = context
+        self.exc_info = exc_info
+        self.state = state
+        self.not_loaded = set(getattr(lazy_class, LazyFieldsLoader.FIELDS_ATTRIBUTE))
+
+    def load(self, obj: Any, name: str) -> Any:
+        rule = self.rules.get(name)
+        if rule is None:
+            value = self.get_default(name)
+        else:
+            value = self.mapper._map_field(self.a_obj, rule, self.context, self.exc_info, self.state)
+            if value is SKIPPED_FIELD:
+                value = self.get_default(name)
+
+        self.not_loaded.discard(name)
+        if not self.not_loaded:
+            # Release source object when all fields are loaded
+            del obj.__dict__[LazyFieldsLoader.ATTRIBUTE]
+        return value
+
+    def get_default(self, name: str) -> Any:
+        if is_dataclass(self.b):
+            for f in fields(self.b):
+                if f.name == name:
+                    if f.default is not MISSING:
+                        return f.default
+                    elif f.default_factory is not MISSING:
+                        return f.default_factory()
+                    break
+        else:
+            param = signature(self.b.__init__).parameters.get(name)
+            if param is not None and param.default is not param.empty:
+                return param.default
+        return None
+
+    @staticmethod
+    def to_instance(obj: Any) -> Any:
+        """
+        Load all fields of lazy object and return plain instance of target class with the same field values
+        """
+        for name in getattr(type(obj), LazyFieldsLoader.FIELDS_ATTRIBUTE):
+            getattr(obj, name)
+        instance = object.__new__(obj.__class__)
+        instance.__dict__.update(obj.__dict__)
+        return instance
+
+    @staticmethod
+    def copy_lazy(obj: Any) -> Any:
+        return LazyFieldsLoader.to_instance(obj)
+
+    @staticmethod
+    def deepcopy_lazy(obj: Any, memo: Dict[int, Any]) -> Any:
+        return deepcopy(LazyFieldsLoader.to_instance(obj), memo)
+
+    @staticmethod
+    def reduce_lazy(obj: Any, protocol: int) -> Any:
+        return LazyFieldsLoader.to_instance(obj).__reduce_ex__(protocol)
+
+    @staticmethod
+    def create_lazy_class(b: Type[Any], rule_fields: List[str]) -> Type[Any]:
+        names = set(rule_fields)
+        if is_dataclass(b):
+            names.update(f.name for f in fields(b))
+        else:
+            names.update(name for name in signature(b.__init__).parameters if name != "self")
+        namespace = {name: LazyField(name) for name in names}
+        namespace[LazyFieldsLoader.FIELDS_ATTRIBUTE] = frozenset(names)
+        # Lazy objects pretend to be instances of target class, e.g. for dataclass __eq__ and further mappings
+        namespace["__class__"] = property(lambda self: b)
+        # Copies and pickles are plain instances of target class with all fields loaded
+        namespace["__copy__"] = LazyFieldsLoader.copy_lazy
+        namespace["__deepcopy__"] = LazyFieldsLoader.deepcopy_lazy
+        namespace["__reduce_ex__"] = LazyFieldsLoader.reduce_lazy
+        return type(f"Lazy{b.__name__}", (b,), namespace)
+
+
+class DeferredMappingConfigFlow:
+    """
+    Records mapping configuration calls on register and replays them with MappingConfigFlow
+    when one of mapped types is mapped for the first time.
+    """
+
+    def __init__(self, mapper: "Mapper", a: Union[Type, MappingDescriptor], b: Union[Type, MappingDescriptor]):
+        self.mapper = mapper
+        self.a = a
+        self.b = b
+        self.left = a.type if isinstance(a, MappingDescriptor) else a
+        self.right = b.type if isinstance(b, MappingDescriptor) else b
+        self.calls: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "DeferredMappingConfigFlow"]:
+        if name.startswith("_") or not callable(getattr(MappingConfigFlow, name, None)):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return record
+
+    def register(self) -> None:
+        self.mapper._add_deferred_flow(self)
+
+    def materialize(self) -> None:
+        flow = self.mapper._create_flow(self.a, self.b)
+        for name, args, kwargs in self.calls:
+            getattr(flow, name)(*args, **kwargs)
+        flow.register()
+
+
+def str_to_bytes(s: str) -> bytes:
+    return s.encode("utf-8")
+
+
+def bytes_to_str(b: bytes) -> str:
+    return b.decode("utf-8")
+
+
+def enum_value(member: Enum) -> Any:
+    return member.value
+
+
+def readonly_memoryview(buffer: Any) -> memoryview:
+    """
+    Read-only view sharing memory with buffer, no data is copied.
+    """
+    return memoryview(buffer).toreadonly()
+
+
 class Mapper:
     DEFAULT_DESCRIPTORS: List[Type[MappingDescriptor]] = [
         DictMappingDescriptor,
+        TypedDictMappingDescriptor,
         CommonTypeMappingDescriptor,
     ]
 
@@ -490,18 +1411,175 @@ class Mapper:
         (float, str): str,
         (str, int): int,
         (str, float): float,
-        (str, bytes): lambda s: s.encode("utf-8"),
+        (str, bytes): str_to_bytes,
+        (bytes, memoryview): memoryview,
+        (bytearray, memoryview): readonly_memoryview,
+        (memoryview, memoryview): readonly_memoryview,
+        (array, memoryview): readonly_memoryview,
+        (bytes, bytearray): bytearray,
+        (bytearray, bytes): bytes,
+        (memoryview, bytes): bytes,
+        (memoryview, bytearray): bytearray,
+        (array, bytes): bytes,
+        (bytes, str): bytes_to_str,
+        (str, datetime): datetime.fromisoformat,
+        (datetime, str): datetime.isoformat,
+        (str, date): date.fromisoformat,
+        (date, str): date.isoformat,
+        (str, time): time.fromisoformat,
+        (time, str): time.isoformat,
+        (str, Decimal): Decimal,
+        (int, Decimal): Decimal,
+        (Decimal, str): str,
+        (Decimal, float): float,
+        (str, UUID): UUID,
+        (UUID, str): str,
+    }
+
+    # Iterable types supported as mapping targets and constructors used to build them
+    ITERABLE_TYPES: Dict[Any, Callable[[Iterable[Any]], Any]] = {
+        list: list,
+        set: set,
+        tuple: tuple,
+        frozenset: frozenset,
+        deque: deque,
+        abc.Sequence: list,
+        abc.MutableSequence: list,
+        abc.Set: set,
+        abc.MutableSet: set,
+        abc.Collection: list,
+        abc.Iterable: list,
     }
 
-    def __init__(self, custom_descriptors: Optional[List[Type[MappingDescriptor]]] = None):
+    # Mapping types supported as mapping targets and constructors used to build them
+    MAPPING_TYPES: Dict[Any, Callable[[Iterable[Tuple[Any, Any]]], Any]] = {
+        dict: dict,
+        OrderedDict: OrderedDict,
+        abc.Mapping: dict,
+        abc.MutableMapping: dict,
+    }
+
+    # Number of projections of only and exclude arguments kept with their plans, least recently used are dropped
+    PROJECTIONS_CACHE_SIZE = 128
+
+    # Values of these types are mapped to themselves as is, collections of them are copied without per item mapping
+    IMMUTABLE_TYPES: FrozenSet[Type[Any]] = frozenset({bool, int, float, complex, str, bytes, type(None)})
+
+    def __init__(
+        self,
+        custom_descriptors: Optional[List[Type[MappingDescriptor]]] = None,
+        deferred: bool = False,
+        polymorphic_targets: bool = False,
+        weak_types: bool = False,
+        auto_derive: bool = False,
+        limits: Optional[MappingLimits] = None,
+    ):
+        """
+        With deferred=True registered mappings are only recorded, descriptors are created and mappings are
+        configured on first mapping of one of types. Configuration errors are raised at that moment too.
+
+        Objects of classes without registered mapping are mapped with mapping of the nearest base class.
+        With polymorphic_targets=True mapping to registered subclass of target type is used too, e.g. DogA is mapped
+        to DogB when AnimalB is requested.
+
+        With weak_types=True registered types are referenced weakly and mappings from and to type are removed when
+        type is garbage collected. Descriptors for code generation are not kept and mapping lookup is not cached
+        in this mode.
+
+        With auto_derive=True missing mapping between two classes is registered on first use, if classes have
+        common fields and all required constructor args of target are among them. Fields are matched by name in
+        one direction. Derived mappings are listed by derived_mappings.
+
+        Limits are applied to every map call without own limits, see MappingLimits.
+        """
         self.custom_descriptors = custom_descriptors if custom_descriptors else []
+        self.deferred = deferred
+        self.polymorphic_targets = polymorphic_targets
+        self.weak_types = weak_types
+        self.auto_derive = auto_derive
+        self.limits = limits
+        # Converters of values of primitive types, defaults are copied so they can be changed per mapper
+        self.primitive_converters: Dict[Tuple[Type[Any], Type[Any]], Callable[[Any], Any]] = dict(
+            self.PRIMITIVE_CONVERTERS
+        )
+        self.deferred_flows: Dict[Type[Any], List[DeferredMappingConfigFlow]] = {}
+
+        self.forward_ref_dict: Dict[str, Type[Any]] = WeakValueDictionary() if weak_types else {}
+        self.descriptors: Dict[Type[Any], MappingDescriptor] = {}
+
+        self.map_rules: Dict[Type, Dict[Type, List[FieldMapRule]]] = self._types_dict()
+        self.converters: Dict[Type[Any], Dict[Type[Any], Callable[[Any, Dict[str, Any]], Any]]] = self._types_dict()
+        self.pair_descriptors: Dict[Tuple[Type[Any], Type[Any]], Tuple[MappingDescriptor, MappingDescriptor]] = (
+            self._pairs_dict()
+        )
+        self.caches: Dict[Tuple[Type[Any], Type[Any]], MappingCache] = self._pairs_dict()
+        self.batch_rules: Dict[Tuple[Type[Any], Type[Any]], List[FieldMapRule]] = self._pairs_dict()
+        self.blocking_rules: Dict[Tuple[Type[Any], Type[Any]], List[FieldMapRule]] = self._pairs_dict()
+        # Registered mapping used for class of source object and target type, see _dispatch
+        self.dispatch_cache: Dict[Tuple[Type[Any], Any], Optional[Tuple[Type[Any], Any, int]]] = {}
+        self.lazy_classes: Dict[Tuple[Type[Any], Type[Any]], Optional[Type[Any]]] = self._pairs_dict()
+        self.projections = MappingCache(self.PROJECTIONS_CACHE_SIZE)
+        self.projection_plans: Dict[Tuple[Type[Any], Type[Any], Projection], Tuple[List[FieldMapRule], List[str]]] = (
+            self._pairs_dict()
+        )
+        # Map rules and converters of parent mapper at the moment of deriving, see derive
+        self.inherited_registries: Optional[Tuple[abc.Mapping, abc.Mapping]] = None
+        # Pairs seen with auto_derive: True if mapping was derived, False if types are not compatible
+        self.derived_pairs: Dict[Tuple[Type[Any], Type[Any]], bool] = self._pairs_dict()
 
-        self.forward_ref_dict: Dict[str, Type[Any]] = {}
+    def _types_dict(self, items: Any = ()) -> Dict[Any, Any]:
+        return WeakKeyDictionary(items) if self.weak_types else dict(items)
 
-        self.map_rules: Dict[Type, Dict[Type, List[FieldMapRule]]] = {}
-        self.converters: Dict[Type[Any], Dict[Type[Any], Callable[[Any, Dict[str, Any]], Any]]] = {}
+    def _pairs_dict(self, items: Any = ()) -> Dict[Any, Any]:
+        return WeakPairDictionary(items) if self.weak_types else dict(items)
+
+    def derive(self) -> "Mapper":
+        """
+        Create child mapper with all mappings of this mapper. Rules, descriptors and compiled plans are not copied or
+        created again: child gets own layers over shallow snapshots of parent registries, parent is not changed.
+        Snapshot of child not changed since deriving is reused by its own children. Mappings registered in child,
+        including replaced mappings of parent, are not visible to parent and mappings registered in parent later are
+        not visible to child. Child has own empty result caches and mapping lookup cache. Deferred mappings of parent
+        are configured before deriving.
+        """
+        while self.deferred_flows:
+            self._materialize_deferred(next(iter(self.deferred_flows)))
+
+        child = Mapper(
+            self.custom_descriptors,
+            self.deferred,
+            self.polymorphic_targets,
+            self.weak_types,
+            self.auto_derive,
+            self.limits,
+        )
+        registries = [
+            ("forward_ref_dict", (lambda: WeakValueDictionary()) if self.weak_types else dict),
+            ("primitive_converters", dict),
+            ("descriptors", dict),
+            ("map_rules", self._types_dict),
+            ("converters", self._types_dict),
+            ("pair_descriptors", self._pairs_dict),
+            ("caches", self._pairs_dict),
+            ("batch_rules", self._pairs_dict),
+            ("blocking_rules", self._pairs_dict),
+            ("lazy_classes", self._pairs_dict),
+            ("derived_pairs", self._pairs_dict),
+        ]
+        for name, factory in registries:
+            base = LayeredDictionary.snapshot(getattr(self, name), factory)
+            setattr(child, name, LayeredDictionary(base, factory))
+        # Child gets empty caches for cached mappings of parent on first use
+        child.caches.copy_value = lambda cache: type(cache)(cache.maxsize, cache.context_keys)
+        child.inherited_registries = (child.map_rules.base, child.converters.base)
+        return child
 
     def mapping(self, a: Union[Type, MappingDescriptor], b: Union[Type, MappingDescriptor]) -> MappingConfigFlow:
+        if self.deferred:
+            return DeferredMappingConfigFlow(self, a, b)
+        return self._create_flow(a, b)
+
+    def _create_flow(self, a: Union[Type, MappingDescriptor], b: Union[Type, MappingDescriptor]) -> MappingConfigFlow:
         if not isinstance(a, MappingDescriptor):
             a = self._wrap_type_to_descriptor(a)
         if not isinstance(b, MappingDescriptor):
@@ -509,31 +1587,207 @@ class Mapper:
         return MappingConfigFlow(self, a, b)
 
     def _wrap_type_to_descriptor(self, t: Type[Any]):
+        # Descriptors are shared by all mappings of type, so field descriptors are created once per field.
+        # Weakly referenced types are not cached, as descriptor references its type.
+        descriptor = self.descriptors.get(t)
+        if descriptor is not None:
+            return descriptor
         for d in self.custom_descriptors + self.DEFAULT_DESCRIPTORS:
             if d.supports_type(t):
-                return d(t)
+                descriptor = d(t)
+                break
         else:
             raise Exception(f"Cannot found descriptor for type '{t}'")
+        if not self.weak_types:
+            self.descriptors[t] = descriptor
+        return descriptor
 
-    def _add_map_rules(self, a: Type, b: Type, rules: List[FieldMapRule]):
-        a_type_mappings = self.map_rules.setdefault(a, {})
-        a_type_converters = self.converters.setdefault(a, {})
-        if b in a_type_mappings or b in a_type_converters:
-            raise DuplicateMappingException(MappingExceptionInfo(a, b))
+    def _add_deferred_flow(self, flow: DeferredMappingConfigFlow):
+        for t in {flow.left, flow.right}:
+            self.deferred_flows.setdefault(t, []).append(flow)
+            self._add_class_to_forward_ref_dict(t)
 
-        a_type_mappings[b] = rules
+    def _materialize_deferred(self, t: Type[Any]):
+        """
+        Configure all deferred mappings from and to type t
+        """
+        for flow in self.deferred_flows.pop(t, []):
+            for other in {flow.left, flow.right}.difference({t}):
+                other_flows = self.deferred_flows.get(other, [])
+                if flow in other_flows:
+                    other_flows.remove(flow)
+                if not other_flows:
+                    self.deferred_flows.pop(other, None)
+            flow.materialize()
+
+    def _materialize_deferred_sources(self, a: Type[Any]):
+        """
+        Configure all deferred mappings which can be used for objects of type a, i.e. mappings of a and its base
+        classes. Instances of TypedDict are plain dicts, so deferred mappings of all TypedDicts are configured for
+        dicts.
+        """
+        for source in a.__mro__:
+            if source in self.deferred_flows:
+                self._materialize_deferred(source)
+        if a is dict:
+            for t in [t for t in self.deferred_flows if TypedDictMappingDescriptor.supports_type(t)]:
+                self._materialize_deferred(t)
+
+    def _add_map_rules(
+        self,
+        a: Type,
+        b: Type,
+        rules: List[FieldMapRule],
+        descriptors: Optional[Tuple[MappingDescriptor, MappingDescriptor]] = None,
+    ):
+        self._check_new_pair(a, b)
+        # Inner dicts may be shared with derived mappers, so they are replaced instead of updated in place
+        self.map_rules[a] = self._types_dict({**self.map_rules.get(a, {}), b: rules})
+        self.converters.setdefault(a, self._types_dict())
+        batch_rules = [rule for rule in rules if rule.batch_converter is not None]
+        if batch_rules:
+            self.batch_rules[(a, b)] = batch_rules
+        blocking_rules = [rule for rule in rules if rule.blocking]
+        if blocking_rules:
+            self.blocking_rules[(a, b)] = blocking_rules
+        if descriptors is not None and not self.weak_types:
+            self.pair_descriptors[(a, b)] = descriptors
         self._add_class_to_forward_ref_dict(a)
         self._add_class_to_forward_ref_dict(b)
+        self.clear_caches()
+        self.dispatch_cache.clear()
 
     def _add_converter(self, a: Type[L], b: Type[R], converter: Callable[[L, Dict[str, Any]], R]):
-        a_type_mappings = self.map_rules.setdefault(a, {})
-        a_type_converters = self.converters.setdefault(a, {})
-        if b in a_type_mappings or b in a_type_converters:
-            raise DuplicateMappingException(MappingExceptionInfo(a, b))
-
-        a_type_converters[b] = converter
+        self._check_new_pair(a, b)
+        self.map_rules.setdefault(a, self._types_dict())
+        self.converters[a] = self._types_dict({**self.converters.get(a, {}), b: converter})
         self._add_class_to_forward_ref_dict(a)
         self._add_class_to_forward_ref_dict(b)
+        self.clear_caches()
+        self.dispatch_cache.clear()
+
+    def _check_new_pair(self, a: Type[Any], b: Type[Any]):
+        if self._is_inherited_pair(a, b):
+            self._remove_pair(a, b)
+        elif b in self.map_rules.get(a, ()) or b in self.converters.get(a, ()):
+            raise DuplicateMappingException(MappingExceptionInfo(a, b))
+
+    def _is_inherited_pair(self, a: Type[Any], b: Type[Any]) -> bool:
+        """
+        Check that mapping from a to b is inherited from parent mapper and not replaced yet, see derive
+        """
+        if self.inherited_registries is None:
+            return False
+        for registry, inherited in zip((self.map_rules, self.converters), self.inherited_registries):
+            value = registry.get(a, {}).get(b)
+            if value is not None and value is inherited.get(a, {}).get(b):
+                return True
+        return False
+
+    def _remove_pair(self, a: Type[Any], b: Type[Any]):
+        for registry in (self.map_rules, self.converters):
+            if b in registry.get(a, ()):
+                registry[a] = self._types_dict({t: v for t, v in registry[a].items() if t != b})
+        for pair_registry in (self.pair_descriptors, self.caches, self.batch_rules, self.blocking_rules):
+            pair_registry.pop((a, b), None)
+        self.lazy_classes.pop((a, b), None)
+        self.derived_pairs.pop((a, b), None)
+        self.projection_plans = self._pairs_dict(
+            (key, plan) for key, plan in self.projection_plans.items() if key[:2] != (a, b)
+        )
+        self.clear_caches()
+        self.dispatch_cache.clear()
+
+    def unregister(self, a: Type[Any], b: Type[Any]) -> None:
+        """
+        Remove mapping from a to b. Mapping from b to a registered with the same flow is kept.
+        """
+        if self.deferred_flows and a in self.deferred_flows:
+            self._materialize_deferred(a)
+        if b not in self.map_rules.get(a, ()) and b not in self.converters.get(a, ()):
+            raise MissingMappingException(MappingExceptionInfo(a, b), a, b)
+        self._remove_pair(a, b)
+
+    def memory_report(self) -> MemoryReport:
+        """
+        Return sizes of registries. Size of types, converters and cached values themselves is not included.
+        """
+        seen: Set[int] = set()
+        size = 0
+
+        def add(obj: Any) -> None:
+            nonlocal size
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                size += sys.getsizeof(obj) + (sys.getsizeof(obj.data) if hasattr(obj, "data") else 0)
+
+        pairs = set()
+        field_descriptors = set()
+        rules_count = 0
+        for registry in (self.map_rules, self.converters):
+            add(registry)
+            for a, targets in registry.items():
+                add(targets)
+                pairs.update((a, b) for b in targets)
+        for targets in self.map_rules.values():
+            for rules in targets.values():
+                add(rules)
+                rules_count += len(rules)
+                for rule in rules:
+                    add(rule)
+                    for f in (rule.from_field, rule.to_field):
+                        add(f)
+                        field_descriptors.add(id(f))
+        for registry in (
+            self.forward_ref_dict,
+            self.descriptors,
+            self.pair_descriptors,
+            self.caches,
+            self.batch_rules,
+            self.blocking_rules,
+            self.dispatch_cache,
+            self.lazy_classes,
+            self.projection_plans,
+        ):
+            add(registry)
+
+        return MemoryReport(
+            types=len({t for pair in pairs for t in pair}),
+            pairs=len(pairs),
+            rules=rules_count,
+            field_descriptors=len(field_descriptors),
+            cached_results=sum(len(cache.values) for cache in self.caches.values()),
+            prepared_plans=len(self.dispatch_cache) + len(self.lazy_classes) + len(self.projection_plans),
+            size=size,
+        )
+
+    def register_primitive_converter(self, a: Type[L], b: Type[R], converter: Callable[[L], R]) -> None:
+        """
+        Register converter of values of type a to type b, replacing default one. Converter is used for subclasses
+        of a too, mappings registered for a and b take precedence.
+        """
+        self.primitive_converters[(a, b)] = converter
+        self.clear_caches()
+        self.dispatch_cache.clear()
+
+    def _add_cache(self, a: Type[Any], b: Type[Any], cache: MappingCache):
+        if self.weak_types:
+            cache = WeakMappingCache(cache.maxsize, cache.context_keys)
+        self.caches[(a, b)] = cache
+
+    def cache_info(self, a: Type[Any], b: Type[Any]) -> Optional[CacheInfo]:
+        """
+        Return statistics of result cache for mapping from a to b or None if mapping is not cached
+        """
+        cache = self.caches.get((a, b))
+        return cache.info() if cache is not None else None
+
+    def clear_caches(self) -> None:
+        """
+        Drop all cached mapping results. Called automatically when mappings are registered or removed.
+        """
+        for cache in self.caches.values():
+            cache.clear()
 
     def _add_class_to_forward_ref_dict(self, t: Type):
         if hasattr(t, "__name__"):
@@ -566,27 +1820,394 @@ class Mapper:
             return t
 
     def map(
-        self, a_obj: Any, b: Type[T], context: Dict[str, Any] = None, *, exc_info: Optional[MappingExceptionInfo] = None
+        self,
+        a_obj: Any,
+        b: Type[T],
+        context: Dict[str, Any] = None,
+        *,
+        memoize: bool = False,
+        lazy: bool = False,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        max_depth: Optional[int] = None,
+        executor: Optional["Executor"] = None,
+        iterative: bool = False,
+        limits: Optional[MappingLimits] = None,
+        exc_info: Optional[MappingExceptionInfo] = None,
+        state: Optional[MappingState] = None,
     ) -> T:
-        a = a_obj.__class__
+        """
+        Map object to type b.
+
+        With memoize=True every source object is mapped to each target type only once per call: shared source
+        objects stay shared in the result and cyclic references are supported, except references inside tuples, sets
+        and dict keys.
+
+        With lazy=True objects mapped with map rules are created without calling constructor and each field is
+        mapped on first access. Source object and context are kept until all fields are accessed. Targets without
+        instance dict, e.g. dicts and classes with slots, are mapped eagerly.
+
+        With executor set, fields with blocking converters are converted concurrently in the executor: conversions
+        of an object, or of all items of a list, are submitted at once and joined in fields order. Other mapping is
+        done in calling thread.
+
+        With iterative=True nested objects and collections are mapped with explicit stack instead of recursion,
+        so depth of mapped structures is not limited by recursion limit. Results and errors are the same.
+
+        Limits override limits of mapper, MappingLimitExceededException is raised when one of them is exceeded.
+        """
         if context is None:
             context = {}
         if exc_info is None:
-            exc_info = MappingExceptionInfo(a, b)
+            exc_info = MappingExceptionInfo(a_obj.__class__, b)
+        if state is None:
+            state = MappingState(
+                memo={} if memoize else None,
+                lazy=lazy,
+                projection=self._get_projection(only, exclude) if only is not None or exclude else None,
+                max_depth=max_depth,
+                executor=executor,
+                iterative=iterative,
+                limits=self._limits_tracker(limits),
+            )
+
+        done, result = self._map_step(a_obj, b, context, exc_info, state)
+        return result if done else self._run(result)
 
-        if self._has_converter(a, b):
-            return self._convert_with_converter(a_obj, b, context, exc_info)
-        elif self._has_mapping_rules(a, b):
-            return self._map_with_map_rules(a_obj, b, context, exc_info)
+    def _map_step(
+        self, a_obj: Any, b: Type[Any], context: Dict[str, Any], exc_info: MappingExceptionInfo, state: MappingState
+    ) -> Tuple[bool, Any]:
+        """
+        Map object to type b. Returns (True, value) if object is mapped right away or, in iterative mode, (False,
+        generator) for objects with nested values. Generator yields generators of nested values mapping and receives
+        their results, see `_run`. Without iterative mode nested values are mapped with recursive calls.
+        """
+        a = a_obj.__class__
+        if self.deferred_flows:
+            self._materialize_deferred_sources(a)
+
+        dispatch = self._dispatch(a, b)
+        if dispatch is not None:
+            source, target, kind = dispatch
+            if kind == DISPATCH_MAP_RULES:
+                if state.iterative:
+                    return False, self._iter_map_with_map_rules(a_obj, target, context, exc_info, state, source)
+                return True, self._map_with_map_rules(a_obj, target, context, exc_info, state, source)
+            elif kind == DISPATCH_CONVERTER:
+                return True, self._convert_with_converter(a_obj, target, context, exc_info, state, source)
+            return True, self._map_primitives(a_obj, target, exc_info)
+        elif a in self.IMMUTABLE_TYPES and (a is b or b is Any):
+            return True, a_obj
         elif self._is_iterable_mapping_possible(a, b):
-            return self._map_iterables(a_obj, b, context, exc_info)
-        elif self._has_primitive_mapping(a, b):
-            return self._map_primitives(a_obj, b, exc_info)
+            if state.iterative:
+                return False, self._iter_map_iterables(a_obj, b, context, exc_info, state)
+            return True, self._map_iterables(a_obj, b, context, exc_info, state)
+        elif self._is_mapping_mapping_possible(a, b):
+            if state.iterative:
+                return False, self._iter_map_mappings(a_obj, b, context, exc_info, state)
+            return True, self._map_mappings(a_obj, b, context, exc_info, state)
         elif self._is_direct_assignment_possible(a, b):
-            return deepcopy(a_obj)
+            if a in self.IMMUTABLE_TYPES:
+                return True, a_obj
+            if a is memoryview:
+                # memoryview cannot be deep copied, view of the same memory is shared instead
+                return True, a_obj.toreadonly()
+            if state.limits is not None:
+                self._check_copied_value_limits(a_obj, exc_info, state)
+            return True, deepcopy(a_obj)
+        elif self.auto_derive and self._derive_mapping(a, b):
+            if state.iterative:
+                return False, self._iter_map_with_map_rules(a_obj, b, context, exc_info, state)
+            return True, self._map_with_map_rules(a_obj, b, context, exc_info, state)
         else:
             raise MissingMappingException(exc_info, a, b)
 
+    @staticmethod
+    def _check_copied_value_limits(a_obj: Any, exc_info: MappingExceptionInfo, state: MappingState) -> None:
+        """
+        Apply limits to collections nested in value which is deep copied as is, e.g. value of field typed as Any.
+        Value is walked without recursion, so limits are checked before deepcopy reaches recursion limit.
+        """
+        if not Mapper._is_walked_collection(a_obj):
+            return
+        seen: Set[int] = set()
+        stack = [(a_obj, state.limits_depth())]
+        while stack:
+            value, depth = stack.pop()
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            items = [*value.keys(), *value.values()] if isinstance(value, abc.Mapping) else list(value)
+            state.limits.check(len(value), depth, exc_info)
+            state.limits.check_size(items, exc_info)
+            stack.extend((item, depth + 1) for item in items if Mapper._is_walked_collection(item))
+
+    @staticmethod
+    def _is_walked_collection(value: Any) -> bool:
+        return isinstance(value, abc.Collection) and not isinstance(value, (str, bytes, bytearray))
+
+    def derived_mappings(self) -> List[Tuple[Type[Any], Type[Any]]]:
+        """
+        Return pairs of types with mappings registered automatically, see auto_derive
+        """
+        return [pair for pair, derived in self.derived_pairs.items() if derived]
+
+    def _derive_mapping(self, a: Type[Any], b: Any) -> bool:
+        """
+        Register mapping from a to b matching fields by name if types are compatible. Returns False otherwise.
+        For unions mapping to the first compatible member is registered, e.g. to Inner for Optional[Inner].
+        """
+        if is_union_type(b):
+            return any(self._derive_mapping(a, self._resolve_forward_ref(t)) for t in get_args(b))
+        if (a, b) in self.derived_pairs:
+            return self.derived_pairs[(a, b)]
+        derived = False
+        if (
+            isinstance(b, type)
+            and a not in self.IMMUTABLE_TYPES
+            and b not in self.IMMUTABLE_TYPES
+            and not issubclass(a, Enum)
+            and not issubclass(b, Enum)
+        ):
+            try:
+                flow = self._create_flow(a, b)
+            except (TypeError, ValueError):
+                # Signature of some builtin types is not available
+                flow = None
+            if (
+                flow is not None
+                and not flow.left_descriptor.is_container_type()
+                and not flow.right_descriptor.is_container_type()
+            ):
+                common_fields = flow.left_descriptor.get_declared_fields() & flow.right_descriptor.get_declared_fields()
+                if common_fields and flow.right_descriptor.get_required_constructor_args() <= common_fields:
+                    for f in sorted(common_fields):
+                        flow.l_to_r(f, f)
+                    flow.register()
+                    derived = True
+        self.derived_pairs[(a, b)] = derived
+        return derived
+
+    def _dispatch(self, a: Type[Any], b: Any) -> Optional[Tuple[Type[Any], Any, int]]:
+        """
+        Find registered mapping or primitive converter for objects of class a mapped to b. Returns source class,
+        target type of mapping and its kind, for primitive conversions converter is returned instead of target type.
+        None means that mapping is not registered. Result is cached until new mappings are registered.
+        """
+        if self.weak_types:
+            return self._find_dispatch(a, b)
+        key = (a, b)
+        try:
+            return self.dispatch_cache[key]
+        except KeyError:
+            pass
+        dispatch = self.dispatch_cache[key] = self._find_dispatch(a, b)
+        return dispatch
+
+    def _find_dispatch(self, a: Type[Any], b: Any) -> Optional[Tuple[Type[Any], Any, int]]:
+        for source in a.__mro__:
+            if self._has_converter(source, b):
+                return source, b, DISPATCH_CONVERTER
+            if self._has_mapping_rules(source, b):
+                return source, b, DISPATCH_MAP_RULES
+            if self.polymorphic_targets and isinstance(b, type):
+                for target in self.converters.get(source, ()):
+                    if isinstance(target, type) and self._is_subclass(target, b):
+                        return source, target, DISPATCH_CONVERTER
+                for target in self.map_rules.get(source, ()):
+                    if isinstance(target, type) and self._is_subclass(target, b):
+                        return source, target, DISPATCH_MAP_RULES
+        if a is dict:
+            # Instances of TypedDict are plain dicts
+            sources = [
+                source
+                for source, targets in self.map_rules.items()
+                if b in targets and TypedDictMappingDescriptor.supports_type(source)
+            ]
+            if len(sources) == 1:
+                return sources[0], b, DISPATCH_MAP_RULES
+        converter = self._find_primitive_converter(a, b)
+        if converter is not None:
+            return a, converter, DISPATCH_PRIMITIVE
+        return None
+
+    def _find_primitive_converter(self, a: Type[Any], b: Any) -> Optional[Callable[[Any], Any]]:
+        """
+        Return converter registered for a or the nearest base class of a, or converter of enum members to their
+        values and back. None if values of a cannot be converted to b. Enum members which are already instances
+        of b are not converted, and bool values are not converted with converters of int.
+        """
+        if not isinstance(a, type) or not isinstance(b, type):
+            return None
+        a_is_enum = issubclass(a, Enum)
+        b_is_enum = issubclass(b, Enum)
+        if a_is_enum and not b_is_enum:
+            if issubclass(a, b):
+                return None
+            value_types = {member.value.__class__ for member in a}
+            if value_types and all(issubclass(t, b) for t in value_types):
+                return enum_value
+            if len(value_types) == 1:
+                value_converter = self._find_primitive_converter(value_types.pop(), b)
+                if value_converter is not None:
+                    return lambda member: value_converter(member.value)
+            return None
+        if b_is_enum and not a_is_enum:
+            # Enum call looks members up by value
+            return b if any(issubclass(a, member.value.__class__) for member in b) else None
+        for source in a.__mro__:
+            if source is int and issubclass(a, bool):
+                break
+            converter = self.primitive_converters.get((source, b))
+            if converter is not None:
+                return converter
+        return None
+
+    @staticmethod
+    def _run(steps: Generator[Any, Any, Any]) -> Any:
+        """
+        Run mapping generator returned by `_map_step` in iterative mode with explicit stack. Generator yields
+        generators of nested values, their results are sent back and their exceptions are thrown into generator at
+        the yield, so it can wrap them.
+        """
+        stack = [steps]
+        value = error = None
+        while True:
+            try:
+                nested = stack[-1].send(value) if error is None else stack[-1].throw(error)
+            except StopIteration as stop:
+                stack.pop()
+                if not stack:
+                    return stop.value
+                value, error = stop.value, None
+                continue
+            except Exception as e:
+                stack.pop()
+                if not stack:
+                    raise
+                value, error = None, e
+                continue
+            stack.append(nested)
+            value = error = None
+
+    def warm_up(self) -> None:
+        """
+        Configure all deferred mappings, resolve field types of all map rules and check that nested mappings are
+        defined. With auto_derive missing nested mappings are derived. Mappings found for registered pairs and their
+        field types, union members and collection items are cached, so first map call does not look them up. All
+        found problems are raised at once with MappingValidationException.
+        """
+        errors: List[str] = []
+
+        while self.deferred_flows:
+            try:
+                self._materialize_deferred(next(iter(self.deferred_flows)))
+            except Exception as e:
+                errors.append(str(e))
+
+        checked: Set[Tuple[Type[Any], Type[Any]]] = set()
+        while True:
+            # With auto_derive nested pairs are registered while checking, their rules are checked on next pass
+            pairs = [
+                (a, b, rules)
+                for a, a_type_mappings in list(self.map_rules.items())
+                for b, rules in list(a_type_mappings.items())
+                if (a, b) not in checked
+            ]
+            if not pairs:
+                break
+            for a, b, rules in pairs:
+                checked.add((a, b))
+                if isinstance(a, type):
+                    self._dispatch(a, b)
+                for rule in rules:
+                    chains = ([rule.from_field.name], [rule.to_field.name])
+                    try:
+                        from_field_type = self._resolve_forward_ref(rule.from_field.type)
+                        to_field_type = self._resolve_forward_ref(rule.to_field.type)
+                    except Exception as e:
+                        errors.append(str(MappingException(str(e), MappingExceptionInfo(a, b, *chains))))
+                        continue
+
+                    if not rule.has_converter():
+                        exc_info = MappingExceptionInfo(from_field_type, to_field_type, *chains)
+                        errors.extend(self._find_static_problems(from_field_type, to_field_type, exc_info))
+
+        if errors:
+            raise MappingValidationException(list(dict.fromkeys(errors)))
+
+    def _find_static_problems(self, a: Type[Any], b: Type[Any], exc_info: MappingExceptionInfo) -> List[str]:
+        """
+        Check that values of declared type a can be mapped to type b. Returns list of problems descriptions.
+        """
+        try:
+            a = self._resolve_forward_ref(a)
+            b = self._resolve_forward_ref(b)
+        except Exception as e:
+            return [str(MappingException(str(e), exc_info))]
+
+        if a is Any or b is Any or a is type(None):
+            return []
+        a_class = a if isinstance(a, type) else get_origin(a)
+        if isinstance(a_class, type):
+            # Dispatch result is cached, so it is ready before first map call
+            dispatch = self._dispatch(a_class, b)
+            if dispatch is not None and a_class is a:
+                return []
+        if is_union_type(a):
+            return [problem for t in get_args(a) for problem in self._find_static_problems(t, b, exc_info)]
+        if is_union_type(b):
+            if any(not self._find_static_problems(a, t, exc_info) for t in get_args(b)):
+                return []
+            return [str(MappingException(f"Not found matching class in union {b}", exc_info))]
+
+        if self._has_converter(a, b) or self._has_mapping_rules(a, b):
+            return []
+        if self._is_iterable_mapping_possible(a, b):
+            a_args = self._iterable_items_types(a)
+            b_args = self._iterable_items_types(b)
+            if len(b_args) == 0:
+                return []
+            elif len(b_args) == 1:
+                return self._find_static_problems(a_args[0] if len(a_args) == 1 else Any, b_args[0], exc_info)
+            else:
+                return [
+                    problem
+                    for a_arg, b_arg in zip(a_args, b_args)
+                    for problem in self._find_static_problems(a_arg, b_arg, exc_info)
+                ]
+        if self._is_mapping_mapping_possible(a, b):
+            a_args = get_args(a) if len(get_args(a)) == 2 else (Any, Any)
+            return [
+                problem
+                for a_arg, b_arg in zip(a_args, get_args(b))
+                for problem in self._find_static_problems(a_arg, b_arg, exc_info)
+            ]
+        if self._has_primitive_mapping(a, b):
+            return []
+        try:
+            if self._is_direct_assignment_possible(a, b):
+                return []
+        except TypeError:
+            # Not a class, e.g. unsupported generic
+            pass
+        if self.auto_derive and isinstance(a, type) and self._derive_mapping(a, b):
+            return []
+        return [str(MissingMappingException(exc_info, a, b))]
+
+    def generate_source(self, path: Optional[str] = None) -> str:
+        """
+        Generate python module with a function for each registered mapping pair, see panamap.codegen.
+        Source is written to path if it is set and returned.
+        """
+        from panamap.codegen import SourceGenerator
+
+        source = SourceGenerator(self).generate()
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(source)
+        return source
+
     def _has_converter(self, a: Type[Any], b: Type[Any]) -> bool:
         if a not in self.converters:
             return False
@@ -602,14 +2223,22 @@ class Mapper:
             return b in self.converters[a]
 
     def _convert_with_converter(
-        self, a_obj: Any, b: Type[Any], context: Dict[str, Any], exc_info: MappingExceptionInfo
+        self,
+        a_obj: Any,
+        b: Type[Any],
+        context: Dict[str, Any],
+        exc_info: MappingExceptionInfo,
+        state: MappingState,
+        a: Optional[Type[Any]] = None,
     ):
-        a = a_obj.__class__
+        if a is None:
+            a = a_obj.__class__
 
         if is_union_type(b):
             for to_class in get_args(b):
                 to_class = self._resolve_forward_ref(to_class)
                 if to_class in self.converters[a]:
+                    b = to_class
                     converter = self.converters[a][to_class]
                     break
             else:
@@ -617,11 +2246,29 @@ class Mapper:
         else:
             converter = self.converters[a][b]
 
+        if state.memo is not None:
+            memo_key = (id(a_obj), b)
+            if memo_key in state.memo:
+                return state.memo[memo_key][1]
+
+        cache = self.caches.get((a, b)) if self.caches else None
+        cache_key = cache.make_key(a_obj, context) if cache is not None else None
+        if cache_key is not None:
+            found, b_obj = cache.get(cache_key)
+            if found:
+                return b_obj
+
         try:
-            return converter(a_obj, context)
+            b_obj = converter(a_obj, context)
         except Exception as e:
             raise FieldMappingException(exc_info, "Error on converting") from e
 
+        if cache_key is not None:
+            cache.put(cache_key, b_obj)
+        if state.memo is not None:
+            state.memo[memo_key] = (a_obj, b_obj)
+        return b_obj
+
     def _has_mapping_rules(self, a: Type[Any], b: Type[Any]) -> bool:
         if a not in self.map_rules:
             return False
@@ -636,13 +2283,76 @@ class Mapper:
         else:
             return b in self.map_rules[a]
 
-    def _map_with_map_rules(self, a_obj: Any, b: Type[Any], context: Dict[str, Any], exc_info: MappingExceptionInfo):
-        a = a_obj.__class__
+    def _map_with_map_rules(
+        self,
+        a_obj: Any,
+        b: Type[Any],
+        context: Dict[str, Any],
+        exc_info: MappingExceptionInfo,
+        state: MappingState,
+        a: Optional[Type[Any]] = None,
+    ):
+        """
+        Map a_obj to b with registered map rules. Rules of type a are applied if it is set, that allows to map objects
+        of other classes with compatible layout, e.g. plain tuples as rows.
+        """
+        if state.iterative:
+            return self._run(self._iter_map_with_map_rules(a_obj, b, context, exc_info, state, a))
+        done, job = self._start_map_with_map_rules(a_obj, b, context, exc_info, state, a)
+        if done:
+            return job
+
+        values = []
+        for rule in job[1]:
+            values.append(self._map_field_step(a_obj, rule, context, exc_info, state)[1])
+        return self._finish_map_with_map_rules(a_obj, job, values, exc_info, state)
+
+    def _iter_map_with_map_rules(
+        self,
+        a_obj: Any,
+        b: Type[Any],
+        context: Dict[str, Any],
+        exc_info: MappingExceptionInfo,
+        state: MappingState,
+        a: Optional[Type[Any]] = None,
+    ) -> Generator[Any, Any, Any]:
+        """
+        Same as `_map_with_map_rules` for iterative mode, nested values are yielded as generators
+        """
+        done, job = self._start_map_with_map_rules(a_obj, b, context, exc_info, state, a)
+        if done:
+            return job
+
+        values = []
+        for rule in job[1]:
+            done, value = self._map_field_step(a_obj, rule, context, exc_info, state)
+            if not done:
+                value = yield value
+            values.append(value)
+        return self._finish_map_with_map_rules(a_obj, job, values, exc_info, state)
+
+    def _start_map_with_map_rules(
+        self,
+        a_obj: Any,
+        b: Type[Any],
+        context: Dict[str, Any],
+        exc_info: MappingExceptionInfo,
+        state: MappingState,
+        a: Optional[Type[Any]],
+    ) -> Tuple[bool, Any]:
+        """
+        Select map rules of a_obj and return (True, result) if result is known without mapping fields, e.g. cached.
+        Otherwise returns (False, job) where job is tuple of target type, map rules to apply, required constructor
+        args set to None by projection, memo key, pending reference, cache and cache key.
+        """
+        if a is None:
+            a = a_obj.__class__
 
         if is_union_type(b):
             for to_class in get_args(b):
+                to_class = self._resolve_forward_ref(to_class)
                 if to_class in self.map_rules[a]:
-                    to_class = self._resolve_forward_ref(to_class)
+                    b = to_class
                     map_rules = self.map_rules[a][to_class]
                     break
             else:
@@ -650,29 +2360,73 @@ class Mapper:
         else:
             map_rules = self.map_rules[a][b]
 
-        constructor_args = {}
+        if state.limits is not None:
+            state.limits.check(1, state.limits_depth(), exc_info)
+
+        none_args: List[str] = []
+        if state.is_partial():
+            if state.max_depth is not None and state.depth > state.max_depth:
+                return True, SKIPPED_FIELD
+            if state.projection is not None:
+                map_rules, none_args = self._get_projection_plan(a, b, map_rules, state.projection)
+
+        memo_key = None
+        if state.memo is not None:
+            memo_key = (id(a_obj), b)
+            if memo_key in state.memo:
+                return True, state.memo[memo_key][1]
+
+        cache = self.caches.get((a, b)) if self.caches and not state.is_partial() else None
+        cache_key = cache.make_key(a_obj, context) if cache is not None else None
+        if cache_key is not None:
+            found, b_obj = cache.get(cache_key)
+            if found:
+                return True, b_obj
+
+        # Lazy class declares all mapped fields, fields excluded by projection are loaded as defaults
+        lazy_class = self._get_lazy_class(a, b, self.map_rules[a][b]) if state.lazy else None
+        if lazy_class is not None:
+            b_obj = self._map_lazy(a_obj, b, lazy_class, map_rules, context, exc_info, state)
+            if cache_key is not None:
+                cache.put(cache_key, b_obj)
+            if state.memo is not None:
+                state.memo[memo_key] = (a_obj, b_obj)
+            return True, b_obj
+
+        pending = None
+        if state.memo is not None:
+            pending = PendingReference()
+            state.memo[memo_key] = (a_obj, pending)
+
+        if state.executor is not None and (a, b) in self.blocking_rules:
+            self._submit_blocking_conversions((a_obj,), b, state, a)
+
+        return False, (b, map_rules, none_args, memo_key, pending, cache, cache_key)
+
+    def _finish_map_with_map_rules(
+        self, a_obj: Any, job: Tuple[Any, ...], values: List[Any], exc_info: MappingExceptionInfo, state: MappingState
+    ) -> Any:
+        """
+        Create target object of job from mapped values of its map rules
+        """
+        b, map_rules, none_args, memo_key, pending, cache, cache_key = job
+        constructor_args = dict.fromkeys(none_args)
         fields = []
+        pending_fields = []
 
-        for rule in map_rules:
-            from_field_type = self._resolve_forward_ref(rule.from_field.type)
-            to_field_type = self._resolve_forward_ref(rule.to_field.type)
-            fields_exc_info = MappingExceptionInfo(
-                from_field_type,
-                to_field_type,
-                exc_info.a_fields_chain + [rule.from_field.name],
-                exc_info.b_fields_chain + [rule.to_field.name],
-            )
-            field_value = rule.from_field.getter(a_obj)
-            if field_value is None and not rule.to_field.is_required_constructor_arg:
+        for rule, value in zip(map_rules, values):
+            if value is SKIPPED_FIELD:
+                if rule.to_field.is_required_constructor_arg:
+                    constructor_args[rule.to_field.name] = None
                 continue
 
-            if rule.converter is not None:
-                try:
-                    value = rule.converter(field_value)
-                except Exception as e:
-                    raise FieldMappingException(fields_exc_info, "Error on value conversion") from e
-            else:
-                value = self.map(field_value, to_field_type, context, exc_info=fields_exc_info)
+            if isinstance(value, PendingReference):
+                if rule.to_field.setter is None:
+                    raise FieldMappingException(
+                        self._field_exc_info(rule, exc_info), "Cannot resolve cyclic reference for field without setter"
+                    )
+                pending_fields.append((value, rule.to_field.setter))
+                value = None
 
             if rule.to_field.is_constructor_arg:
                 constructor_args[rule.to_field.name] = value
@@ -684,72 +2438,645 @@ class Mapper:
             setter, value = op
             setter(b_obj, value)
 
+        for field_pending, setter in pending_fields:
+            field_pending.waiters.append((b_obj, setter))
+
+        if cache_key is not None:
+            cache.put(cache_key, b_obj)
+        if pending is not None:
+            state.memo[memo_key] = (a_obj, b_obj)
+            try:
+                pending.resolve(b_obj)
+            except Exception as e:
+                raise FieldMappingException(exc_info, "Error on resolving cyclic reference") from e
+
         return b_obj
 
-    def _has_primitive_mapping(self, a: Type[Any], b: Type[Any]) -> bool:
-        return (a, b) in self.PRIMITIVE_CONVERTERS
+    def _map_field(
+        self,
+        a_obj: Any,
+        rule: FieldMapRule,
+        context: Dict[str, Any],
+        exc_info: MappingExceptionInfo,
+        state: MappingState,
+    ) -> Any:
+        """
+        Map single field value of a_obj according to rule. Returns SKIPPED_FIELD if value should not be set.
+        """
+        done, value = self._map_field_step(a_obj, rule, context, exc_info, state)
+        return value if done else self._run(value)
+
+    def _map_field_step(
+        self,
+        a_obj: Any,
+        rule: FieldMapRule,
+        context: Dict[str, Any],
+        exc_info: MappingExceptionInfo,
+        state: MappingState,
+    ) -> Tuple[bool, Any]:
+        """
+        Same as `_map_field`, but nested values are returned as generator like in `_map_step`
+        """
+        field_value = rule.from_field.getter(a_obj)
+        if field_value is None and not rule.to_field.is_required_constructor_arg:
+            return True, SKIPPED_FIELD
+
+        fields_exc_info = self._field_exc_info(rule, exc_info)
+        if state.limits is not None:
+            state.limits.check_size((field_value,), fields_exc_info)
+        if rule.batch_converter is not None and state.batch_values is not None:
+            key = (id(rule), id(a_obj))
+            if key in state.batch_values:
+                return True, state.batch_values[key]
+        if rule.blocking and state.futures:
+            future = state.futures.pop((id(rule), id(a_obj)), None)
+            if future is not None:
+                try:
+                    return True, future.result()
+                except Exception as e:
+                    raise FieldMappingException(fields_exc_info, "Error on value conversion") from e
+        if rule.has_converter():
+            try:
+                return True, rule.convert(field_value)
+            except Exception as e:
+                raise FieldMappingException(fields_exc_info, "Error on value conversion") from e
+        else:
+            return self._map_step(
+                field_value, fields_exc_info.b, context, fields_exc_info, state.nested(rule.to_field.name)
+            )
+
+    def _field_exc_info(self, rule: FieldMapRule, exc_info: MappingExceptionInfo) -> MappingExceptionInfo:
+        return exc_info.nested_field(
+            self._resolve_forward_ref(rule.from_field.type),
+            self._resolve_forward_ref(rule.to_field.type),
+            rule.from_field.name,
+            rule.to_field.name,
+        )
+
+    def _get_projection(self, only: Optional[Iterable[str]], exclude: Optional[Iterable[str]]) -> Projection:
+        key = (frozenset(only) if only is not None else None, frozenset(exclude or ()))
+        found, projection = self.projections.get(key)
+        if not found:
+            if len(self.projections.values) >= self.PROJECTIONS_CACHE_SIZE:
+                _, evicted = self.projections.values.popitem(last=False)
+                self._remove_projection_plans(evicted)
+            projection = Projection(*key)
+            self.projections.put(key, projection)
+        return projection
+
+    def _remove_projection_plans(self, projection: Projection) -> None:
+        """
+        Remove plans of projection and its nested projections
+        """
+        removed = set()
+        stack = [projection]
+        while stack:
+            current = stack.pop()
+            removed.add(id(current))
+            stack.extend(child for child in current.children.values() if child is not None)
+        for key in [key for key in self.projection_plans if id(key[2]) in removed]:
+            del self.projection_plans[key]
+
+    def _get_projection_plan(
+        self, a: Type[Any], b: Type[Any], map_rules: List[FieldMapRule], projection: Projection
+    ) -> Tuple[List[FieldMapRule], List[str]]:
+        """
+        Return map rules selected by projection and required constructor args which should be set to None
+        """
+        key = (a, b, projection)
+        plan = self.projection_plans.get(key)
+        if plan is None:
+            selected = [rule for rule in map_rules if projection.includes(rule.to_field.name)]
+            none_args = [
+                rule.to_field.name
+                for rule in map_rules
+                if rule.to_field.is_required_constructor_arg and not projection.includes(rule.to_field.name)
+            ]
+            plan = (selected, none_args)
+            self.projection_plans[key] = plan
+        return plan
+
+    def _get_lazy_class(self, a: Type[Any], b: Type[Any], map_rules: List[FieldMapRule]) -> Optional[Type[Any]]:
+        """
+        Return lazy subclass of b for mapping from a or None if lazy mapping to b is not possible
+        """
+        if (a, b) in self.lazy_classes:
+            return self.lazy_classes[(a, b)]
+
+        if not isinstance(b, type) or issubclass(b, dict) or b.__dictoffset__ == 0:
+            lazy_class = None
+        elif any(hasattr(getattr(b, rule.to_field.name, None), "__set__") for rule in map_rules):
+            # Properties and other data descriptors cannot be shadowed by lazy fields
+            lazy_class = None
+        else:
+            lazy_class = LazyFieldsLoader.create_lazy_class(b, [rule.to_field.name for rule in map_rules])
+        self.lazy_classes[(a, b)] = lazy_class
+        return lazy_class
+
+    def _map_lazy(
+        self,
+        a_obj: Any,
+        b: Type[Any],
+        lazy_class: Type[Any],
+        map_rules: List[FieldMapRule],
+        context: Dict[str, Any],
+        exc_info: MappingExceptionInfo,
+        state: MappingState,
+    ):
+        if state.limits is not None:
+            state = replace(state, limits=state.limits.for_lazy_fields())
+        b_obj = object.__new__(lazy_class)
+        b_obj.__dict__[LazyFieldsLoader.ATTRIBUTE] = LazyFieldsLoader(
+            self, a_obj, b, lazy_class, map_rules, context, exc_info, state
+        )
+        return b_obj
+
+    def map_many(
+        self,
+        a_objs: Iterable[Any],
+        b: Type[T],
+        context: Dict[str, Any] = None,
+        *,
+        executor: Optional["Executor"] = None,
+        limits: Optional[MappingLimits] = None,
+    ) -> List[T]:
+        """
+        Map each object from a_objs to type b. Batch converters are called once for all objects, blocking converters
+        of all objects are submitted to executor at once. Limits are shared by all objects.
+        """
+        a_objs = list(a_objs)
+        state = MappingState(executor=executor, limits=self._limits_tracker(limits))
+        if self.batch_rules or self.deferred_flows:
+            self._prefetch_batch_values(a_objs, self._resolve_forward_ref(b), MappingExceptionInfo(Any, b), state)
+        if executor is not None and self.blocking_rules:
+            self._submit_blocking_conversions(a_objs, self._resolve_forward_ref(b), state)
+        return [self.map(a_obj, b, context, state=state) for a_obj in a_objs]
+
+    def _limits_tracker(self, limits: Optional[MappingLimits]) -> Optional[LimitsTracker]:
+        if limits is None:
+            limits = self.limits
+        return LimitsTracker(limits) if limits is not None else None
+
+    def imap(self, a_objs: Iterable[Any], b: Type[T], context: Dict[str, Any] = None) -> Iterator[T]:
+        """
+        Lazily map each object from a_objs to type b. Objects are mapped one by one while iterating, so sources
+        which are valid only during iteration (e.g. records of memory mapped file) can be mapped.
+        """
+        for a_obj in a_objs:
+            yield self.map(a_obj, b, context)
+
+    def map_into(
+        self,
+        a_obj: Any,
+        b_obj: T,
+        context: Dict[str, Any] = None,
+        *,
+        only_changed: bool = False,
+        limits: Optional[MappingLimits] = None,
+    ) -> T:
+        """
+        Update existing object b_obj in place using map rules instead of constructing new object.
 
-    def _map_primitives(self, a_obj: Any, b: Type[Any], exc_info: MappingExceptionInfo):
+        Nested objects which already present in b_obj are updated in place too. With only_changed=True fields which
+        values are equal to mapped ones are not written. Limits override limits of mapper like in `map`.
+        """
         a = a_obj.__class__
-        primitive_converter = self.PRIMITIVE_CONVERTERS[(a, b)]
+        b = b_obj.__class__
+        if self.deferred_flows:
+            self._materialize_deferred_sources(a)
+        if context is None:
+            context = {}
+        exc_info = MappingExceptionInfo(a, b)
+
+        rules = self._find_update_rules(a, b)
+        if rules is None and self.auto_derive and self._derive_mapping(a, b):
+            rules = self.map_rules[a][b]
+        if rules is None:
+            raise MissingMappingException(exc_info, a, b)
+
+        state = MappingState(limits=self._limits_tracker(limits))
+        self._map_into_with_map_rules(a_obj, b_obj, rules, context, exc_info, state, only_changed)
+        return b_obj
+
+    def imap_into(
+        self, a_objs: Iterable[Any], b_objs: Iterable[T], context: Dict[str, Any] = None, *, only_changed: bool = False
+    ) -> Iterator[T]:
+        """
+        Map each object from a_objs into target objects taken in turn from b_objs pool.
+        Pool objects are reused, so each yielded object is valid only until pool wraps around.
+        """
+        for a_obj, b_obj in zip(a_objs, cycle(b_objs)):
+            yield self.map_into(a_obj, b_obj, context, only_changed=only_changed)
+
+    def _find_update_rules(self, a: Type[Any], b: Type[Any]) -> Optional[List[FieldMapRule]]:
+        """
+        Return map rules used to update objects of type b from objects of type a or its nearest base class. None if
+        such map rules are not registered.
+        """
+        dispatch = self._dispatch(a, b)
+        if dispatch is None or dispatch[1] is not b or dispatch[2] != DISPATCH_MAP_RULES:
+            return None
+        return self.map_rules[dispatch[0]][b]
+
+    def _map_into_with_map_rules(
+        self,
+        a_obj: Any,
+        b_obj: Any,
+        rules: List[FieldMapRule],
+        context: Dict[str, Any],
+        exc_info: MappingExceptionInfo,
+        state: MappingState,
+        only_changed: bool,
+    ):
+        if state.limits is not None:
+            state.limits.check(1, state.limits_depth(), exc_info)
+        for rule in rules:
+            from_field_type = self._resolve_forward_ref(rule.from_field.type)
+            to_field_type = self._resolve_forward_ref(rule.to_field.type)
+            fields_exc_info = exc_info.nested_field(
+                from_field_type, to_field_type, rule.from_field.name, rule.to_field.name
+            )
+            if rule.to_field.setter is None:
+                raise FieldMappingException(fields_exc_info, "Cannot update field without setter")
+
+            field_value = rule.from_field.getter(a_obj)
+            current_value = rule.to_field.getter(b_obj)
+            if self.deferred_flows:
+                self._materialize_deferred_sources(field_value.__class__)
+            if state.limits is not None:
+                state.limits.check_size((field_value,), fields_exc_info)
+            field_state = state.nested(rule.to_field.name)
+
+            nested_rules = None
+            if field_value is not None and current_value is not None and not rule.has_converter():
+                nested_rules = self._find_update_rules(field_value.__class__, current_value.__class__)
+
+            if field_value is None:
+                value = None
+            elif rule.has_converter():
+                try:
+                    value = rule.convert(field_value)
+                except Exception as e:
+                    raise FieldMappingException(fields_exc_info, "Error on value conversion") from e
+            elif nested_rules is not None:
+                self._map_into_with_map_rules(
+                    field_value, current_value, nested_rules, context, fields_exc_info, field_state, only_changed
+                )
+                continue
+            else:
+                value = self.map(field_value, to_field_type, context, exc_info=fields_exc_info, state=field_state)
+
+            if only_changed and current_value == value:
+                continue
+
+            try:
+                rule.to_field.setter(b_obj, value)
+            except Exception as e:
+                raise FieldMappingException(fields_exc_info, "Error on updating value") from e
+
+    def _has_primitive_mapping(self, a: Type[Any], b: Type[Any]) -> bool:
+        return self._find_primitive_converter(a, b) is not None
+
+    def _map_primitives(self, a_obj: Any, primitive_converter: Callable[[Any], Any], exc_info: MappingExceptionInfo):
         try:
             return primitive_converter(a_obj)
         except Exception as e:
             raise FieldMappingException(exc_info, "Exception on mapping primitive values") from e
 
     def _is_iterable_mapping_possible(self, a: Type[Any], b: Type[Any]) -> bool:
-        return self._is_iterable(a) and self._is_iterable(b)
+        return (self._is_iterable(a) or a is array) and self._is_iterable(b)
 
-    def _map_iterables(self, a_obj: Any, b: Type[Any], context: Dict[str, Any], exc_info: MappingExceptionInfo):
+    def _map_iterables(
+        self, a_obj: Any, b: Type[Any], context: Dict[str, Any], exc_info: MappingExceptionInfo, state: MappingState
+    ):
+        done, job = self._start_map_iterables(a_obj, b, exc_info, state)
+        if done:
+            return job
+
+        a_obj, to_type, items_types = job
+        mapped_list = []
+        pending_items = []
+        items_state = state.nested_items()
+        for index, (item, to_type_item) in enumerate(zip(a_obj, items_types)):
+            current_exc_info = exc_info.nested_item(index)
+            try:
+                value = self._map_step(item, to_type_item, context, current_exc_info, items_state)[1]
+            except MappingLimitExceededException:
+                raise
+            except Exception as e:
+                raise FieldMappingException(exc_info, f"Error on mapping iterable at index {index}") from e
+            if value is SKIPPED_FIELD:
+                # Items are deeper than max_depth, whole iterable is skipped
+                return SKIPPED_FIELD
+            if isinstance(value, PendingReference):
+                pending_items.append((index, value, current_exc_info))
+                value = None
+            mapped_list.append(value)
+        mapped = to_type(mapped_list)
+        if pending_items:
+            self._add_pending_items(mapped, pending_items, abc.MutableSequence)
+        return mapped
+
+    def _iter_map_iterables(
+        self, a_obj: Any, b: Type[Any], context: Dict[str, Any], exc_info: MappingExceptionInfo, state: MappingState
+    ) -> Generator[Any, Any, Any]:
+        """
+        Same as `_map_iterables` for iterative mode, nested values are yielded as generators
+        """
+        done, job = self._start_map_iterables(a_obj, b, exc_info, state)
+        if done:
+            return job
+
+        a_obj, to_type, items_types = job
+        mapped_list = []
+        pending_items = []
+        items_state = state.nested_items()
+        for index, (item, to_type_item) in enumerate(zip(a_obj, items_types)):
+            current_exc_info = exc_info.nested_item(index)
+            try:
+                done, value = self._map_step(item, to_type_item, context, current_exc_info, items_state)
+                if not done:
+                    value = yield value
+            except MappingLimitExceededException:
+                raise
+            except Exception as e:
+                raise FieldMappingException(exc_info, f"Error on mapping iterable at index {index}") from e
+            if value is SKIPPED_FIELD:
+                # Items are deeper than max_depth, whole iterable is skipped
+                return SKIPPED_FIELD
+            if isinstance(value, PendingReference):
+                pending_items.append((index, value, current_exc_info))
+                value = None
+            mapped_list.append(value)
+        mapped = to_type(mapped_list)
+        if pending_items:
+            self._add_pending_items(mapped, pending_items, abc.MutableSequence)
+        return mapped
+
+    def _start_map_iterables(
+        self, a_obj: Any, b: Type[Any], exc_info: MappingExceptionInfo, state: MappingState
+    ) -> Tuple[bool, Any]:
+        """
+        Return (True, result) if iterable is copied without mapping items one by one. Otherwise returns (False, job)
+        where job is tuple of source items, target collection type and items target types.
+        """
         b = self._resolve_forward_ref(b)
-        args = get_args(b)
-        if len(args) == 0:
-            # Iterable without type
-            to_type = get_origin(b)
+        to_type = self.ITERABLE_TYPES[get_origin(b) or b]
+        args = self._iterable_items_types(b)
+        if state.limits is not None:
+            if not isinstance(a_obj, abc.Sized):
+                a_obj = list(a_obj)
+            state.limits.check(len(a_obj), state.limits_depth(), exc_info)
+            state.limits.check_size(a_obj, exc_info)
+
+        if len(args) <= 1:
+            # Iterable with items of single type or without type
+            to_type_item = self._resolve_forward_ref(args[0]) if args else Any
+            if isinstance(a_obj, array):
+                # Typed array is converted to list of python values in bulk
+                a_obj = a_obj.tolist()
+                if to_type is list and self._is_identity_copy_possible(a_obj, to_type_item):
+                    return True, a_obj
+            if self._is_identity_copy_possible(a_obj, to_type_item):
+                return True, to_type(a_obj)
+            if self.batch_rules or self.deferred_flows:
+                self._prefetch_batch_values(a_obj, to_type_item, exc_info, state)
+            if state.executor is not None and self.blocking_rules:
+                self._submit_blocking_conversions(a_obj, to_type_item, state)
+            items_types: Iterable[Type[Any]] = repeat(to_type_item)
+        else:
+            # Tuple
+            if len(a_obj) != len(args):
+                raise FieldMappingException(exc_info, f"Expected {len(args)} items in tuple, got {len(a_obj)}")
+            items_types = map(self._resolve_forward_ref, args)
+        return False, (a_obj, to_type, items_types)
 
+    def _prefetch_batch_values(
+        self, a_objs: Iterable[Any], b: Type[Any], exc_info: MappingExceptionInfo, state: MappingState
+    ):
+        """
+        Convert values of fields with batch converters of all objects at once, results are stored in state and used
+        when objects are mapped to b.
+        """
+        gathered: Dict[int, Tuple[FieldMapRule, List[Any], List[Any]]] = {}
+        for a_obj in a_objs:
+            if self.deferred_flows:
+                self._materialize_deferred_sources(a_obj.__class__)
+            dispatch = self._dispatch(a_obj.__class__, b)
+            for rule in self.batch_rules.get(dispatch[:2], ()) if dispatch is not None else ():
+                value = rule.from_field.getter(a_obj)
+                if value is None and not rule.to_field.is_required_constructor_arg:
+                    continue
+                _, rule_objs, rule_values = gathered.setdefault(id(rule), (rule, [], []))
+                rule_objs.append(a_obj)
+                rule_values.append(value)
+        if not gathered:
+            return
+
+        if state.batch_values is None:
+            state.batch_values = {}
+        for rule, rule_objs, rule_values in gathered.values():
+            fields_exc_info = self._field_exc_info(rule, exc_info)
             try:
-                return to_type(*a_obj)
+                converted = list(rule.batch_converter(rule_values))
             except Exception as e:
-                raise FieldMappingException(exc_info, "Error on mapping iterable") from e
-
-        elif len(args) == 1:
-            # Iterable with type
-            to_type = get_origin(b)
-            to_type_item = self._resolve_forward_ref(args[0])
-
-            mapped_list = []
-            for index, item in enumerate(a_obj):
-                current_exc_info = MappingExceptionInfo(
-                    exc_info.a,
-                    exc_info.b,
-                    exc_info.a_fields_chain + [f"[{index}]"],
-                    exc_info.b_fields_chain + [f"[{index}]"],
+                raise FieldMappingException(fields_exc_info, "Error on batch value conversion") from e
+            if len(converted) != len(rule_values):
+                raise FieldMappingException(
+                    fields_exc_info, f"Batch converter returned {len(converted)} values for {len(rule_values)} values"
                 )
-                try:
-                    mapped_list.append(self.map(item, to_type_item, context, exc_info=current_exc_info))
-                except Exception as e:
-                    raise FieldMappingException(exc_info, f"Error on mapping iterable at index {index}") from e
-            return to_type(mapped_list)
+            for a_obj, value in zip(rule_objs, converted):
+                state.batch_values[(id(rule), id(a_obj))] = value
 
-        else:
-            # Tuple
-            to_type = get_origin(b)
-
-            mapped_list = []
-            for index, item in enumerate(a_obj):
-                to_type_item = self._resolve_forward_ref(args[index])
-                current_exc_info = MappingExceptionInfo(
-                    exc_info.a,
-                    exc_info.b,
-                    exc_info.a_fields_chain + [f"[{index}]"],
-                    exc_info.b_fields_chain + [f"[{index}]"],
+    def _submit_blocking_conversions(
+        self, a_objs: Iterable[Any], b: Type[Any], state: MappingState, a: Optional[Type[Any]] = None
+    ):
+        """
+        Submit conversions of fields with blocking converters of objects to executor. Results are taken in fields
+        order when objects are mapped to b. Rules of type a are used if it is set, else of class of each object.
+        Fields which are not mapped right away because of projection, depth limit or lazy mapping are not submitted.
+        """
+        if state.futures is None:
+            state.futures = {}
+        for a_obj in a_objs:
+            dispatch = (a, b) if a is not None else self._dispatch(a_obj.__class__, b)
+            for rule in self._submitted_blocking_rules(dispatch[0], dispatch[1], state) if dispatch is not None else ():
+                key = (id(rule), id(a_obj))
+                if key in state.futures or (state.batch_values is not None and key in state.batch_values):
+                    continue
+                value = rule.from_field.getter(a_obj)
+                if value is None and not rule.to_field.is_required_constructor_arg:
+                    continue
+                state.futures[key] = state.executor.submit(rule.convert, value)
+
+    def _submitted_blocking_rules(self, a: Type[Any], b: Type[Any], state: MappingState) -> List[FieldMapRule]:
+        """
+        Return rules with blocking converters which are applied when object of type a is mapped to b with state
+        """
+        rules = self.blocking_rules.get((a, b))
+        if not rules:
+            return []
+        if state.is_partial():
+            if state.max_depth is not None and state.depth > state.max_depth:
+                return []
+            if state.projection is not None:
+                selected, _ = self._get_projection_plan(a, b, self.map_rules[a][b], state.projection)
+                selected_ids = {id(rule) for rule in selected}
+                rules = [rule for rule in rules if id(rule) in selected_ids]
+        if state.lazy and self._get_lazy_class(a, b, self.map_rules[a][b]) is not None:
+            return []
+        return rules
+
+    @staticmethod
+    def _iterable_items_types(t: Type[Any]) -> Tuple[Any, ...]:
+        args = get_args(t)
+        if len(args) == 2 and args[1] is Ellipsis:
+            # Tuple of variable length
+            return args[:1]
+        return args
+
+    def _is_mapping_mapping_possible(self, a: Type[Any], b: Type[Any]) -> bool:
+        a_origin = get_origin(a) or a
+        return (
+            isinstance(a_origin, type)
+            and issubclass(a_origin, abc.Mapping)
+            and get_origin(b) in self.MAPPING_TYPES
+            and len(get_args(b)) == 2
+        )
+
+    def _map_mappings(
+        self, a_obj: Any, b: Type[Any], context: Dict[str, Any], exc_info: MappingExceptionInfo, state: MappingState
+    ):
+        done, job = self._start_map_mappings(a_obj, b, exc_info, state)
+        if done:
+            return job
+
+        to_type, to_type_key, to_type_value = job
+        mapped_items = []
+        pending_items = []
+        items_state = state.nested_items()
+        for key, value in a_obj.items():
+            current_exc_info = exc_info.nested_item(key)
+            try:
+                mapped_key = self._map_step(key, to_type_key, context, current_exc_info, items_state)[1]
+                self._check_item(mapped_key, current_exc_info)
+                mapped_value = self._map_step(value, to_type_value, context, current_exc_info, items_state)[1]
+            except MappingLimitExceededException:
+                raise
+            except Exception as e:
+                raise FieldMappingException(exc_info, f"Error on mapping dict at key {key!r}") from e
+            if mapped_key is SKIPPED_FIELD or mapped_value is SKIPPED_FIELD:
+                # Items are deeper than max_depth, whole dict is skipped
+                return SKIPPED_FIELD
+            if isinstance(mapped_value, PendingReference):
+                pending_items.append((mapped_key, mapped_value, current_exc_info))
+                mapped_value = None
+            mapped_items.append((mapped_key, mapped_value))
+        mapped = to_type(mapped_items)
+        if pending_items:
+            self._add_pending_items(mapped, pending_items, abc.MutableMapping)
+        return mapped
+
+    def _iter_map_mappings(
+        self, a_obj: Any, b: Type[Any], context: Dict[str, Any], exc_info: MappingExceptionInfo, state: MappingState
+    ) -> Generator[Any, Any, Any]:
+        """
+        Same as `_map_mappings` for iterative mode, nested values are yielded as generators
+        """
+        done, job = self._start_map_mappings(a_obj, b, exc_info, state)
+        if done:
+            return job
+
+        to_type, to_type_key, to_type_value = job
+        mapped_items = []
+        pending_items = []
+        items_state = state.nested_items()
+        for key, value in a_obj.items():
+            current_exc_info = exc_info.nested_item(key)
+            try:
+                done, mapped_key = self._map_step(key, to_type_key, context, current_exc_info, items_state)
+                if not done:
+                    mapped_key = yield mapped_key
+                self._check_item(mapped_key, current_exc_info)
+                done, mapped_value = self._map_step(value, to_type_value, context, current_exc_info, items_state)
+                if not done:
+                    mapped_value = yield mapped_value
+            except MappingLimitExceededException:
+                raise
+            except Exception as e:
+                raise FieldMappingException(exc_info, f"Error on mapping dict at key {key!r}") from e
+            if mapped_key is SKIPPED_FIELD or mapped_value is SKIPPED_FIELD:
+                # Items are deeper than max_depth, whole dict is skipped
+                return SKIPPED_FIELD
+            if isinstance(mapped_value, PendingReference):
+                pending_items.append((mapped_key, mapped_value, current_exc_info))
+                mapped_value = None
+            mapped_items.append((mapped_key, mapped_value))
+        mapped = to_type(mapped_items)
+        if pending_items:
+            self._add_pending_items(mapped, pending_items, abc.MutableMapping)
+        return mapped
+
+    def _start_map_mappings(
+        self, a_obj: Any, b: Type[Any], exc_info: MappingExceptionInfo, state: MappingState
+    ) -> Tuple[bool, Any]:
+        """
+        Return (True, result) if dict is copied without mapping entries one by one. Otherwise returns (False, job)
+        where job is tuple of target dict type, keys target type and values target type.
+        """
+        b = self._resolve_forward_ref(b)
+        to_type = self.MAPPING_TYPES[get_origin(b)]
+        to_type_key, to_type_value = map(self._resolve_forward_ref, get_args(b))
+        if state.limits is not None:
+            state.limits.check(len(a_obj), state.limits_depth(), exc_info)
+            state.limits.check_size(a_obj.keys(), exc_info)
+            state.limits.check_size(a_obj.values(), exc_info)
+
+        if self._is_identity_copy_possible(a_obj, to_type_key) and self._is_identity_copy_possible(
+            a_obj.values(), to_type_value
+        ):
+            return True, to_type(a_obj)
+        return False, (to_type, to_type_key, to_type_value)
+
+    def _is_identity_copy_possible(self, values: Iterable[Any], to_type: Type[Any]) -> bool:
+        """
+        Check that every value is of immutable type mapped to itself without registered or primitive converter, so
+        collection can be copied with one constructor call instead of mapping items one by one.
+        """
+        if to_type is Any:
+            return set(map(type, values)) <= self.IMMUTABLE_TYPES
+        return (
+            to_type in self.IMMUTABLE_TYPES
+            and set(map(type, values)) <= {to_type}
+            and self._dispatch(to_type, to_type) is None
+        )
+
+    @staticmethod
+    def _check_item(value: Any, exc_info: MappingExceptionInfo):
+        if isinstance(value, PendingReference):
+            raise FieldMappingException(exc_info, "Cyclic reference in dict key is not supported")
+
+    @staticmethod
+    def _add_pending_items(
+        collection: Any, pending_items: List[Tuple[Any, PendingReference, MappingExceptionInfo]], mutable_type: Any
+    ) -> None:
+        """
+        Set items of collection which are cyclic references when referenced objects are mapped. Only items of
+        lists and dict values can be set later, cycles through other collections are not supported.
+        """
+        for key, pending, exc_info in pending_items:
+            if not isinstance(collection, mutable_type):
+                raise FieldMappingException(
+                    exc_info, f"Cyclic reference inside {collection.__class__.__name__} is not supported"
                 )
-                try:
-                    mapped_list.append(self.map(item, to_type_item, context, exc_info=current_exc_info))
-                except Exception as e:
-                    raise FieldMappingException(exc_info, f"Error on mapping iterable at index {index}") from e
+            pending.waiters.append((collection, Mapper._item_setter(key)))
 
-            return to_type(mapped_list)
+    @staticmethod
+    def _item_setter(key: Any) -> Callable[[Any, Any], None]:
+        def setter(collection: Any, value: Any) -> None:
+            collection[key] = value
+
+        return setter
 
     def _is_direct_assignment_possible(self, a: Type[Any], b: Type[Any]) -> bool:
         b = self._resolve_forward_ref(b)
@@ -757,11 +3084,20 @@ class Mapper:
             return True
         elif is_union_type(b):
             return any([self._is_direct_assignment_possible(a, t) for t in get_args(b)])
-        elif issubclass(a, b):
+        elif self._is_subclass(a, b):
             return True
         return False
 
     @staticmethod
-    def _is_iterable(t: Type[Any]):
-        origin = get_origin(t)
-        return origin in [list, set, tuple] or t in [list, set, tuple]
+    def _is_subclass(a: Type[Any], b: Type[Any]) -> bool:
+        try:
+            return issubclass(a, b)
+        except TypeError:
+            # TypedDict doesn't support class checks
+            if getattr(b, "__total__", None) is None:
+                raise
+            return False
+
+    @classmethod
+    def _is_iterable(cls, t: Type[Any]):
+        return (get_origin(t) or t) in cls.ITERABLE_TYPES
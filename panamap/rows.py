@@ -0,0 +1,376 @@
+"""
+Mapping of positional rows, e.g. tuples returned by DB-API cursors or CSV readers.
+
+Row types are tuple subclasses with column names in `_fields`, both `collections.namedtuple` classes and classes
+created by `row_type` are supported by `RowMappingDescriptor`. Fields are read by index, so plain tuples with the
+same columns order are mapped without building intermediate dicts or row objects.
+"""
+
+import csv
+from inspect import signature
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Type, TypeVar, Union
+from weakref import WeakValueDictionary
+
+from typing_inspect import get_args, is_union_type
+
+from panamap.panamap import (
+    SKIPPED_FIELD,
+    FieldMapRule,
+    FieldMappingException,
+    ImproperlyConfiguredException,
+    Mapper,
+    MappingDescriptor,
+    MappingExceptionInfo,
+    MappingLimits,
+    MappingState,
+)
+
+T = TypeVar("T")
+
+
+class Row(tuple):
+    """
+    Base class of row types created by `row_type`. Unlike namedtuple column names are not required to be identifiers,
+    so they can be taken as is from cursor description. Missing columns are None.
+    """
+
+    __slots__ = ()
+
+    _fields: Tuple[str, ...] = ()
+    _field_defaults: Dict[str, Any] = {}
+
+    def __new__(cls, *values: Any, **named: Any):
+        if named or len(values) < len(cls._fields):
+            values += tuple(named.get(column) for column in cls._fields[len(values) :])
+        return tuple.__new__(cls, values)
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def __repr__(self):
+        values = ", ".join(f"{column}={value!r}" for column, value in zip(self._fields, self))
+        return f"{self.__class__.__name__}({values})"
+
+
+def row_type(name: str, columns: Sequence[str]) -> Type[Row]:
+    """
+    Create row type with given column names
+    """
+    columns = tuple(columns)
+    return type(name, (Row,), {"__slots__": (), "_fields": columns, "_field_defaults": dict.fromkeys(columns)})
+
+
+# Row types are registered in mappers, so the same type is reused for the same columns while any mapper refers to it.
+# Mapping of row type is registered once, so case mode of matching columns is a part of the key.
+_description_row_types: "WeakValueDictionary[Tuple[Tuple[str, ...], bool], Type[Row]]" = WeakValueDictionary()
+
+
+def _description_row_type(columns: Tuple[str, ...], ignore_case: bool) -> Type[Row]:
+    t = _description_row_types.get((columns, ignore_case))
+    if t is None:
+        # Name includes columns to avoid conflicting forward references of different row types in one mapper
+        name = f"{'CaseInsensitiveRow' if ignore_case else 'Row'}({', '.join(columns)})"
+        t = _description_row_types[(columns, ignore_case)] = row_type(name, columns)
+    return t
+
+
+class RowMappingDescriptor(MappingDescriptor):
+    def __init__(self, t: Type[Tuple]):
+        super(RowMappingDescriptor, self).__init__(t)
+        self.columns = {column: index for index, column in enumerate(t._fields)}
+        self.annotations = getattr(t, "__annotations__", {})
+
+    @classmethod
+    def supports_type(cls, t: Type[Any]) -> bool:
+        return isinstance(t, type) and issubclass(t, tuple) and hasattr(t, "_fields")
+
+    def get_getter(self, field_name: str) -> Callable[[Tuple], Any]:
+        return itemgetter(self.columns[field_name])
+
+    def get_setter(self, field_name: str) -> Optional[Callable[[Tuple, Any], None]]:
+        # Rows are immutable, all fields are set in constructor
+        return None
+
+    def get_getter_source(self, field_name: str, obj: str) -> Optional[str]:
+        return f"{obj}[{self.columns[field_name]}]"
+
+    def get_constructor_args(self) -> Set[str]:
+        return set(self.columns.keys())
+
+    def get_required_constructor_args(self) -> Set[str]:
+        return set(self.columns.keys()).difference(getattr(self.type, "_field_defaults", {}))
+
+    def get_declared_fields(self) -> Set[str]:
+        return set(self.columns.keys())
+
+    def is_field_supported(self, field_name: str) -> bool:
+        return field_name in self.columns
+
+    def get_preferred_field_type(self, field_name: str) -> Type[Any]:
+        return self.annotations.get(field_name, Any)
+
+    def is_container_type(self) -> bool:
+        return False
+
+
+def _wrap_row_type(t: Union[Type[Any], MappingDescriptor]) -> Union[Type[Any], MappingDescriptor]:
+    if not isinstance(t, MappingDescriptor) and RowMappingDescriptor.supports_type(t):
+        return RowMappingDescriptor(t)
+    return t
+
+
+def ensure_row_mapping(mapper: Mapper, a: Type[Any], b: Type[Any], ignore_case: bool = False) -> None:
+    """
+    Register one directional mapping from a to b matching fields by name if mapping is not registered yet,
+    ignore_case is applied only on registration. Row types are described by RowMappingDescriptor even if it is not
+    set in mapper custom descriptors.
+    """
+    for t in (a, b):
+        if mapper.deferred_flows and t in mapper.deferred_flows:
+            mapper._materialize_deferred(t)
+    if mapper._has_mapping_rules(a, b):
+        return
+
+    flow = mapper._create_flow(_wrap_row_type(a), _wrap_row_type(b))
+    key = MappingDescriptor.uncase if ignore_case else str
+    a_fields = flow.left_descriptor.get_declared_fields()
+    b_fields = flow.right_descriptor.get_declared_fields()
+    if flow.left_descriptor.is_container_type():
+        a_fields = b_fields
+    elif flow.right_descriptor.is_container_type():
+        b_fields = a_fields
+    b_fields_by_key = {key(f): f for f in b_fields}
+    for f in a_fields:
+        if key(f) in b_fields_by_key:
+            flow.l_to_r(f, b_fields_by_key[key(f)])
+    flow.register()
+
+
+def map_rows(
+    mapper: Mapper,
+    rows: Iterable[Sequence[Any]],
+    a: Type[Any],
+    b: Type[T],
+    context: Dict[str, Any] = None,
+    limits: Optional[MappingLimits] = None,
+) -> Iterator[T]:
+    """
+    Map rows laid out as row type a to b. Rows can be plain tuples or any other sequences, fields are read by index.
+    Limits override limits of mapper and are shared by all rows.
+    """
+    if context is None:
+        context = {}
+    exc_info = MappingExceptionInfo(a, b)
+    map_with_map_rules = mapper._map_with_map_rules
+    state = MappingState(limits=mapper._limits_tracker(limits))
+    for row in rows:
+        yield map_with_map_rules(row, b, context, exc_info, state, a)
+
+
+def _fetch_rows(cursor: Any, batch: int) -> Iterator[Sequence[Any]]:
+    while True:
+        rows = cursor.fetchmany(batch)
+        if not rows:
+            break
+        yield from rows
+
+
+def map_cursor(
+    mapper: Mapper,
+    cursor: Any,
+    b: Type[T],
+    batch: int = 1000,
+    row_type: Optional[Type[Tuple]] = None,
+    ignore_case: bool = False,
+    context: Dict[str, Any] = None,
+    limits: Optional[MappingLimits] = None,
+) -> Iterator[T]:
+    """
+    Stream rows of executed DB-API cursor mapped to b, rows are fetched with `fetchmany(batch)`.
+
+    Columns are taken from `cursor.description` unless row_type is set. If mapping from row type to b is not
+    registered, it is registered with fields matched by column names. Limits are applied like in `map_rows`.
+    """
+    if cursor.description is None:
+        return
+    if row_type is None:
+        row_type = _description_row_type(tuple(column[0] for column in cursor.description), ignore_case)
+    ensure_row_mapping(mapper, row_type, b, ignore_case)
+
+    yield from map_rows(mapper, _fetch_rows(cursor, batch), row_type, b, context, limits)
+
+
+def _row_plan(mapper: Mapper, a: Type[Any], b: Type[Tuple], columns: Tuple[str, ...]) -> List[Optional[FieldMapRule]]:
+    """
+    Return map rule for each column, None for columns without rule
+    """
+    ensure_row_mapping(mapper, a, b)
+    rules = {rule.to_field.name: rule for rule in mapper.map_rules[a][b]}
+    for column in columns:
+        if column not in b._fields:
+            raise ImproperlyConfiguredException(MappingExceptionInfo(a, b), f"unknown column '{column}'")
+    return [rules.get(column) for column in columns]
+
+
+def map_to_rows(
+    mapper: Mapper,
+    objs: Iterable[Any],
+    b: Type[Tuple],
+    columns: Optional[Sequence[str]] = None,
+    batch: int = 1000,
+    context: Dict[str, Any] = None,
+    limits: Optional[MappingLimits] = None,
+) -> Iterator[List[Tuple]]:
+    """
+    Map objects to plain tuples of column values of row type b, e.g. for `cursor.executemany`. Tuples are yielded in
+    lists of batch size. Columns default to all columns of b, missing values are None.
+
+    Registered mapping from class of objects to b is used, if it is not registered fields are matched by name.
+    Limits override limits of mapper and are shared by all objects.
+    """
+    if context is None:
+        context = {}
+    columns = tuple(columns) if columns is not None else tuple(b._fields)
+    map_field = mapper._map_field
+    plans: Dict[Type[Any], List[Optional[FieldMapRule]]] = {}
+    state = MappingState(limits=mapper._limits_tracker(limits))
+
+    rows = []
+    for obj in objs:
+        a = obj.__class__
+        plan = plans.get(a)
+        if plan is None:
+            plan = plans[a] = _row_plan(mapper, a, b, columns)
+        exc_info = MappingExceptionInfo(a, b)
+        if state.limits is not None:
+            state.limits.check(1, 0, exc_info)
+        values = []
+        for rule in plan:
+            value = map_field(obj, rule, context, exc_info, state) if rule is not None else None
+            values.append(None if value is SKIPPED_FIELD else value)
+        rows.append(tuple(values))
+        if len(rows) == batch:
+            yield rows
+            rows = []
+    if rows:
+        yield rows
+
+
+def _csv_target_type(mapper: Mapper, rule: FieldMapRule) -> Any:
+    to_type = mapper._resolve_forward_ref(rule.to_field.type)
+    if is_union_type(to_type):
+        members = [t for t in get_args(to_type) if t is not type(None)]
+        if len(members) == 1:
+            return mapper._resolve_forward_ref(members[0])
+    return to_type
+
+
+def _csv_value_converter(
+    mapper: Mapper, rule: FieldMapRule, to_type: Any, context: Dict[str, Any], state: MappingState
+) -> Optional[Callable[[str], Any]]:
+    """
+    Return converter of csv string value for rule target field, None if string is assigned as is
+    """
+    if rule.has_converter():
+        return rule.convert
+    if to_type is str or to_type is Any:
+        return None
+    primitive_converter = mapper._find_primitive_converter(str, to_type)
+    if primitive_converter is not None:
+        return primitive_converter
+    return lambda value: mapper.map(value, to_type, context, state=state.nested(rule.to_field.name))
+
+
+def map_csv(
+    mapper: Mapper,
+    fileobj: Iterable[str],
+    b: Type[T],
+    ignore_case: bool = False,
+    context: Dict[str, Any] = None,
+    limits: Optional[MappingLimits] = None,
+    **reader_options: Any,
+) -> Iterator[T]:
+    """
+    Stream rows of csv file with header mapped to b. Header columns are matched to fields of b by name once and
+    value converters are bound per column, so rows are mapped with constant memory.
+    Empty values are None for fields of types other than str. Reader options are passed to `csv.reader`.
+    Limits override limits of mapper and are shared by all rows: each row is an element and raw values are checked
+    against max_size.
+    """
+    if context is None:
+        context = {}
+    reader = csv.reader(fileobj, **reader_options)
+    header = next(reader, None)
+    if header is None:
+        return
+    a = _description_row_type(tuple(header), ignore_case)
+    ensure_row_mapping(mapper, a, b, ignore_case)
+
+    exc_info = MappingExceptionInfo(a, b)
+    state = MappingState(limits=mapper._limits_tracker(limits))
+    plan = []
+    for rule in mapper.map_rules[a][b]:
+        to_type = _csv_target_type(mapper, rule)
+        converter = _csv_value_converter(mapper, rule, to_type, context, state)
+        plan.append((a._fields.index(rule.from_field.name), rule, converter, to_type is str or to_type is Any))
+
+    for values in reader:
+        if state.limits is not None:
+            state.limits.check(1, 0, exc_info)
+            state.limits.check_size(values, exc_info)
+        constructor_args = {}
+        fields = []
+        for index, rule, converter, keeps_empty in plan:
+            value = values[index] if index < len(values) else None
+            if value == "" and not keeps_empty:
+                value = None
+            elif value is not None and converter is not None:
+                try:
+                    value = converter(value)
+                except Exception as e:
+                    raise FieldMappingException(
+                        mapper._field_exc_info(rule, exc_info), f"Error on value conversion at line {reader.line_num}"
+                    ) from e
+            if value is None and not rule.to_field.is_required_constructor_arg:
+                continue
+            if rule.to_field.is_constructor_arg:
+                constructor_args[rule.to_field.name] = value
+            else:
+                fields.append((rule.to_field.setter, value))
+
+        b_obj = b(**constructor_args)
+        for setter, value in fields:
+            setter(b_obj, value)
+        yield b_obj
+
+
+def write_csv(
+    mapper: Mapper,
+    objs: Iterable[Any],
+    fileobj: Any,
+    columns: Optional[Sequence[str]] = None,
+    batch: int = 1000,
+    context: Dict[str, Any] = None,
+    limits: Optional[MappingLimits] = None,
+    **writer_options: Any,
+) -> None:
+    """
+    Write objects to csv file with header. Columns default to constructor arguments of class of first object.
+    Objects are mapped with `map_to_rows`, so registered mapping to row type of columns is used if it exists, limits
+    are applied like there. Writer options are passed to `csv.writer`.
+    """
+    objs = iter(objs)
+    first = next(objs, None)
+    if columns is None:
+        if first is None:
+            return
+        columns = [name for name in signature(first.__class__).parameters]
+    writer = csv.writer(fileobj, **writer_options)
+    writer.writerow(columns)
+    if first is None:
+        return
+    b = _description_row_type(tuple(columns), False)
+    for rows in map_to_rows(mapper, chain([first], objs), b, batch=batch, context=context, limits=limits):
+        writer.writerows(rows)
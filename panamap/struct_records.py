@@ -0,0 +1,198 @@
+"""
+Fixed layout binary records described by `struct` format.
+
+`struct_record` creates record class which instances are views of a buffer (bytes, bytearray, mmap, ...) at an
+offset. Fields are read with `struct.Struct.unpack_from` and written with `struct.Struct.pack_into` directly in the
+buffer, so record data is never copied as a whole. `StructRecordMappingDescriptor` must be passed to
+`Mapper(custom_descriptors=...)` to map records from and to other classes.
+"""
+
+import mmap
+import re
+from struct import Struct, calcsize
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Set, Tuple, Type, TypeVar
+
+from panamap.panamap import MappingDescriptor
+
+R = TypeVar("R", bound="StructRecord")
+
+BYTE_ORDER_CHARS = "@=<>!"
+
+FIELD_TYPES: Dict[str, Type[Any]] = {
+    **{code: int for code in "bBhHiIlLqQnNP"},
+    **{code: float for code in "efd"},
+    **{code: bytes for code in "csp"},
+    "?": bool,
+}
+
+_FORMAT_ITEM = re.compile(r"\s*(\d*)([xcbB?hHiIlLqQnNefdspP])")
+
+
+class StructRecord:
+    """
+    Base class of records created by `struct_record`. Record reads and writes its fields in buffer at offset.
+    Record created without buffer gets its own zero filled bytearray.
+    """
+
+    __slots__ = ("buffer", "offset")
+
+    STRUCT: Struct
+    FIELDS: Dict[str, Tuple[Struct, int]]
+    FIELD_TYPES: Dict[str, Type[Any]]
+
+    def __init__(self, buffer: Any = None, offset: int = 0, **values: Any):
+        self.buffer = buffer if buffer is not None else bytearray(self.STRUCT.size)
+        self.offset = offset
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{self.__class__.__name__}({values})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.STRUCT.unpack_from(self.buffer, self.offset) == other.STRUCT.unpack_from(other.buffer, other.offset)
+
+
+def parse_struct_fields(format: str, field_names: Sequence[str]) -> Dict[str, Tuple[Struct, int, Type[Any]]]:
+    """
+    Split struct format to fields. Returns dict of field name to struct of single field, offset of field in record
+    and python type of field value. Pad bytes are skipped, repeated items (e.g. '3i') are separate fields, while
+    strings ('10s') are single fields.
+    """
+    byte_order = format[0] if format and format[0] in BYTE_ORDER_CHARS else ""
+    items_format = format[len(byte_order) :]
+
+    items = []
+    position = 0
+    while position < len(items_format.rstrip()):
+        match = _FORMAT_ITEM.match(items_format, position)
+        if match is None:
+            raise ValueError(f"Unsupported struct format '{format}'")
+        position = match.end()
+        count, code = match.groups()
+        if code in "xsp":
+            items.append((count, code))
+        else:
+            items.extend(("", code) for _ in range(int(count) if count else 1))
+
+    fields = {}
+    names = iter(field_names)
+    preceding = ""
+    for count, code in items:
+        item = f"{count}{code}"
+        if code != "x":
+            name = next(names, None)
+            if name is None:
+                raise ValueError(f"Not enough field names for struct format '{format}'")
+            # Zero repeat count aligns offset like a real item in native mode without adding its size
+            offset = calcsize(f"{byte_order}{preceding}0{code}")
+            fields[name] = (Struct(f"{byte_order}{item}"), offset, FIELD_TYPES[code])
+        preceding += item
+    if next(names, None) is not None:
+        raise ValueError(f"Too many field names for struct format '{format}'")
+    return fields
+
+
+def _field_property(name: str, field_struct: Struct, offset: int) -> property:
+    def getter(record: StructRecord):
+        return field_struct.unpack_from(record.buffer, record.offset + offset)[0]
+
+    def setter(record: StructRecord, value: Any):
+        field_struct.pack_into(record.buffer, record.offset + offset, value)
+
+    return property(getter, setter, doc=f"Field '{name}' at offset {offset}")
+
+
+def struct_record(name: str, format: str, field_names: Sequence[str]) -> Type[StructRecord]:
+    """
+    Create record class with fields field_names laid out according to struct format.
+    """
+    fields = parse_struct_fields(format, field_names)
+    namespace: Dict[str, Any] = {
+        "__slots__": (),
+        "STRUCT": Struct(format),
+        "FIELDS": {field_name: (field_struct, offset) for field_name, (field_struct, offset, _) in fields.items()},
+        "FIELD_TYPES": {field_name: field_type for field_name, (_, _, field_type) in fields.items()},
+    }
+    for field_name, (field_struct, offset, _) in fields.items():
+        namespace[field_name] = _field_property(field_name, field_struct, offset)
+    return type(name, (StructRecord,), namespace)
+
+
+def iter_records(record_type: Type[R], buffer: Any, offset: int = 0, count: Optional[int] = None) -> Iterator[R]:
+    """
+    Iterate records laid out one after another in buffer starting from offset. Records are views of buffer.
+    """
+    size = record_type.STRUCT.size
+    available = (len(buffer) - offset) // size
+    for index in range(available if count is None else min(count, available)):
+        yield record_type(buffer, offset + index * size)
+
+
+def iter_file_records(record_type: Type[R], path: str, offset: int = 0) -> Iterator[R]:
+    """
+    Iterate records of file memory mapped in read-only mode. File is not read into memory as a whole, records are
+    valid only until iteration is finished, so they should be mapped while iterating, e.g. with `Mapper.imap`.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        if f.tell() == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from iter_records(record_type, buffer, offset)
+
+
+class StructRecordMappingDescriptor(MappingDescriptor):
+    def __init__(self, t: Type[StructRecord]):
+        super(StructRecordMappingDescriptor, self).__init__(t)
+        self.fields = t.FIELDS
+        self.field_types = t.FIELD_TYPES
+
+    @classmethod
+    def supports_type(cls, t: Type[Any]) -> bool:
+        return isinstance(t, type) and issubclass(t, StructRecord)
+
+    def get_getter(self, field_name: str) -> Callable[[StructRecord], Any]:
+        unpack_from = self.fields[field_name][0].unpack_from
+        offset = self.fields[field_name][1]
+
+        def getter(record: StructRecord):
+            return unpack_from(record.buffer, record.offset + offset)[0]
+
+        return getter
+
+    def get_setter(self, field_name: str) -> Callable[[StructRecord, Any], None]:
+        pack_into = self.fields[field_name][0].pack_into
+        offset = self.fields[field_name][1]
+
+        def setter(record: StructRecord, value: Any):
+            pack_into(record.buffer, record.offset + offset, value)
+
+        return setter
+
+    def get_getter_source(self, field_name: str, obj: str) -> Optional[str]:
+        return f"{obj}.{field_name}"
+
+    def get_setter_source(self, field_name: str, obj: str, value: str) -> Optional[str]:
+        return f"{obj}.{field_name} = {value}"
+
+    def get_constructor_args(self) -> Set[str]:
+        return set(self.fields.keys())
+
+    def get_required_constructor_args(self) -> Set[str]:
+        return set()
+
+    def get_declared_fields(self) -> Set[str]:
+        return set(self.fields.keys())
+
+    def is_field_supported(self, field_name: str) -> bool:
+        return field_name in self.fields
+
+    def get_preferred_field_type(self, field_name: str) -> Type[Any]:
+        return self.field_types[field_name]
+
+    def is_container_type(self) -> bool:
+        return False
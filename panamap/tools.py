@@ -1,14 +1,15 @@
-from typing import Dict, TypeVar, Callable
+from typing import Any, Dict, Optional, TypeVar, Callable
 
 L = TypeVar("L")
 R = TypeVar("R")
 
 
 def values_map(v_map: Dict[L, R]) -> Callable[[L], R]:
-    def converter(left: L):
-        if left in v_map:
+    # Optional context parameter keeps converter from being wrapped on registration
+    def converter(left: L, ignored_context: Optional[Dict[str, Any]] = None):
+        try:
             return v_map[left]
-        else:
-            raise ValueError(f"Value {left} is missing in value map.")
+        except KeyError:
+            raise ValueError(f"Value {left} is missing in value map.") from None
 
     return converter
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from unittest import TestCase
+
+from panamap import Mapper, MissingMappingException
+
+
+@dataclass
+class AddressA:
+    city: str
+    street: str
+    zip_code: Optional[str] = None
+
+
+@dataclass
+class AddressB:
+    city: str
+    street: str
+
+
+@dataclass
+class PersonA:
+    name: str
+    addresses: List[AddressA]
+
+
+@dataclass
+class PersonB:
+    name: str
+    addresses: List[AddressB]
+
+
+@dataclass
+class CompanyA:
+    address: Optional[AddressA]
+    owner: PersonA
+
+
+@dataclass
+class CompanyB:
+    address: Optional[AddressB]
+    owner: PersonB
+
+
+@dataclass
+class Unrelated:
+    code: int
+
+
+class TestAutoDerive(TestCase):
+    def test_nested_pair_is_derived(self):
+        mapper = Mapper(auto_derive=True)
+        mapper.mapping(PersonA, PersonB).map_matching().register()
+
+        b = mapper.map(PersonA("Bob", [AddressA("Berlin", "Main", "10115")]), PersonB)
+
+        self.assertEqual(b, PersonB("Bob", [AddressB("Berlin", "Main")]))
+        self.assertEqual(mapper.derived_mappings(), [(AddressA, AddressB)])
+
+    def test_optional_member_is_derived(self):
+        mapper = Mapper(auto_derive=True)
+        mapper.mapping(CompanyA, CompanyB).map_matching().register()
+
+        b = mapper.map(CompanyA(AddressA("Berlin", "Main"), PersonA("Bob", [])), CompanyB)
+
+        self.assertEqual(b, CompanyB(AddressB("Berlin", "Main"), PersonB("Bob", [])))
+        self.assertEqual(mapper.map(CompanyA(None, PersonA("Bob", [])), CompanyB).address, None)
+
+    def test_warm_up_derives_nested_pairs(self):
+        mapper = Mapper(auto_derive=True)
+        mapper.mapping(CompanyA, CompanyB).map_matching().register()
+
+        mapper.warm_up()
+
+        self.assertIn((AddressA, AddressB), mapper.derived_mappings())
+        self.assertIn((PersonA, PersonB), mapper.derived_mappings())
+        self.assertIn((AddressB, AddressA), mapper.derived_mappings())
+
+    def test_derived_pair_is_one_directional(self):
+        mapper = Mapper(auto_derive=True)
+
+        self.assertEqual(mapper.map(PersonA("Bob", []), PersonB), PersonB("Bob", []))
+        self.assertEqual(mapper.derived_mappings(), [(PersonA, PersonB)])
+        self.assertFalse(mapper._has_mapping_rules(PersonB, PersonA))
+
+    def test_incompatible_types_are_not_derived(self):
+        mapper = Mapper(auto_derive=True)
+
+        with self.assertRaises(MissingMappingException):
+            mapper.map(AddressB("Berlin", "Main"), Unrelated)
+        with self.assertRaises(MissingMappingException):
+            mapper.map(Unrelated(1), AddressB)
+        self.assertEqual(mapper.derived_mappings(), [])
+
+    def test_disabled_by_default(self):
+        with self.assertRaises(MissingMappingException):
+            Mapper().map(AddressA("Berlin", "Main"), AddressB)
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from unittest import TestCase
+
+import panamap
+from panamap import Mapper, DuplicateMappingException
+
+
+@dataclass
+class NestedA:
+    value: str
+
+
+@dataclass
+class A:
+    nested: NestedA
+
+
+@dataclass
+class NestedB:
+    value: str
+
+
+@dataclass
+class B:
+    nested: NestedB
+
+
+class TestDeferredRegistration(TestCase):
+    def test_mappings_are_configured_on_first_use(self):
+        mapper = Mapper(deferred=True)
+        mapper.mapping(A, B).map_matching().register()
+        mapper.mapping(NestedA, NestedB).map_matching().register()
+
+        self.assertEqual(mapper.map_rules, {})
+
+        self.assertEqual(mapper.map(A(NestedA("abc")), B), B(NestedB("abc")))
+        self.assertEqual(mapper.map(NestedB("xyz"), NestedA), NestedA("xyz"))
+        self.assertEqual(mapper.deferred_flows, {})
+
+    def test_configuration_errors_raised_on_first_use(self):
+        mapper = Mapper(deferred=True)
+        mapper.mapping(NestedA, NestedB).map_matching().register()
+        mapper.mapping(NestedA, NestedB).map_matching().register()
+
+        with self.assertRaises(DuplicateMappingException):
+            mapper.map(NestedA("abc"), NestedB)
+
+    def test_version(self):
+        self.assertRegex(panamap.__version__, r"^\d+\.\d+")
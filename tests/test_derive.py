@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from unittest import TestCase
+
+from panamap import Mapper, DuplicateMappingException
+from panamap.panamap import LayeredDictionary
+
+
+@dataclass(frozen=True)
+class PriceA:
+    amount: int
+    currency: str
+
+
+@dataclass
+class PriceB:
+    amount: int
+    currency: str
+
+
+@dataclass
+class ProductA:
+    name: str
+    price: PriceA
+
+
+@dataclass
+class ProductB:
+    name: str
+    price: PriceB
+
+
+class TestDerive(TestCase):
+    def setUp(self):
+        self.parent = Mapper()
+        self.parent.mapping(PriceA, PriceB).map_matching().l_to_r_cached().register()
+        self.parent.mapping(ProductA, ProductB).map_matching().register()
+
+    def test_child_uses_parent_mappings(self):
+        child = self.parent.derive()
+
+        b = child.map(ProductA("pen", PriceA(10, "EUR")), ProductB)
+
+        self.assertEqual(b, ProductB("pen", PriceB(10, "EUR")))
+
+    def test_child_overrides_parent_mapping(self):
+        child = self.parent.derive()
+        child.mapping(PriceA, PriceB).l_to_r("amount", "amount", lambda amount: amount * 100).l_to_r(
+            "currency", "currency"
+        ).register()
+        a = ProductA("pen", PriceA(10, "EUR"))
+
+        self.assertEqual(child.map(a, ProductB).price, PriceB(1000, "EUR"))
+        self.assertEqual(self.parent.map(a, ProductB).price, PriceB(10, "EUR"))
+        with self.assertRaises(DuplicateMappingException):
+            child.mapping(PriceA, PriceB).map_matching().register()
+
+    def test_new_mappings_are_not_shared(self):
+        child = self.parent.derive()
+        child.mapping(PriceA, ProductB).l_to_r("currency", "name").register()
+
+        self.assertTrue(child._has_mapping_rules(PriceA, ProductB))
+        self.assertFalse(self.parent._has_mapping_rules(PriceA, ProductB))
+
+    def test_child_has_own_caches(self):
+        child = self.parent.derive()
+
+        child.map(PriceA(1, "USD"), PriceB)
+
+        self.assertEqual(child.cache_info(PriceA, PriceB).currsize, 1)
+        self.assertEqual(self.parent.cache_info(PriceA, PriceB).currsize, 0)
+
+    def test_child_unregisters_parent_mapping(self):
+        child = self.parent.derive()
+
+        child.unregister(ProductA, ProductB)
+
+        self.assertFalse(child._has_mapping_rules(ProductA, ProductB))
+        self.assertTrue(self.parent._has_mapping_rules(ProductA, ProductB))
+        self.assertEqual(self.parent.map(ProductA("pen", PriceA(10, "EUR")), ProductB).name, "pen")
+
+    def test_derive_does_not_copy_registries(self):
+        for i in range(200):
+            a = dataclass(type(f"A{i}", (), {"__annotations__": {"value": int}}))
+            b = dataclass(type(f"B{i}", (), {"__annotations__": {"value": int}}))
+            self.parent.mapping(a, b).map_matching().register()
+        rules = self.parent.map_rules[PriceA][PriceB]
+
+        child = self.parent.derive()
+        grandchild = child.derive()
+
+        for mapper in (child, grandchild):
+            self.assertIs(mapper.map_rules[PriceA][PriceB], rules)
+            self.assertEqual(len(mapper.map_rules.data), 0)
+            self.assertEqual(len(mapper.pair_descriptors.data), 0)
+        self.assertIs(grandchild.map_rules.base, child.map_rules.base)
+        self.assertEqual(len(grandchild.map_rules), len(self.parent.map_rules))
+        self.assertEqual(grandchild.map(PriceA(1, "USD"), PriceB), PriceB(1, "USD"))
+
+    def test_derive_does_not_change_parent(self):
+        registry_types = {name: type(value) for name, value in vars(self.parent).items()}
+
+        self.parent.derive()
+
+        self.assertEqual(type(self.parent.map_rules), dict)
+        self.assertEqual({name: type(value) for name, value in vars(self.parent).items()}, registry_types)
+
+    def test_repeated_derive_keeps_one_layer(self):
+        mapper = self.parent
+        for i in range(20):
+            mapper = mapper.derive()
+            mapper.mapping(PriceA, PriceB).l_to_r("amount", "amount", lambda v, i=i: v + i).l_to_r(
+                "currency", "currency"
+            ).register()
+
+        self.assertIsInstance(mapper.map_rules, LayeredDictionary)
+        self.assertNotIsInstance(mapper.map_rules.base, LayeredDictionary)
+        self.assertEqual(mapper.map(PriceA(1, "USD"), PriceB), PriceB(20, "USD"))
+        self.assertEqual(self.parent.map(PriceA(1, "USD"), PriceB), PriceB(1, "USD"))
+
+    def test_derive_with_weak_types(self):
+        parent = Mapper(weak_types=True)
+        parent.mapping(PriceA, PriceB).map_matching().l_to_r_cached().register()
+        child = parent.derive()
+        child.mapping(PriceA, PriceB).map_matching().register()
+
+        a = PriceA(1, "USD")
+
+        self.assertEqual(child.map(a, PriceB), PriceB(1, "USD"))
+        self.assertEqual(parent.map(a, PriceB), PriceB(1, "USD"))
+        self.assertEqual(parent.cache_info(PriceA, PriceB).currsize, 1)
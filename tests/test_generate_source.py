@@ -0,0 +1,112 @@
+import importlib.util
+import os
+import tempfile
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional
+from unittest import TestCase
+
+from panamap import Mapper, MappingValidationException
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+
+
+@dataclass
+class NestedA:
+    value: str
+
+
+@dataclass
+class SubNestedA(NestedA):
+    pass
+
+
+@dataclass
+class LabeledNestedA(NestedA):
+    label: str
+
+
+@dataclass
+class A:
+    id: int
+    nested: NestedA
+    items: List[NestedA]
+    color: Optional[Color]
+    price: str
+
+
+class ColorB(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass
+class NestedB:
+    value: str
+
+
+@dataclass
+class B:
+    id: str
+    nested: NestedB
+    items: List[NestedB]
+    color: Optional[ColorB]
+    price: float
+
+
+def parse_price(price: str) -> float:
+    return float(price)
+
+
+class TestGenerateSource(TestCase):
+    def _load(self, mapper: Mapper):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "generated_mappers.py")
+            mapper.generate_source(path)
+            spec = importlib.util.spec_from_file_location("generated_mappers", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+
+    def test_generated_module_maps_like_mapper(self):
+        mapper = Mapper()
+        mapper.mapping(A, B).map_matching().l_to_r("price", "price", parse_price).register()
+        mapper.mapping(NestedA, NestedB).map_matching().register()
+        mapper.mapping(NestedA, dict).map_matching().register()
+        mapper.mapping(Color, ColorB).map_enum().register()
+        a = A(1, NestedA("x"), [NestedA("y"), NestedA("z")], Color.GREEN, "1.5")
+
+        generated = self._load(mapper)
+
+        self.assertEqual(generated.map_A_to_B(a, {}), mapper.map(a, B))
+        self.assertEqual(
+            generated.map_object(a, B), B("1", NestedB("x"), [NestedB("y"), NestedB("z")], ColorB.GREEN, 1.5)
+        )
+        self.assertEqual(generated.map_object({"value": "d"}, NestedA), NestedA("d"))
+        self.assertEqual(generated.map_object(ColorB.RED, Color), Color.RED)
+
+    def test_generated_module_uses_base_class_mappings(self):
+        mapper = Mapper()
+        mapper.mapping(A, B).map_matching().l_to_r("price", "price", parse_price).register()
+        mapper.mapping(NestedA, NestedB).map_matching().register()
+        mapper.mapping(LabeledNestedA, NestedB).l_to_r("label", "value").register()
+        mapper.mapping(Color, ColorB).map_enum().register()
+        a = A(1, LabeledNestedA("x", "label"), [SubNestedA("y"), LabeledNestedA("z", "other")], None, "1.5")
+
+        generated = self._load(mapper)
+
+        self.assertEqual(generated.map_object(SubNestedA("x"), NestedB), mapper.map(SubNestedA("x"), NestedB))
+        self.assertEqual(generated.map_object(a, B), mapper.map(a, B))
+        self.assertEqual(generated.map_object(a, B).nested, NestedB("label"))
+        with self.assertRaises(KeyError):
+            generated.map_object(SubNestedA("x"), B)
+
+    def test_lambda_converter_is_reported(self):
+        mapper = Mapper()
+        mapper.mapping(NestedA, NestedB).l_to_r("value", "value", lambda v: v.upper()).register()
+
+        with self.assertRaises(MappingValidationException):
+            mapper.generate_source()
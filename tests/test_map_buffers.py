@@ -0,0 +1,70 @@
+from array import array
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+from unittest import TestCase
+
+from panamap import Mapper
+
+
+@dataclass
+class BlobA:
+    payload: bytes
+    samples: array
+
+
+@dataclass
+class BlobB:
+    payload: memoryview
+    samples: List[int]
+
+
+@dataclass
+class AnyBlob:
+    payload: Any
+    samples: Any
+
+
+class TestMapBuffers(TestCase):
+    def test_bytes_are_shared(self):
+        mapper = Mapper()
+        a = b"x" * 1024
+
+        self.assertIs(mapper.map(a, bytes), a)
+
+    def test_map_bytes_to_readonly_memoryview(self):
+        mapper = Mapper()
+        a = bytearray(b"abc")
+
+        view = mapper.map(a, memoryview)
+
+        self.assertTrue(view.readonly)
+        a[0] = ord("x")
+        self.assertEqual(view.tobytes(), b"xbc")
+
+    def test_map_fields(self):
+        mapper = Mapper()
+        mapper.mapping(BlobA, BlobB).map_matching().register()
+        a = BlobA(b"abc", array("h", [1, 2, 3]))
+
+        b = mapper.map(a, BlobB)
+
+        self.assertEqual(b.payload.obj, a.payload)
+        self.assertEqual(b.samples, [1, 2, 3])
+
+    def test_map_array_to_typed_iterables(self):
+        mapper = Mapper()
+        samples = array("d", [0.5, 1.5])
+
+        self.assertEqual(mapper.map(samples, Tuple[float, ...]), (0.5, 1.5))
+        self.assertEqual(mapper.map(samples, List[str]), ["0.5", "1.5"])
+        self.assertEqual(mapper.map(samples, bytes), samples.tobytes())
+
+    def test_memoryview_shared_as_any(self):
+        mapper = Mapper()
+        mapper.mapping(BlobB, AnyBlob).map_matching().register()
+        payload = memoryview(bytearray(b"abc"))
+
+        b = mapper.map(BlobB(payload, []), AnyBlob)
+
+        self.assertTrue(b.payload.readonly)
+        self.assertEqual(b.payload.obj, payload.obj)
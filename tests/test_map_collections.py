@@ -0,0 +1,89 @@
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, FrozenSet, Mapping, Sequence, Tuple
+from unittest import TestCase
+
+from panamap import Mapper, FieldMappingException
+
+
+@dataclass
+class ItemA:
+    value: str
+
+
+@dataclass
+class ItemB:
+    value: str
+
+
+@dataclass
+class CatalogA:
+    items: Dict[str, ItemA]
+    tags: FrozenSet[str]
+    history: Deque[int]
+    codes: Tuple[int, ...]
+
+
+@dataclass
+class CatalogB:
+    items: Mapping[str, ItemB]
+    tags: FrozenSet[str]
+    history: Sequence[int]
+    codes: Tuple[int, ...]
+
+
+class TestMapCollections(TestCase):
+    def test_map_dict_with_typed_values(self):
+        mapper = Mapper()
+        mapper.mapping(ItemA, ItemB).map_matching().register()
+
+        b = mapper.map({"a": ItemA("x"), "b": ItemA("y")}, Dict[str, ItemB])
+
+        self.assertEqual(b, {"a": ItemB("x"), "b": ItemB("y")})
+
+    def test_map_dict_keys(self):
+        mapper = Mapper()
+
+        b = mapper.map(OrderedDict([(1, "x"), (2, "y")]), Dict[str, str])
+
+        self.assertEqual(b, {"1": "x", "2": "y"})
+
+    def test_copy_dict_of_immutables(self):
+        mapper = Mapper()
+        a = {"a": 1, "b": 2}
+
+        b = mapper.map(a, Dict[str, int])
+
+        self.assertEqual(b, a)
+        self.assertIsNot(b, a)
+
+    def test_map_collections_fields(self):
+        mapper = Mapper()
+        mapper.mapping(ItemA, ItemB).map_matching().register()
+        mapper.mapping(CatalogA, CatalogB).map_matching().register()
+
+        b = mapper.map(
+            CatalogA({"a": ItemA("x")}, frozenset({"new"}), deque([1, 2]), (3, 4, 5)),
+            CatalogB,
+        )
+
+        self.assertEqual(b.items, {"a": ItemB("x")})
+        self.assertEqual(b.tags, frozenset({"new"}))
+        self.assertEqual(b.history, [1, 2])
+        self.assertEqual(b.codes, (3, 4, 5))
+
+    def test_map_untyped_list(self):
+        mapper = Mapper()
+        a = [[1], [2]]
+
+        b = mapper.map(a, list)
+
+        self.assertEqual(b, a)
+        self.assertIsNot(b[0], a[0])
+
+    def test_map_dict_error_contains_key(self):
+        mapper = Mapper()
+
+        with self.assertRaises(FieldMappingException) as cm:
+            mapper.map({"a": ItemA("x")}, Dict[str, ItemB])
+        self.assertIn("at key 'a'", str(cm.exception))
@@ -0,0 +1,60 @@
+import io
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from panamap import Mapper, FieldMappingException, MappingLimits, MappingLimitExceededException
+from panamap.rows import map_csv, write_csv
+
+
+@dataclass
+class Product:
+    id: int
+    name: str
+    price: Optional[float] = None
+
+
+class TestMapCsv(TestCase):
+    def test_map_csv(self):
+        mapper = Mapper()
+        fileobj = io.StringIO("ID,Name,Price,Comment\n1,apple,0.5,x\n2,,,y\n")
+
+        products = list(map_csv(mapper, fileobj, Product, ignore_case=True))
+
+        self.assertEqual(products, [Product(1, "apple", 0.5), Product(2, "", None)])
+
+    def test_map_csv_conversion_error(self):
+        mapper = Mapper()
+        fileobj = io.StringIO("id,name\n1,apple\nx,pear\n")
+
+        with self.assertRaises(FieldMappingException) as cm:
+            list(map_csv(mapper, fileobj, Product))
+        self.assertIn("line 3", str(cm.exception))
+
+    def test_write_csv(self):
+        mapper = Mapper()
+        fileobj = io.StringIO()
+
+        write_csv(mapper, [Product(1, "apple", 0.5), Product(2, "pear")], fileobj, lineterminator="\n")
+
+        self.assertEqual(fileobj.getvalue(), "id,name,price\n1,apple,0.5\n2,pear,\n")
+        fileobj.seek(0)
+        self.assertEqual(list(map_csv(mapper, fileobj, Product)), [Product(1, "apple", 0.5), Product(2, "pear")])
+
+    def test_map_csv_with_many_headers(self):
+        mapper = Mapper()
+
+        for i in range(300):
+            list(map_csv(mapper, io.StringIO(f"id,name,c{i}\n1,apple,x\n"), Product))
+
+        self.assertEqual(list(map_csv(mapper, io.StringIO("id,name,c0\n2,pear,y\n"), Product)), [Product(2, "pear")])
+        self.assertEqual(mapper.memory_report().pairs, 300)
+
+    def test_map_csv_with_limits(self):
+        for limits in (MappingLimits(max_size=3), MappingLimits(max_elements=1)):
+            with self.subTest(limits=limits):
+                mapper = Mapper(limits=limits)
+                fileobj = io.StringIO("id,name\n1,abc\n2,long name\n")
+
+                with self.assertRaises(MappingLimitExceededException):
+                    list(map_csv(mapper, fileobj, Product))
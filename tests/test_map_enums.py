@@ -0,0 +1,55 @@
+from enum import Enum
+from unittest import TestCase
+
+from panamap import Mapper, ImproperlyConfiguredException, FieldMappingException
+
+
+class LangA(Enum):
+    PYTHON = 1
+    JAVA = 2
+    CPP = 3
+
+
+class LangB(Enum):
+    PYTHON = "py"
+    JAVA = "java"
+    RUST = "rust"
+
+
+class LangC(Enum):
+    PY = 1
+    JAVA = 2
+    CPP = 3
+
+
+class TestMapEnums(TestCase):
+    def test_map_enum_by_name(self):
+        mapper = Mapper()
+        mapper.mapping(LangA, LangB).map_enum().register()
+
+        self.assertEqual(mapper.map(LangA.PYTHON, LangB), LangB.PYTHON)
+        self.assertEqual(mapper.map(LangB.JAVA, LangA), LangA.JAVA)
+        with self.assertRaises(FieldMappingException):
+            mapper.map(LangA.CPP, LangB)
+        with self.assertRaises(FieldMappingException):
+            mapper.map(LangB.RUST, LangA)
+
+    def test_map_enum_by_value(self):
+        mapper = Mapper()
+        mapper.mapping(LangA, LangC).map_enum(by="value").register()
+
+        self.assertEqual(mapper.map(LangA.PYTHON, LangC), LangC.PY)
+        self.assertEqual(mapper.map(LangC.CPP, LangA), LangA.CPP)
+
+    def test_map_enum_with_explicit_values(self):
+        mapper = Mapper()
+        mapper.mapping(LangA, LangB).map_enum(values={LangA.CPP: LangB.RUST}).register()
+
+        self.assertEqual(mapper.map(LangA.CPP, LangB), LangB.RUST)
+        self.assertEqual(mapper.map(LangB.RUST, LangA), LangA.CPP)
+        self.assertEqual(mapper.map(LangA.JAVA, LangB), LangB.JAVA)
+
+    def test_map_enum_requires_enums(self):
+        mapper = Mapper()
+        with self.assertRaises(ImproperlyConfiguredException):
+            mapper.mapping(LangA, dict).map_enum()
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import List
+from unittest import TestCase
+
+from panamap import Mapper, MissingMappingException
+
+
+@dataclass
+class NestedA:
+    value: str
+
+
+@dataclass
+class A:
+    title: str
+    count: int
+    nested: NestedA
+
+
+@dataclass
+class NestedB:
+    value: str
+
+
+@dataclass
+class B:
+    title: str
+    count: int
+    nested: NestedB
+
+
+class TrackingB:
+    def __init__(self, title: str):
+        self._title = title
+        self.writes: List[str] = []
+
+    @property
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, value):
+        self.writes.append(value)
+        self._title = value
+
+
+class TestMapInto(TestCase):
+    def setUp(self):
+        self.mapper = Mapper()
+        self.mapper.mapping(A, B).map_matching().register()
+        self.mapper.mapping(NestedA, NestedB).map_matching().register()
+
+    def test_map_into_existing_object(self):
+        b = B("old", 0, NestedB("old"))
+        nested = b.nested
+
+        result = self.mapper.map_into(A("new", 5, NestedA("new")), b)
+
+        self.assertIs(result, b)
+        self.assertEqual(b, B("new", 5, NestedB("new")))
+        self.assertIs(b.nested, nested)
+
+    def test_map_into_only_changed(self):
+        self.mapper.mapping(A, TrackingB).l_to_r("title", "title").register()
+        b = TrackingB("same")
+
+        self.mapper.map_into(A("same", 1, NestedA("x")), b, only_changed=True)
+        self.mapper.map_into(A("other", 1, NestedA("x")), b, only_changed=True)
+
+        self.assertEqual(b.writes, ["other"])
+
+    def test_imap_into_reuses_pool(self):
+        pool = [B("", 0, NestedB("")), B("", 0, NestedB(""))]
+
+        results = [(b, b.title) for b in self.mapper.imap_into([A(str(i), i, NestedA(str(i))) for i in range(3)], pool)]
+
+        self.assertEqual([title for _, title in results], ["0", "1", "2"])
+        self.assertIs(results[0][0], pool[0])
+        self.assertIs(results[2][0], pool[0])
+
+    def test_map_into_without_map_rules(self):
+        with self.assertRaises(MissingMappingException):
+            self.mapper.map_into(NestedA("a"), B("", 0, NestedB("")))
@@ -0,0 +1,88 @@
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from panamap import Mapper, FieldMappingException, MissingMappingException
+
+
+@dataclass
+class NodeA:
+    value: str
+    children: List["NodeA"]
+    next: Optional["NodeA"] = None
+
+
+@dataclass
+class NodeB:
+    value: str
+    children: List["NodeB"]
+    next: Optional["NodeB"] = None
+
+
+def linked_list(length: int) -> NodeA:
+    head = None
+    for i in range(length):
+        head = NodeA(str(i), [], head)
+    return head
+
+
+class TestMapIterative(TestCase):
+    def setUp(self):
+        self.mapper = Mapper()
+        self.mapper.mapping(NodeA, NodeB).map_matching().register()
+
+    def test_same_result_as_recursive(self):
+        a = NodeA("root", [NodeA("child", [NodeA("leaf", [])])], linked_list(3))
+
+        self.assertEqual(self.mapper.map(a, NodeB, iterative=True), self.mapper.map(a, NodeB))
+
+    def test_recursive_mode_does_not_run_generators(self):
+        a = NodeA("root", [NodeA("child", [NodeA("leaf", [])])], linked_list(3))
+
+        with patch.object(Mapper, "_run", side_effect=AssertionError("generator driver is used")):
+            b = self.mapper.map(a, NodeB)
+
+        self.assertEqual(b.children[0].children[0].value, "leaf")
+        self.assertEqual(b.next.next.value, "1")
+
+    def test_deep_structure(self):
+        length = sys.getrecursionlimit() * 2
+
+        b = self.mapper.map(linked_list(length), NodeB, iterative=True)
+
+        depth = 0
+        while b is not None:
+            depth += 1
+            b = b.next
+        self.assertEqual(depth, length)
+
+    def test_same_errors_as_recursive(self):
+        a = NodeA("root", [NodeA("child", [NodeA(object(), [])])])
+
+        errors = []
+        for iterative in (False, True):
+            with self.assertRaises(FieldMappingException) as cm:
+                self.mapper.map(a, NodeB, iterative=iterative)
+            errors.append(cm.exception)
+
+        self.assertEqual(str(errors[0]), str(errors[1]))
+        self.assertEqual(str(errors[0].__cause__), str(errors[1].__cause__))
+
+    def test_error_in_deep_structure(self):
+        length = 20000
+        head = linked_list(length)
+        tail = head
+        while tail.next is not None:
+            tail = tail.next
+        tail.value = object()
+
+        start = time.monotonic()
+        with self.assertRaises(MissingMappingException) as cm:
+            self.mapper.map(head, NodeB, iterative=True)
+
+        # Fields chains are built once for raised exception, not copied on each level
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertIn("'" + "next." * (length - 1) + "value'", str(cm.exception))
@@ -0,0 +1,139 @@
+import copy
+import pickle
+from dataclasses import dataclass, field
+from typing import Any, List
+from unittest import TestCase
+
+from panamap import Mapper, FieldMappingException
+
+
+@dataclass
+class ItemA:
+    value: str
+
+
+@dataclass
+class A:
+    title: str
+    items: List[ItemA]
+    broken: str = "ok"
+
+
+@dataclass
+class ItemB:
+    value: str
+
+
+@dataclass
+class B:
+    title: str
+    items: List[ItemB]
+    broken: int = 0
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class HolderA:
+    payload: Any
+
+
+@dataclass
+class HolderB:
+    payload: Any
+
+
+class CommonA:
+    def __init__(self, value: str, other: str = "other"):
+        self.value = value
+        self.other = other
+
+
+class CommonB:
+    def __init__(self, value: str, other: str = "default"):
+        self.value = value
+        self.other = other
+
+
+class NoteA:
+    def __init__(self, value: str, note: str):
+        self.value = value
+        self.note = note
+
+
+class NoteB:
+    def __init__(self, value: str):
+        self.value = value
+        self.note: str = None
+
+
+class TestMapLazy(TestCase):
+    def setUp(self):
+        self.calls = []
+        self.mapper = Mapper()
+        self.mapper.mapping(A, B).l_to_r("title", "title").l_to_r("items", "items").l_to_r(
+            "broken", "broken", lambda v: int(v)
+        ).register()
+        self.mapper.mapping(ItemA, ItemB).l_to_r("value", "value", self._track).register()
+        self.mapper.mapping(CommonA, CommonB).l_to_r("value", "value").register()
+        self.mapper.mapping(NoteA, NoteB).l_to_r("value", "value").l_to_r("note", "note").register()
+
+    def _track(self, value):
+        self.calls.append(value)
+        return value
+
+    def test_fields_are_mapped_on_first_access(self):
+        b = self.mapper.map(A("title", [ItemA("x"), ItemA("y")]), B, lazy=True)
+
+        self.assertEqual(b.__class__, B)
+        self.assertIsInstance(b, B)
+        self.assertEqual(b.title, "title")
+        self.assertEqual(self.calls, [])
+
+        self.assertEqual(b.items[1].value, "y")
+        self.assertEqual(self.calls, ["y"])
+        self.assertIs(b.items, b.items)
+        self.assertEqual(b.tags, [])
+
+    def test_lazy_object_equals_eager_one(self):
+        a = A("title", [ItemA("x")], "5")
+
+        self.assertEqual(self.mapper.map(a, B, lazy=True), self.mapper.map(a, B))
+
+    def test_copy_and_pickle_lazy_object(self):
+        a = A("title", [ItemA("x")], "5")
+        expected = B("title", [ItemB("x")], 5)
+
+        for copy_lazy in (copy.copy, copy.deepcopy, lambda b: pickle.loads(pickle.dumps(b))):
+            with self.subTest(copy_lazy=copy_lazy):
+                b = copy_lazy(self.mapper.map(a, B, lazy=True))
+
+                self.assertIs(type(b), B)
+                self.assertEqual(b, expected)
+
+    def test_map_lazy_object_to_any_field(self):
+        lazy = self.mapper.map(A("title", [ItemA("x")], "5"), B, lazy=True)
+        self.mapper.mapping(HolderA, HolderB).map_matching().register()
+
+        holder = self.mapper.map(HolderA(lazy), HolderB)
+
+        self.assertIs(type(holder.payload), B)
+        self.assertEqual(holder.payload, B("title", [ItemB("x")], 5))
+
+    def test_error_raised_on_access(self):
+        b = self.mapper.map(A("title", [], "nan"), B, lazy=True)
+
+        with self.assertRaises(FieldMappingException):
+            b.broken
+
+    def test_lazy_common_type(self):
+        b = self.mapper.map(CommonA("abc"), CommonB, lazy=True)
+
+        self.assertEqual(b.value, "abc")
+        self.assertEqual(b.other, "default")
+
+    def test_projected_lazy_map_does_not_change_full_lazy_map(self):
+        projected = self.mapper.map(NoteA("abc", "note"), NoteB, lazy=True, only={"value"})
+        full = self.mapper.map(NoteA("abc", "note"), NoteB, lazy=True)
+
+        self.assertEqual((projected.value, projected.note), ("abc", None))
+        self.assertEqual((full.value, full.note), ("abc", "note"))
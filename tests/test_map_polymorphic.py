@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import List
+from unittest import TestCase
+
+from panamap import Mapper, MissingMappingException
+
+
+@dataclass
+class AnimalA:
+    name: str
+
+
+@dataclass
+class CatA(AnimalA):
+    pass
+
+
+@dataclass
+class DogA(AnimalA):
+    pass
+
+
+@dataclass
+class AnimalB:
+    name: str
+
+
+@dataclass
+class CatB(AnimalB):
+    pass
+
+
+@dataclass
+class DogB(AnimalB):
+    pass
+
+
+@dataclass
+class ZooA:
+    animals: List[AnimalA]
+
+
+@dataclass
+class ZooB:
+    animals: List[AnimalB]
+
+
+class TestMapPolymorphic(TestCase):
+    def test_subclass_uses_base_class_mapping(self):
+        mapper = Mapper()
+        mapper.mapping(AnimalA, AnimalB).map_matching().register()
+        mapper.mapping(ZooA, ZooB).map_matching().register()
+
+        b = mapper.map(ZooA([CatA("Tom"), DogA("Rex")]), ZooB)
+
+        self.assertEqual(b, ZooB([AnimalB("Tom"), AnimalB("Rex")]))
+
+    def test_nearest_base_class_mapping_is_used(self):
+        mapper = Mapper()
+        mapper.mapping(AnimalA, AnimalB).map_matching().register()
+        mapper.mapping(CatA, CatB).map_matching().register()
+
+        self.assertEqual(type(mapper.map(CatA("Tom"), AnimalB)), AnimalB)
+        self.assertEqual(type(mapper.map(CatA("Tom"), CatB)), CatB)
+        with self.assertRaises(MissingMappingException):
+            mapper.map(DogA("Rex"), CatB)
+
+    def test_polymorphic_targets(self):
+        mapper = Mapper(polymorphic_targets=True)
+        mapper.mapping(CatA, CatB).map_matching().register()
+        mapper.mapping(DogA, DogB).map_matching().register()
+        mapper.mapping(ZooA, ZooB).map_matching().register()
+
+        b = mapper.map(ZooA([CatA("Tom"), DogA("Rex")]), ZooB)
+
+        self.assertEqual([type(a) for a in b.animals], [CatB, DogB])
+        self.assertEqual(mapper.map([DogA("Rex")], List[AnimalB]), [DogB("Rex")])
+
+    def test_registration_resets_dispatch_cache(self):
+        mapper = Mapper()
+        mapper.mapping(AnimalA, AnimalB).map_matching().register()
+        self.assertEqual(type(mapper.map(CatA("Tom"), AnimalB)), AnimalB)
+
+        mapper.mapping(CatA, AnimalB).l_to_r("name", "name", lambda name: name.upper()).register()
+
+        self.assertEqual(mapper.map(CatA("Tom"), AnimalB), AnimalB("TOM"))
+
+    def test_deferred_mapping_of_base_class(self):
+        mapper = Mapper(deferred=True)
+        mapper.mapping(AnimalA, AnimalB).map_matching().register()
+
+        self.assertEqual(mapper.map(CatA("Tom"), AnimalB), AnimalB("Tom"))
+
+    def test_map_into_uses_base_class_mapping(self):
+        mapper = Mapper()
+        mapper.mapping(AnimalA, AnimalB).map_matching().register()
+        mapper.mapping(ZooA, ZooB).map_matching().register()
+        b = AnimalB("")
+
+        mapper.map_into(CatA("Tom"), b)
+
+        self.assertEqual(b, AnimalB("Tom"))
+        with self.assertRaises(MissingMappingException):
+            mapper.map_into(ZooA([]), b)
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from unittest import TestCase
+
+from panamap import Mapper
+
+
+@dataclass
+class TagA:
+    name: str
+    color: str
+
+
+@dataclass
+class OwnerA:
+    name: str
+    manager: Optional["OwnerA"] = None
+
+
+@dataclass
+class ItemA:
+    id: int
+    title: str
+    tags: List[TagA]
+    owner: OwnerA
+
+
+@dataclass
+class TagB:
+    name: str
+    color: Optional[str] = None
+
+
+@dataclass
+class OwnerB:
+    name: str
+    manager: Optional["OwnerB"] = None
+
+
+@dataclass
+class ItemB:
+    id: int
+    title: str
+    tags: List[TagB]
+    owner: Optional[OwnerB] = None
+
+
+class TestMapProjection(TestCase):
+    def setUp(self):
+        self.mapper = Mapper()
+        self.mapper.mapping(ItemA, ItemB).map_matching().register()
+        self.mapper.mapping(TagA, TagB).map_matching().register()
+        self.mapper.mapping(OwnerA, OwnerB).map_matching().register()
+        self.item = ItemA(
+            1, "title", [TagA("red", "#f00"), TagA("blue", "#00f")], OwnerA("owner", OwnerA("boss", OwnerA("ceo")))
+        )
+
+    def test_map_only_fields(self):
+        b = self.mapper.map(self.item, ItemB, only={"id", "tags.name"})
+
+        self.assertEqual(b, ItemB(1, None, [TagB("red"), TagB("blue")]))
+
+    def test_map_exclude_fields(self):
+        b = self.mapper.map(self.item, ItemB, exclude={"owner", "tags.color", "title"})
+
+        self.assertEqual(b, ItemB(1, None, [TagB("red"), TagB("blue")]))
+
+    def test_map_with_max_depth(self):
+        b = self.mapper.map(self.item, ItemB, max_depth=1)
+
+        self.assertEqual(b.owner, OwnerB("owner"))
+        self.assertEqual(b.tags, [TagB("red", "#f00"), TagB("blue", "#00f")])
+
+        b = self.mapper.map(self.item, ItemB, max_depth=0)
+
+        self.assertEqual(b, ItemB(1, "title", None))
+
+    def test_projection_plans_are_cached(self):
+        self.mapper.map(self.item, ItemB, only=["id", "tags.name"])
+        self.mapper.map(self.item, ItemB, only=["tags.name", "id"])
+
+        self.assertEqual(self.mapper.projections.info().currsize, 1)
+        self.assertEqual(len(self.mapper.projection_plans), 2)
+
+    def test_projections_are_bounded(self):
+        for i in range(Mapper.PROJECTIONS_CACHE_SIZE * 2):
+            self.mapper.map(self.item, ItemB, only=["id", "tags.name"], exclude=[f"field{i}"])
+
+        self.assertEqual(self.mapper.projections.info().currsize, Mapper.PROJECTIONS_CACHE_SIZE)
+        self.assertEqual(len(self.mapper.projection_plans), Mapper.PROJECTIONS_CACHE_SIZE * 2)
@@ -0,0 +1,98 @@
+import sqlite3
+from collections import namedtuple
+from dataclasses import dataclass
+from unittest import TestCase
+
+from panamap import Mapper, MappingLimits, MappingLimitExceededException
+from panamap.rows import RowMappingDescriptor, map_cursor, map_to_rows, row_type
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    email: str = ""
+
+
+@dataclass
+class Contact:
+    id: int = 0
+    name: str = ""
+
+
+UserRow = namedtuple("UserRow", ["id", "name"])
+
+
+class TestMapRows(TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("create table users (ID integer, Name text)")
+        self.connection.executemany("insert into users values (?, ?)", [(i, f"user{i}") for i in range(5)])
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_map_namedtuple(self):
+        mapper = Mapper(custom_descriptors=[RowMappingDescriptor])
+        mapper.mapping(UserRow, User).map_matching().register()
+
+        self.assertEqual(mapper.map(UserRow(1, "abc"), User), User(1, "abc"))
+        self.assertEqual(mapper.map(User(2, "def"), UserRow), UserRow(2, "def"))
+
+    def test_row_type(self):
+        Row = row_type("Row", ["count(*)", "name"])
+
+        self.assertEqual(Row(1, "a"), (1, "a"))
+        self.assertEqual(Row(name="a"), (None, "a"))
+
+    def test_map_cursor(self):
+        mapper = Mapper()
+        cursor = self.connection.execute("select ID, Name from users order by ID")
+
+        users = list(map_cursor(mapper, cursor, User, batch=2, ignore_case=True))
+
+        self.assertEqual(users, [User(i, f"user{i}") for i in range(5)])
+
+    def test_map_cursor_case_modes_do_not_share_mapping(self):
+        mapper = Mapper()
+        query = "select ID as id, Name from users order by ID limit 1"
+
+        exact = list(map_cursor(mapper, self.connection.execute(query), Contact))
+        ignoring = list(map_cursor(mapper, self.connection.execute(query), Contact, ignore_case=True))
+
+        self.assertEqual(exact, [Contact(0)])
+        self.assertEqual(ignoring, [Contact(0, "user0")])
+
+    def test_map_cursor_with_row_type(self):
+        mapper = Mapper()
+        self.connection.row_factory = sqlite3.Row
+        cursor = self.connection.execute("select ID, Name from users order by ID limit 2")
+
+        users = list(map_cursor(mapper, cursor, User, row_type=UserRow))
+
+        self.assertEqual(users, [User(0, "user0"), User(1, "user1")])
+
+    def test_map_to_rows(self):
+        mapper = Mapper()
+        users = [User(i, f"new{i}", f"{i}@example.com") for i in range(3)]
+        Row = row_type("Row", ["id", "name", "email"])
+
+        batches = list(map_to_rows(mapper, users, Row, columns=["name", "id"], batch=2))
+        self.connection.executemany("insert into users (Name, ID) values (?, ?)", batches[0])
+
+        self.assertEqual(batches, [[("new0", 0), ("new1", 1)], [("new2", 2)]])
+        self.assertEqual(self.connection.execute("select count(*) from users").fetchone(), (7,))
+
+    def test_map_cursor_with_limits(self):
+        mapper = Mapper(limits=MappingLimits(max_elements=3))
+        cursor = self.connection.execute("select ID, Name from users order by ID")
+
+        with self.assertRaises(MappingLimitExceededException):
+            list(map_cursor(mapper, cursor, User, batch=2, ignore_case=True))
+
+    def test_map_to_rows_with_limits(self):
+        mapper = Mapper(limits=MappingLimits(max_size=3))
+        Row = row_type("Row", ["id", "name"])
+
+        with self.assertRaises(MappingLimitExceededException):
+            list(map_to_rows(mapper, [User(1, "long name")], Row))
@@ -0,0 +1,177 @@
+import importlib.util
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum, IntEnum
+from typing import Any, Dict, List
+from unittest import TestCase
+from uuid import UUID
+
+from panamap import Mapper, MissingMappingException
+
+
+class Status(Enum):
+    ACTIVE = "active"
+    BLOCKED = "blocked"
+
+
+class Level(Enum):
+    LOW = 1
+    HIGH = 2
+
+
+class Priority(IntEnum):
+    LOW = 1
+
+
+class Mode(str, Enum):
+    FAST = "fast"
+
+
+@dataclass
+class AnyHolderA:
+    value: Any
+
+
+@dataclass
+class ObjectHolderB:
+    value: object
+
+
+@dataclass
+class OrderA:
+    id: str
+    created: str
+    day: str
+    total: str
+    status: str
+    note: bytes
+
+
+@dataclass
+class OrderB:
+    id: UUID
+    created: datetime
+    day: date
+    total: Decimal
+    status: Status
+    note: str
+
+
+@dataclass
+class EventA:
+    created: str
+
+
+@dataclass
+class EventB:
+    created: datetime
+
+
+@dataclass(frozen=True)
+class FrozenEventA:
+    created: str
+
+
+@dataclass(frozen=True)
+class FrozenEventB:
+    created: datetime
+
+
+ORDER_ID = "12345678-1234-5678-1234-567812345678"
+
+
+class TestMapStdlibValues(TestCase):
+    def test_map_from_strings_and_back(self):
+        mapper = Mapper()
+        mapper.mapping(OrderA, OrderB).map_matching().register()
+        a = OrderA(ORDER_ID, "2024-03-01T10:30:00", "2024-03-01", "10.50", "active", b"fragile")
+
+        b = mapper.map(a, OrderB)
+
+        self.assertEqual(
+            b,
+            OrderB(
+                UUID(ORDER_ID),
+                datetime(2024, 3, 1, 10, 30),
+                date(2024, 3, 1),
+                Decimal("10.50"),
+                Status.ACTIVE,
+                "fragile",
+            ),
+        )
+        back = mapper.map(b, OrderA)
+        self.assertEqual((back.id, back.created, back.total, back.status), (ORDER_ID, a.created, "10.50", "active"))
+
+    def test_enum_values(self):
+        mapper = Mapper()
+
+        self.assertEqual(mapper.map(Level.HIGH, int), 2)
+        self.assertEqual(mapper.map(Level.HIGH, str), "2")
+        self.assertEqual(mapper.map(1, Level), Level.LOW)
+        self.assertEqual(mapper.map(Status.BLOCKED, str), "blocked")
+
+    def test_enum_members_which_are_instances_of_target_are_kept(self):
+        mapper = Mapper()
+        mapper.mapping(AnyHolderA, ObjectHolderB).map_matching().register()
+
+        self.assertIs(mapper.map(AnyHolderA(Status.ACTIVE), ObjectHolderB).value, Status.ACTIVE)
+        self.assertIs(mapper.map(Priority.LOW, int), Priority.LOW)
+        self.assertIs(mapper.map(Mode.FAST, str), Mode.FAST)
+
+    def test_bool_is_not_converted_with_int_converters(self):
+        mapper = Mapper()
+
+        self.assertIs(mapper.map(True, int), True)
+        for b in (str, float):
+            with self.subTest(b=b), self.assertRaises(MissingMappingException):
+                mapper.map(True, b)
+
+    def test_registered_converter_is_used_for_subclasses(self):
+        class Timestamp(str):
+            pass
+
+        mapper = Mapper()
+        mapper.register_primitive_converter(str, datetime, lambda s: datetime.strptime(s, "%d.%m.%Y"))
+
+        self.assertEqual(mapper.map(Timestamp("01.03.2024"), datetime), datetime(2024, 3, 1))
+        self.assertEqual(Mapper().map("2024-03-01", datetime), datetime(2024, 3, 1))
+
+    def test_registered_converter_is_used_for_collection_items(self):
+        mapper = Mapper()
+
+        self.assertEqual(mapper.map([" a "], List[str]), [" a "])
+
+        mapper.register_primitive_converter(str, str, str.strip)
+
+        self.assertEqual(mapper.map([" a ", "b "], List[str]), ["a", "b"])
+        self.assertEqual(mapper.map({" k ": " v "}, Dict[str, str]), {"k": "v"})
+
+    def test_registered_converter_drops_cached_results(self):
+        mapper = Mapper()
+        mapper.mapping(FrozenEventA, FrozenEventB).map_matching().l_to_r_cached().register()
+        a = FrozenEventA("01.03.2024")
+        mapper.register_primitive_converter(str, datetime, lambda s: datetime.strptime(s, "%d.%m.%Y"))
+        self.assertEqual(mapper.map(a, FrozenEventB), FrozenEventB(datetime(2024, 3, 1)))
+
+        mapper.register_primitive_converter(str, datetime, lambda s: datetime.strptime(s, "%m.%d.%Y"))
+
+        self.assertEqual(mapper.map(a, FrozenEventB), FrozenEventB(datetime(2024, 1, 3)))
+
+    def test_generated_source_uses_stdlib_converters(self):
+        mapper = Mapper()
+        mapper.mapping(EventA, EventB).map_matching().register()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "generated_mappers.py")
+            mapper.generate_source(path)
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+            spec = importlib.util.spec_from_file_location("generated_mappers", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+        self.assertIn("datetime.fromisoformat", source)
+        self.assertEqual(module.map_object(EventA("2024-03-01"), EventB), EventB(datetime(2024, 3, 1)))
@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List, TypedDict
+from unittest import TestCase
+
+from panamap import Mapper, MissingMappingException
+
+
+class ActorDict(TypedDict):
+    name: str
+    born: str
+
+
+class MovieDict(TypedDict, total=False):
+    title: str
+    year: int
+    actors: List[ActorDict]
+
+
+@dataclass
+class Actor:
+    name: str
+    born: date
+
+
+@dataclass
+class Movie:
+    title: str
+    year: int = 0
+    actors: List[Actor] = None
+
+
+class TestMapTypedDict(TestCase):
+    def setUp(self):
+        self.mapper = Mapper()
+        self.mapper.mapping(MovieDict, Movie).map_matching().register()
+        self.mapper.mapping(ActorDict, Actor).map_matching().register()
+
+    def test_map_from_typed_dict(self):
+        payload = {"title": "Alien", "year": "1979", "actors": [{"name": "Sigourney Weaver", "born": "1949-10-08"}]}
+
+        movie = self.mapper.map(payload, Movie)
+
+        self.assertEqual(movie, Movie("Alien", 1979, [Actor("Sigourney Weaver", date(1949, 10, 8))]))
+
+    def test_map_to_typed_dict(self):
+        movie = Movie("Alien", 1979, [Actor("Sigourney Weaver", date(1949, 10, 8))])
+
+        payload = self.mapper.map(movie, MovieDict)
+
+        self.assertEqual(
+            payload, {"title": "Alien", "year": 1979, "actors": [{"name": "Sigourney Weaver", "born": "1949-10-08"}]}
+        )
+        self.assertIs(type(payload), dict)
+
+    def test_optional_keys_are_omitted(self):
+        self.assertEqual(self.mapper.map(Movie("Alien"), MovieDict), {"title": "Alien", "year": 0})
+
+    def test_map_matching_ignore_case(self):
+        @dataclass
+        class ActorView:
+            Name: str
+            Born: date
+
+        mapper = Mapper()
+        mapper.mapping(ActorDict, ActorView).map_matching(ignore_case=True).register()
+
+        self.assertEqual(
+            mapper.map({"name": "Ian Holm", "born": "1931-09-12"}, ActorView), ActorView("Ian Holm", date(1931, 9, 12))
+        )
+
+    def test_ambiguous_typed_dict_source(self):
+        class OtherMovieDict(TypedDict):
+            title: str
+
+        self.mapper.mapping(OtherMovieDict, Movie).map_matching().register()
+
+        with self.assertRaises(MissingMappingException):
+            self.mapper.map({"title": "Alien"}, Movie)
+
+    def test_deferred_typed_dict_mapping(self):
+        mapper = Mapper(deferred=True)
+        mapper.mapping(MovieDict, Movie).map_matching().register()
+        mapper.mapping(ActorDict, Actor).map_matching().register()
+
+        movie = mapper.map({"title": "Alien", "actors": [{"name": "Ian Holm", "born": "1931-09-12"}]}, Movie)
+
+        self.assertEqual(movie, Movie("Alien", 0, [Actor("Ian Holm", date(1931, 9, 12))]))
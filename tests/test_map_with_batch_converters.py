@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import List
+from unittest import TestCase
+
+from panamap import Mapper, FieldMappingException, ImproperlyConfiguredException
+
+
+class UserStore:
+    def __init__(self):
+        self.users = {1: "alice", 2: "bob", 3: "carol"}
+        self.calls = []
+
+    def load_names(self, ids: List[int]) -> List[str]:
+        self.calls.append(list(ids))
+        return [self.users[i] for i in ids]
+
+
+@dataclass
+class CommentA:
+    text: str
+    author_id: int
+
+
+@dataclass
+class CommentB:
+    text: str
+    author: str
+
+
+@dataclass
+class PostA:
+    comments: List[CommentA]
+
+
+@dataclass
+class PostB:
+    comments: List[CommentB]
+
+
+class TestMapWithBatchConverters(TestCase):
+    def setUp(self):
+        self.store = UserStore()
+        self.mapper = Mapper()
+        self.mapper.mapping(CommentA, CommentB).l_to_r("text", "text").l_to_r(
+            "author_id", "author", batch_converter=self.store.load_names
+        ).register()
+        self.mapper.mapping(PostA, PostB).map_matching().register()
+
+    def test_list_items_are_converted_in_one_batch(self):
+        post = PostA([CommentA("a", 1), CommentA("b", 2), CommentA("c", 1)])
+
+        b = self.mapper.map(post, PostB)
+
+        self.assertEqual([c.author for c in b.comments], ["alice", "bob", "alice"])
+        self.assertEqual(self.store.calls, [[1, 2, 1]])
+
+    def test_map_many(self):
+        comments = self.mapper.map_many([CommentA("a", 3), CommentA("b", 2)], CommentB)
+
+        self.assertEqual(comments, [CommentB("a", "carol"), CommentB("b", "bob")])
+        self.assertEqual(self.store.calls, [[3, 2]])
+
+    def test_single_object_is_converted_as_batch_of_one(self):
+        self.assertEqual(self.mapper.map(CommentA("a", 2), CommentB), CommentB("a", "bob"))
+        self.assertEqual(self.store.calls, [[2]])
+
+    def test_batch_error_contains_field(self):
+        with self.assertRaises(FieldMappingException) as cm:
+            self.mapper.map_many([CommentA("a", 4)], CommentB)
+        self.assertIn("author_id", str(cm.exception))
+
+    def test_converter_and_batch_converter_are_exclusive(self):
+        with self.assertRaises(ImproperlyConfiguredException):
+            Mapper().mapping(CommentA, CommentB).l_to_r(
+                "author_id", "author", converter=str, batch_converter=self.store.load_names
+            )
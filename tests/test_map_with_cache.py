@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from enum import Enum
+from unittest import TestCase
+
+from panamap import Mapper, values_map
+
+
+class CurrencyA(Enum):
+    USD = "usd"
+    EUR = "eur"
+
+
+class CurrencyB(Enum):
+    USD = 1
+    EUR = 2
+
+
+@dataclass(frozen=True)
+class ConfigA:
+    name: str
+
+
+@dataclass(frozen=True)
+class ConfigB:
+    name: str
+
+
+@dataclass
+class LocalizedB:
+    name: str
+
+
+class TestMapWithCache(TestCase):
+    def test_cached_converter(self):
+        mapper = Mapper()
+        mapper.mapping(CurrencyA, CurrencyB).l_to_r_converter(
+            values_map({CurrencyA.USD: CurrencyB.USD, CurrencyA.EUR: CurrencyB.EUR})
+        ).l_to_r_cached().register()
+
+        self.assertEqual(mapper.map(CurrencyA.USD, CurrencyB), CurrencyB.USD)
+        self.assertEqual(mapper.map(CurrencyA.USD, CurrencyB), CurrencyB.USD)
+        self.assertEqual(mapper.map(CurrencyA.EUR, CurrencyB), CurrencyB.EUR)
+
+        info = mapper.cache_info(CurrencyA, CurrencyB)
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.currsize, 2)
+
+    def test_cache_key_includes_source_class(self):
+        mapper = Mapper()
+        mapper.mapping(int, ConfigB).l_to_r_converter(lambda value: ConfigB(repr(value))).l_to_r_cached().register()
+
+        self.assertEqual(mapper.map(1, ConfigB), ConfigB("1"))
+        self.assertEqual(mapper.map(True, ConfigB), ConfigB("True"))
+
+    def test_cached_map_rules_return_same_object(self):
+        mapper = Mapper()
+        mapper.mapping(ConfigA, ConfigB).map_matching().cached().register()
+
+        first = mapper.map(ConfigA("cfg"), ConfigB)
+        second = mapper.map(ConfigA("cfg"), ConfigB)
+
+        self.assertEqual(first, ConfigB("cfg"))
+        self.assertIs(first, second)
+        self.assertIsNone(mapper.cache_info(ConfigB, dict))
+
+    def test_lru_eviction(self):
+        mapper = Mapper()
+        mapper.mapping(ConfigA, ConfigB).map_matching().l_to_r_cached(maxsize=1).register()
+
+        first = mapper.map(ConfigA("first"), ConfigB)
+        mapper.map(ConfigA("second"), ConfigB)
+
+        self.assertIsNot(first, mapper.map(ConfigA("first"), ConfigB))
+        self.assertEqual(mapper.cache_info(ConfigA, ConfigB).currsize, 1)
+
+    def test_cache_key_includes_context_keys(self):
+        mapper = Mapper()
+        mapper.mapping(ConfigA, LocalizedB).l_to_r_converter(
+            lambda a, ctx: LocalizedB(f"{a.name}-{ctx['lang']}")
+        ).l_to_r_cached(context_keys=["lang"]).register()
+
+        self.assertEqual(mapper.map(ConfigA("cfg"), LocalizedB, {"lang": "en"}).name, "cfg-en")
+        self.assertEqual(mapper.map(ConfigA("cfg"), LocalizedB, {"lang": "de"}).name, "cfg-de")
+
+    def test_cache_invalidated_on_register(self):
+        mapper = Mapper()
+        mapper.mapping(ConfigA, ConfigB).map_matching().cached().register()
+        mapper.map(ConfigA("cfg"), ConfigB)
+
+        mapper.mapping(CurrencyA, CurrencyB).l_to_r_converter(lambda c: CurrencyB[c.name]).register()
+
+        self.assertEqual(mapper.cache_info(ConfigA, ConfigB).currsize, 0)
@@ -0,0 +1,112 @@
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+from unittest import TestCase
+
+from panamap import Mapper, FieldMappingException
+
+
+@dataclass
+class ImageA:
+    url: str
+
+
+@dataclass
+class ImageB:
+    content: str
+
+
+@dataclass
+class GalleryA:
+    images: List[ImageA]
+
+
+@dataclass
+class GalleryB:
+    images: List[ImageB]
+
+
+@dataclass
+class PhotoA:
+    url: str
+    thumbnail_url: str
+
+
+@dataclass
+class PhotoB:
+    content: str
+    thumbnail: Optional[str] = None
+
+
+class TestMapWithExecutor(TestCase):
+    def test_blocking_converters_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+        threads = set()
+
+        def download(url: str) -> str:
+            threads.add(threading.get_ident())
+            barrier.wait()
+            return f"content of {url}"
+
+        mapper = Mapper()
+        mapper.mapping(ImageA, ImageB).l_to_r("url", "content", download, blocking=True).register()
+        mapper.mapping(GalleryA, GalleryB).map_matching().register()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            b = mapper.map(GalleryA([ImageA("a"), ImageA("b"), ImageA("c")]), GalleryB, executor=executor)
+
+        self.assertEqual([i.content for i in b.images], ["content of a", "content of b", "content of c"])
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_blocking_converter_error_keeps_fields_chain(self):
+        def download(url: str) -> str:
+            raise IOError(url)
+
+        mapper = Mapper()
+        mapper.mapping(ImageA, ImageB).l_to_r("url", "content", download, blocking=True).register()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(FieldMappingException) as cm:
+                mapper.map_many([ImageA("a")], ImageB, executor=executor)
+        self.assertIn("url", str(cm.exception))
+        self.assertIsInstance(cm.exception.__cause__, IOError)
+
+    def test_blocking_converter_without_executor(self):
+        mapper = Mapper()
+        mapper.mapping(ImageA, ImageB).l_to_r("url", "content", str.upper, blocking=True).register()
+
+        self.assertEqual(mapper.map(ImageA("a"), ImageB), ImageB("A"))
+
+    def test_skipped_fields_are_not_submitted(self):
+        calls = []
+
+        def download(url: str) -> str:
+            calls.append(url)
+            return f"content of {url}"
+
+        mapper = Mapper()
+        mapper.mapping(PhotoA, PhotoB).l_to_r("url", "content", download, blocking=True).l_to_r(
+            "thumbnail_url", "thumbnail", download, blocking=True
+        ).register()
+        photos = [PhotoA("a", "small a"), PhotoA("b", "small b")]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            b = mapper.map(photos, List[PhotoB], executor=executor, exclude={"thumbnail"})
+            self.assertEqual(sorted(calls), ["a", "b"])
+            self.assertEqual(b[0], PhotoB("content of a"))
+
+            calls.clear()
+            b = mapper.map(photos, List[PhotoB], executor=executor, lazy=True)
+            self.assertEqual(calls, [])
+            self.assertEqual(b[1].thumbnail, "content of small b")
+            self.assertEqual(calls, ["small b"])
+
+    def test_import_does_not_load_concurrent_futures(self):
+        code = "import sys, panamap; print('concurrent.futures' in sys.modules)"
+
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+        self.assertEqual(output.strip(), "False")
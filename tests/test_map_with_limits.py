@@ -0,0 +1,132 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from unittest import TestCase
+
+from panamap import Mapper, MappingLimits, MappingLimitExceededException
+
+
+@dataclass
+class NodeA:
+    value: str
+    children: List["NodeA"]
+
+
+@dataclass
+class NodeB:
+    value: str
+    children: List["NodeB"]
+
+
+@dataclass
+class ChainB:
+    value: str
+    next: Optional["ChainB"] = None
+
+
+@dataclass
+class EventA:
+    meta: Dict[str, Any]
+    payload: Any = None
+
+
+@dataclass
+class EventB:
+    meta: Dict[str, Any]
+    payload: Any = None
+
+
+def chain(length: int) -> dict:
+    head = None
+    for i in range(length):
+        head = {"value": str(i), "next": head}
+    return head
+
+
+class TestMapWithLimits(TestCase):
+    def setUp(self):
+        self.mapper = Mapper()
+        self.mapper.mapping(NodeA, NodeB).map_matching().register()
+        self.mapper.mapping(dict, ChainB).map_matching().register()
+        self.mapper.mapping(EventA, EventB).map_matching().register()
+
+    def test_max_elements(self):
+        a = NodeA("root", [NodeA(str(i), []) for i in range(10)])
+
+        self.assertEqual(len(self.mapper.map(a, NodeB, limits=MappingLimits(max_elements=21)).children), 10)
+        with self.assertRaises(MappingLimitExceededException) as cm:
+            self.mapper.map(a, NodeB, limits=MappingLimits(max_elements=20))
+        self.assertIn("children", str(cm.exception))
+
+    def test_max_depth(self):
+        self.assertEqual(self.mapper.map(chain(5), ChainB, limits=MappingLimits(max_depth=4)).value, "4")
+        with self.assertRaises(MappingLimitExceededException):
+            self.mapper.map(chain(100), ChainB, limits=MappingLimits(max_depth=4))
+
+    def test_max_size(self):
+        limits = MappingLimits(max_size=3)
+
+        self.assertEqual(self.mapper.map(NodeA("abc", []), NodeB, limits=limits), NodeB("abc", []))
+        with self.assertRaises(MappingLimitExceededException):
+            self.mapper.map(NodeA("abcd", []), NodeB, limits=limits)
+        with self.assertRaises(MappingLimitExceededException):
+            self.mapper.map(["a", "abcd"], List[str], limits=limits)
+
+    def test_limits_of_values_copied_as_is(self):
+        limits = MappingLimits(max_depth=10, max_elements=1000, max_size=3)
+        deep: Dict[str, Any] = {}
+        for _ in range(5000):
+            deep = {"next": deep}
+
+        self.assertEqual(
+            self.mapper.map(EventA({"a": {"b": [1, 2]}}, ["abc"]), EventB, limits=limits),
+            EventB({"a": {"b": [1, 2]}}, ["abc"]),
+        )
+        for a in (EventA({"meta": deep}), EventA({}, list(range(100_000))), EventA({}, [{"x": "abcd"}])):
+            with self.assertRaises(MappingLimitExceededException):
+                self.mapper.map(a, EventB, limits=limits)
+
+    def test_max_depth_of_nested_collections(self):
+        nested: List[Any] = []
+        for _ in range(20):
+            nested = [nested]
+
+        typed = {"a": {"b": {"c": {"d": 1}}}}
+        typed_b = Dict[str, Dict[str, Dict[str, Dict[str, int]]]]
+
+        with self.assertRaises(MappingLimitExceededException):
+            self.mapper.map(nested, List[List[Any]], limits=MappingLimits(max_depth=10))
+        self.assertEqual(self.mapper.map(typed, typed_b, limits=MappingLimits(max_depth=3)), typed)
+        with self.assertRaises(MappingLimitExceededException):
+            self.mapper.map(typed, typed_b, limits=MappingLimits(max_depth=2))
+
+    def test_timeout(self):
+        with self.assertRaises(MappingLimitExceededException) as cm:
+            self.mapper.map(NodeA("root", [NodeA("a", [])]), NodeB, limits=MappingLimits(timeout=-1))
+        self.assertIn("timeout", str(cm.exception))
+
+    def test_mapper_limits_are_used_by_default(self):
+        mapper = Mapper(limits=MappingLimits(max_elements=1))
+        mapper.mapping(NodeA, NodeB).map_matching().register()
+        a = NodeA("root", [NodeA("child", [])])
+
+        with self.assertRaises(MappingLimitExceededException):
+            mapper.map(a, NodeB)
+        self.assertEqual(len(mapper.map(a, NodeB, limits=MappingLimits()).children), 1)
+
+    def test_lazy_fields_are_not_limited_by_timeout_of_call(self):
+        b = self.mapper.map(NodeA("root", [NodeA("a", [])]), NodeB, lazy=True, limits=MappingLimits(timeout=0.01))
+        time.sleep(0.02)
+
+        self.assertEqual(b.children, [NodeB("a", [])])
+
+    def test_map_into_uses_mapper_limits(self):
+        mapper = Mapper(limits=MappingLimits(max_elements=2))
+        mapper.mapping(NodeA, NodeB).map_matching().register()
+        a = NodeA("root", [NodeA("a", []), NodeA("b", [])])
+
+        with self.assertRaises(MappingLimitExceededException):
+            mapper.map_into(a, NodeB("", []))
+        self.assertEqual(
+            mapper.map_into(a, NodeB("", []), limits=MappingLimits()), NodeB("root", [NodeB("a", []), NodeB("b", [])])
+        )
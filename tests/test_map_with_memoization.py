@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from unittest import TestCase
+
+from panamap import Mapper, FieldMappingException
+
+
+@dataclass
+class VendorA:
+    name: str
+
+
+@dataclass
+class ItemA:
+    vendor: VendorA
+
+
+@dataclass
+class CatalogA:
+    items: List[ItemA]
+
+
+@dataclass
+class VendorB:
+    name: str
+
+
+@dataclass
+class ItemB:
+    vendor: VendorB
+
+
+@dataclass
+class CatalogB:
+    items: List[ItemB]
+
+
+@dataclass
+class NodeA:
+    value: str
+    next: Optional["NodeA"] = None
+
+
+@dataclass
+class NodeB:
+    value: str
+    next: Optional["NodeB"] = None
+
+
+@dataclass
+class GraphNodeA:
+    name: str
+    neighbors: List["GraphNodeA"]
+    by_name: Dict[str, "GraphNodeA"]
+
+
+@dataclass
+class GraphNodeB:
+    name: str
+    neighbors: List["GraphNodeB"]
+    by_name: Dict[str, "GraphNodeB"]
+
+
+@dataclass
+class TupleNodeA:
+    neighbors: Tuple["TupleNodeA", ...]
+
+
+@dataclass
+class TupleNodeB:
+    neighbors: Tuple["TupleNodeB", ...]
+
+
+class TestMapWithMemoization(TestCase):
+    def setUp(self):
+        self.mapper = Mapper()
+        self.mapper.mapping(CatalogA, CatalogB).map_matching().register()
+        self.mapper.mapping(ItemA, ItemB).map_matching().register()
+        self.mapper.mapping(VendorA, VendorB).map_matching().register()
+
+    def test_shared_objects_are_copied_without_memoization(self):
+        vendor = VendorA("acme")
+
+        b = self.mapper.map(CatalogA([ItemA(vendor), ItemA(vendor)]), CatalogB)
+
+        self.assertIsNot(b.items[0].vendor, b.items[1].vendor)
+
+    def test_shared_objects_stay_shared_with_memoization(self):
+        vendor = VendorA("acme")
+
+        b = self.mapper.map(CatalogA([ItemA(vendor), ItemA(vendor)]), CatalogB, memoize=True)
+
+        self.assertEqual(b.items[0].vendor, VendorB("acme"))
+        self.assertIs(b.items[0].vendor, b.items[1].vendor)
+
+    def test_map_cycle_through_constructor_args(self):
+        mapper = Mapper()
+        mapper.mapping(NodeA, NodeB).map_matching().register()
+        first = NodeA("first")
+        second = NodeA("second", first)
+        first.next = second
+
+        b = mapper.map(first, NodeB, memoize=True)
+
+        self.assertEqual(b.value, "first")
+        self.assertEqual(b.next.value, "second")
+        self.assertIs(b.next.next, b)
+
+    def test_map_cycle_through_list_items_and_dict_values(self):
+        mapper = Mapper()
+        mapper.mapping(GraphNodeA, GraphNodeB).map_matching().register()
+        first = GraphNodeA("first", [], {})
+        second = GraphNodeA("second", [first], {"first": first})
+        first.neighbors.append(second)
+        first.by_name["self"] = first
+
+        for iterative in (False, True):
+            with self.subTest(iterative=iterative):
+                b = mapper.map(first, GraphNodeB, memoize=True, iterative=iterative)
+
+                self.assertEqual(b.neighbors[0].name, "second")
+                self.assertIs(b.neighbors[0].neighbors[0], b)
+                self.assertIs(b.neighbors[0].by_name["first"], b)
+                self.assertIs(b.by_name["self"], b)
+
+    def test_map_cycle_through_tuple_items_is_not_supported(self):
+        mapper = Mapper()
+        mapper.mapping(TupleNodeA, TupleNodeB).map_matching().register()
+        first = TupleNodeA(())
+        first.neighbors = (TupleNodeA((first,)),)
+
+        with self.assertRaises(FieldMappingException):
+            mapper.map(first, TupleNodeB, memoize=True)
@@ -0,0 +1,119 @@
+import gc
+from dataclasses import dataclass, make_dataclass
+from typing import List
+from unittest import TestCase
+
+from panamap import Mapper, MissingMappingException
+from panamap.panamap import FieldMapRule
+
+
+@dataclass
+class A:
+    value: str
+    values: List[str]
+
+
+@dataclass
+class B:
+    value: str
+    values: List[str]
+
+
+@dataclass(frozen=True)
+class InnerA:
+    value: str
+
+
+@dataclass(frozen=True)
+class InnerB:
+    value: str
+
+
+@dataclass(frozen=True)
+class OuterA:
+    inner: InnerA
+
+
+@dataclass(frozen=True)
+class OuterB:
+    inner: InnerB
+
+
+class TestMapperMemory(TestCase):
+    def test_rules_have_no_instance_dict(self):
+        mapper = Mapper()
+        mapper.mapping(A, B).map_matching().register()
+
+        rule = mapper.map_rules[A][B][0]
+
+        self.assertIsInstance(rule, FieldMapRule)
+        self.assertFalse(hasattr(rule, "__dict__"))
+        self.assertFalse(hasattr(rule.from_field, "__dict__"))
+
+    def test_field_descriptors_are_shared(self):
+        mapper = Mapper()
+        mapper.mapping(A, B).map_matching().register()
+        mapper.mapping(A, dict).map_matching().register()
+
+        report = mapper.memory_report()
+
+        self.assertEqual(report.pairs, 4)
+        self.assertEqual(report.rules, 8)
+        self.assertEqual(report.field_descriptors, 6)
+        self.assertIs(mapper.map_rules[A][B][0].from_field, mapper.map_rules[B][A][0].to_field)
+        self.assertGreater(report.size, 0)
+
+    def test_unregister(self):
+        mapper = Mapper()
+        mapper.mapping(A, B).map_matching().register()
+
+        mapper.unregister(A, B)
+
+        with self.assertRaises(MissingMappingException):
+            mapper.map(A("a", []), B)
+        self.assertEqual(mapper.map(B("b", ["c"]), A), A("b", ["c"]))
+        with self.assertRaises(MissingMappingException):
+            mapper.unregister(A, B)
+
+    def test_unregister_drops_cached_results(self):
+        mapper = Mapper()
+        mapper.mapping(OuterA, OuterB).map_matching().l_to_r_cached().register()
+        mapper.mapping(InnerA, InnerB).map_matching().register()
+        a = OuterA(InnerA("a"))
+        mapper.map(a, OuterB)
+
+        mapper.unregister(InnerA, InnerB)
+
+        self.assertEqual(mapper.cache_info(OuterA, OuterB).currsize, 0)
+        with self.assertRaises(MissingMappingException):
+            mapper.map(a, OuterB)
+
+    def test_weak_types_are_collected(self):
+        mapper = Mapper(weak_types=True)
+        mapper.mapping(A, B).map_matching().register()
+        Dynamic = make_dataclass("Dynamic", [("value", str), ("values", List[str])])
+        mapper.mapping(A, Dynamic).map_matching().l_to_r_cached().register()
+        self.assertEqual(mapper.map(A("a", ["b"]), Dynamic).values, ["b"])
+
+        del Dynamic
+        gc.collect()
+
+        report = mapper.memory_report()
+        self.assertEqual(report.pairs, 2)
+        self.assertEqual(report.types, 2)
+        self.assertEqual(mapper.map(A("a", ["b"]), B), B("a", ["b"]))
+
+    def test_cached_results_do_not_keep_weak_source_types(self):
+        mapper = Mapper(weak_types=True)
+        Dynamic = make_dataclass("Dynamic", [("value", str)], frozen=True)
+        mapper.mapping(Dynamic, InnerB).map_matching().l_to_r_cached().register()
+        a = Dynamic("a")
+        self.assertIs(mapper.map(a, InnerB), mapper.map(Dynamic("a"), InnerB))
+        self.assertEqual(mapper.cache_info(Dynamic, InnerB).currsize, 1)
+
+        del a, Dynamic
+        gc.collect()
+
+        report = mapper.memory_report()
+        self.assertEqual(report.pairs, 0)
+        self.assertEqual(report.cached_results, 0)
@@ -0,0 +1,60 @@
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+from unittest import TestCase
+
+from panamap import Mapper
+from panamap.struct_records import StructRecordMappingDescriptor, iter_file_records, iter_records, struct_record
+
+Event = struct_record("Event", "<I2xd8s", ["id", "value", "name"])
+Aligned = struct_record("Aligned", "@b3i", ["flag", "x", "y", "z"])
+
+
+@dataclass
+class EventModel:
+    id: int
+    value: float
+    name: bytes
+
+
+class TestStructRecords(TestCase):
+    def test_fields_layout(self):
+        buffer = struct.pack("@b3i", 1, 2, 3, 4)
+        record = Aligned(buffer)
+
+        self.assertEqual((record.flag, record.x, record.y, record.z), (1, 2, 3, 4))
+        self.assertEqual(Aligned.FIELDS["x"][1], struct.calcsize("@b0i"))
+
+    def test_map_records_from_buffer(self):
+        mapper = Mapper(custom_descriptors=[StructRecordMappingDescriptor])
+        mapper.mapping(Event, EventModel).map_matching().register()
+        buffer = struct.pack("<I2xd8s", 1, 0.5, b"first") + struct.pack("<I2xd8s", 2, 1.5, b"second")
+
+        models = list(mapper.imap(iter_records(Event, buffer), EventModel))
+
+        self.assertEqual(
+            models,
+            [EventModel(1, 0.5, b"first\x00\x00\x00"), EventModel(2, 1.5, b"second\x00\x00")],
+        )
+
+    def test_map_to_record(self):
+        mapper = Mapper(custom_descriptors=[StructRecordMappingDescriptor])
+        mapper.mapping(Event, EventModel).map_matching().register()
+
+        record = mapper.map(EventModel(7, 2.5, b"abc"), Event)
+
+        self.assertEqual(bytes(record.buffer), struct.pack("<I2xd8s", 7, 2.5, b"abc"))
+
+    def test_map_file_records(self):
+        mapper = Mapper(custom_descriptors=[StructRecordMappingDescriptor])
+        mapper.mapping(Event, EventModel).map_matching().register()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.bin")
+            with open(path, "wb") as f:
+                for i in range(3):
+                    f.write(struct.pack("<I2xd8s", i, float(i), b"e"))
+
+            ids = [model.id for model in mapper.imap(iter_file_records(Event, path), EventModel)]
+
+        self.assertEqual(ids, [0, 1, 2])
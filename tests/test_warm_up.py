@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import List, Optional, Union
+from unittest import TestCase
+
+from panamap import Mapper, MappingValidationException
+
+
+@dataclass
+class NestedA:
+    value: str
+
+
+@dataclass
+class OtherA:
+    value: int
+
+
+@dataclass
+class A:
+    nested: NestedA
+    items: List[NestedA]
+    other: Optional[OtherA]
+    ref: "MissingRefA"  # noqa: F821
+
+
+@dataclass
+class NestedB:
+    value: str
+
+
+@dataclass
+class OtherB:
+    value: int
+
+
+@dataclass
+class B:
+    nested: NestedB
+    items: List[NestedB]
+    other: Union[OtherB, NestedB, None]
+    ref: int
+
+
+class TestWarmUp(TestCase):
+    def test_warm_up_valid_mapper(self):
+        mapper = Mapper(deferred=True)
+        mapper.mapping(NestedA, NestedB).map_matching().register()
+        mapper.mapping(OtherA, OtherB).map_matching().register()
+
+        mapper.warm_up()
+
+        self.assertEqual(mapper.deferred_flows, {})
+        self.assertIn(NestedB, mapper.map_rules[NestedA])
+
+    def test_warm_up_caches_dispatch(self):
+        @dataclass
+        class ValidA:
+            nested: NestedA
+            items: List[NestedA]
+            other: Optional[OtherA]
+
+        @dataclass
+        class ValidB:
+            nested: NestedB
+            items: List[NestedB]
+            other: Union[OtherB, NestedB, None]
+
+        mapper = Mapper()
+        mapper.mapping(ValidA, ValidB).l_to_r("nested", "nested").l_to_r("items", "items").l_to_r(
+            "other", "other"
+        ).register()
+        mapper.mapping(NestedA, NestedB).map_matching().register()
+        mapper.mapping(OtherA, OtherB).map_matching().register()
+
+        mapper.warm_up()
+
+        self.assertEqual(mapper.dispatch_cache[(ValidA, ValidB)][0], ValidA)
+        self.assertEqual(mapper.dispatch_cache[(NestedA, NestedB)][0], NestedA)
+        self.assertIn((list, List[NestedB]), mapper.dispatch_cache)
+        self.assertEqual(mapper.dispatch_cache[(OtherA, ValidB.__annotations__["other"])][0], OtherA)
+
+    def test_warm_up_reports_all_problems(self):
+        mapper = Mapper(deferred=True)
+        mapper.mapping(A, B).map_matching().register()
+
+        with self.assertRaises(MappingValidationException) as cm:
+            mapper.warm_up()
+
+        errors = cm.exception.errors
+        self.assertEqual(len(errors), 8, errors)
+        self.assertTrue(any("'nested' of type 'NestedA' to field 'nested' of type 'NestedB'" in e for e in errors))
+        self.assertTrue(any("Unknown forward reference 'MissingRefA'" in e for e in errors))
+        self.assertTrue(any("Not found matching class in union" in e for e in errors))